@@ -0,0 +1,310 @@
+"""
+Shared async engine for the ESPN roster scrapers
+
+Each league script (mlb.py, nfl.py, nba.py, nhl.py, wnba.py, mls.py) is a small
+LeaguePlugin that only knows how to find roster links on its teams page and how
+to parse one roster page. The engine fetches every roster page concurrently over
+one pooled client, caps requests per host, parses with lxml when it is installed
+and writes each team's JSON file.
+
+Usage:
+    python roster_engine.py                  # all leagues
+    python roster_engine.py nfl nhl          # selected leagues
+    python roster_engine.py --output ./out --per-host 4
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import random
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+LEAGUES = ("mlb", "nfl", "nba", "nhl", "wnba", "mls")
+BASE_URL = "https://www.espn.com"
+
+# Output goes next to this script (players/<league>/...) unless overridden
+DEFAULT_OUTPUT_DIR = os.getenv("ROSTER_OUTPUT_DIR", os.path.dirname(os.path.abspath(__file__)))
+
+PER_HOST_LIMIT = int(os.getenv("ROSTER_PER_HOST_LIMIT", "6"))
+REQUEST_TIMEOUT = float(os.getenv("ROSTER_REQUEST_TIMEOUT", "20"))
+MAX_RETRIES = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def text_of(cells: List[Any], index: int, default: str = "N/A") -> str:
+    """Stripped text of cells[index], or default when the cell is missing or empty"""
+    if index < len(cells):
+        text = cells[index].get_text(strip=True)
+        return text if text else default
+    return default
+
+
+def safe_folder_name(team_name: str) -> str:
+    """"Atlanta Dream" -> "atlanta_dream" """
+    return team_name.lower().replace(' ', '_')
+
+
+def roster_links_from_cards(soup: BeautifulSoup, league_path: str) -> Dict[str, str]:
+    """
+    Team name -> roster URL from the team cards on a /<league>/teams page
+
+    Args:
+        soup: Parsed teams page
+        league_path: League segment of the URLs (e.g. "nfl")
+    """
+    team_links = {}
+    link_containers = soup.find_all('a', class_='AnchorLink', href=re.compile(fr'/{league_path}/team/_/name/'))
+    for container in link_containers:
+        roster_link = container.find_next('a', href=re.compile(r'/roster/'))
+        team_name_element = container.find('h2')
+        if roster_link and team_name_element:
+            team_name = team_name_element.text.strip()
+            if team_name not in team_links:
+                team_links[team_name] = BASE_URL + roster_link['href']
+    return team_links
+
+
+def roster_links_from_text(soup: BeautifulSoup) -> Dict[str, str]:
+    """Roster URL -> roster URL for every "Roster" link; the team name comes from the roster page itself"""
+    links = [BASE_URL + a["href"] for a in soup.find_all("a", href=True, string="Roster")]
+    return {url: url for url in links}
+
+
+class LeaguePlugin:
+    """
+    Parsing rules for one league
+
+    Subclasses set league and teams_url and implement team_links and parse_roster.
+    """
+
+    league = ""
+    teams_url = ""
+    json_indent = 4
+
+    def team_links(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """Team name (or other unique key) -> roster page URL"""
+        raise NotImplementedError
+
+    def parse_roster(self, soup: BeautifulSoup, team_name: str, url: str) -> Optional[Any]:
+        """JSON payload for one roster page, or None to skip the team"""
+        raise NotImplementedError
+
+    def output_path(self, output_dir: str, team_name: str, payload: Any) -> str:
+        """Default layout: <output>/<league>/<team_folder>/roster.json"""
+        return os.path.join(output_dir, self.league, safe_folder_name(team_name), "roster.json")
+
+    def to_json(self, payload: Any) -> Any:
+        """What gets written to the team's file"""
+        return payload
+
+    def player_count(self, payload: Any) -> int:
+        return len(payload)
+
+    def finish(self, output_dir: str, saved: Dict[str, Any], teams: Dict[str, str]) -> None:
+        """Hook for league-wide summary files; saved maps team name -> payload, teams every roster link found"""
+
+
+class HostLimiter:
+    """Caps concurrent requests per host, so a multi-league refresh stays polite"""
+
+    def __init__(self, per_host: int = PER_HOST_LIMIT):
+        self.per_host = per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def __call__(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        return self._semaphores[host]
+
+
+async def fetch_html(client: httpx.AsyncClient, limiter: HostLimiter, url: str) -> Optional[str]:
+    """
+    GET url under its host's limit, retrying throttling and 5xx responses with backoff
+
+    Returns:
+        Page HTML, or None if every attempt failed
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            async with limiter(url):
+                response = await client.get(url)
+            if response.status_code < 400:
+                return response.text
+            if response.status_code not in RETRY_STATUSES:
+                print(f"An error occurred while fetching the URL {url}: HTTP {response.status_code}")
+                return None
+            retry_after = response.headers.get("retry-after", "")
+            delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt + random.random()
+            print(f"HTTP {response.status_code} from {url}, retrying in {delay:.1f}s")
+        except httpx.HTTPError as e:
+            if attempt == MAX_RETRIES - 1:
+                print(f"An error occurred while fetching the URL {url}: {e}")
+                return None
+            delay = 2 ** attempt + random.random()
+        await asyncio.sleep(delay)
+    print(f"Giving up on {url} after {MAX_RETRIES} attempts")
+    return None
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def write_json(path: str, payload: Any, indent: int = 4) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=indent)
+
+
+async def scrape_team(
+    plugin: LeaguePlugin,
+    client: httpx.AsyncClient,
+    limiter: HostLimiter,
+    team_name: str,
+    url: str,
+) -> Optional[Any]:
+    html = await fetch_html(client, limiter, url)
+    if html is None:
+        return None
+    # Parsing is CPU-bound; a worker thread keeps the other downloads moving
+    try:
+        return await asyncio.to_thread(lambda: plugin.parse_roster(parse_html(html), team_name, url))
+    except Exception as e:
+        print(f"An unexpected error occurred while processing {url}: {e}")
+        return None
+
+
+async def scrape_league(
+    plugin: LeaguePlugin,
+    client: httpx.AsyncClient,
+    limiter: HostLimiter,
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+) -> Dict[str, Any]:
+    """
+    Scrape every roster of one league and write its JSON files
+
+    Returns:
+        Team name -> saved payload
+    """
+    print(f"Finding all team roster links from: {plugin.teams_url}")
+    html = await fetch_html(client, limiter, plugin.teams_url)
+    if html is None:
+        print(f"Could not retrieve {plugin.league.upper()} team list.")
+        return {}
+    teams = plugin.team_links(parse_html(html))
+    print(f"Found {len(teams)} {plugin.league.upper()} teams.")
+
+    payloads = await asyncio.gather(*(
+        scrape_team(plugin, client, limiter, team_name, url) for team_name, url in teams.items()
+    ))
+
+    saved: Dict[str, Any] = {}
+    for team_name, payload in zip(teams, payloads):
+        if not payload:
+            print(f"Warning: No players found at {teams[team_name]}.")
+            continue
+        path = plugin.output_path(output_dir, team_name, payload)
+        write_json(path, plugin.to_json(payload), plugin.json_indent)
+        saved[team_name] = payload
+    plugin.finish(output_dir, saved, teams)
+
+    players = sum(plugin.player_count(payload) for payload in saved.values())
+    print(f"✅ {plugin.league.upper()}: {len(saved)}/{len(teams)} teams, {players} players")
+    return saved
+
+
+def new_client(per_host: int = PER_HOST_LIMIT) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=per_host * 2, max_keepalive_connections=per_host * 2),
+    )
+
+
+async def scrape_leagues(
+    plugins: Iterable[LeaguePlugin],
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+    per_host: int = PER_HOST_LIMIT,
+    client: Optional[httpx.AsyncClient] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Scrape several leagues at once over one pooled client
+
+    Args:
+        plugins: League plugins to run
+        output_dir: Root folder; each league writes under <output_dir>/<league>
+        per_host: Concurrent requests allowed per host
+        client: Client to use instead of a new pooled one (closed by the caller)
+
+    Returns:
+        League -> {team name -> saved payload}
+    """
+    limiter = HostLimiter(per_host)
+    own_client = client is None
+    client = client or new_client(per_host)
+    try:
+        plugins = list(plugins)
+        results = await asyncio.gather(*(scrape_league(p, client, limiter, output_dir) for p in plugins))
+    finally:
+        if own_client:
+            await client.aclose()
+    return {plugin.league: saved for plugin, saved in zip(plugins, results)}
+
+
+def load_plugin(league: str) -> LeaguePlugin:
+    """The PLUGIN defined by the league's script (e.g. nfl.py)"""
+    return importlib.import_module(league).PLUGIN
+
+
+def add_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_DIR, help="Root output folder")
+    parser.add_argument("--per-host", type=int, default=PER_HOST_LIMIT, help="Concurrent requests per host")
+
+
+def scrape_and_report(plugins: List[LeaguePlugin], args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    results = asyncio.run(scrape_leagues(plugins, args.output, args.per_host))
+    teams = sum(len(saved) for saved in results.values())
+    print(f"\n--- {teams} teams across {len(results)} league(s) in {time.perf_counter() - started:.1f}s (parser: {HTML_PARSER}) ---")
+
+
+def run(plugin: LeaguePlugin) -> None:
+    """Command line entry point of a single league script"""
+    parser = argparse.ArgumentParser(description=f"Scrape ESPN {plugin.league.upper()} rosters")
+    add_options(parser)
+    scrape_and_report([plugin], parser.parse_args())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("leagues", nargs="*", help=f"Any of {', '.join(LEAGUES)} (default: all)")
+    add_options(parser)
+    args = parser.parse_args()
+    unknown = sorted(set(args.leagues) - set(LEAGUES))
+    if unknown:
+        parser.error(f"unknown league(s): {', '.join(unknown)}")
+    scrape_and_report([load_plugin(league) for league in args.leagues or LEAGUES], args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Single-pass extractor for expert / chief analyst text.
+
+One precompiled tokenizer walks the text once. Every extraction rule
+(e.g. "away ... probability ... NN%") is a sequence of token kinds advanced
+in that same pass, so probability, confidence, unit size, risk level and
+section boundaries all come out of a single scan instead of a handful of
+re.search calls that each rescan (and backtrack over) the text.
+
+Rules keep the semantics of the regexes they replace: steps must appear in
+order on the same line and matching is case-insensitive. The first line on
+which a rule completes wins, and the captured value is the first qualifying
+number after the preceding steps. Two deliberate differences:
+  * percentages keep their decimals ("58.0%" is 58.0, not 0)
+  * keywords match at the start of a word ("chances", "highly") but no
+    longer inside unrelated words ("allowed" is not "low")
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+KEYWORDS = (
+    "probability", "chance", "confidence", "confident", "estimate", "away", "risk",
+    "low", "medium", "high"
+)
+LEVELS = frozenset({"low", "medium", "high"})
+
+# Findall yields plain strings: a header, a number (with a same-line % or unit), a
+# line break that carries the unit of the number just before it, a word or a newline.
+# Line breaks always stay out of number tokens, so line-scoped rules never span lines.
+TOKEN_RE = re.compile(
+    r"\*\*[A-Z][A-Z &/'-]*[A-Z]:?\*\*:?|\[[A-Z][A-Z ]*[A-Z]\]"
+    r"|\d+(?:\.\d+)?(?:%|(?i:[^\S\n]*unit))?"
+    r"|(?<=\d)[^\S\n]*\n(?i:\s*unit)"
+    r"|[A-Za-z]+"
+    r"|\n"
+)
+HEADER_TITLE_RE = re.compile(r"[A-Z][A-Z &/'-]*[A-Z]")
+NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# Token kinds a rule step can capture
+VALUE_KINDS = frozenset({"num", "pct", "unit", "level"})
+
+# name -> steps; "a|b" accepts either kind
+RULES: Tuple[Tuple[str, str], ...] = (
+    # Chief analyst / expert away-team probability
+    ("away_probability", "away probability pct"),
+    ("probability_away", "probability away pct"),
+    ("estimate_away", "estimate pct away"),
+    ("pct_chance_away", "pct chance away"),
+    ("pct_probability_away", "pct probability away"),
+    ("pct_probability", "pct probability"),
+    ("pct_chance_or_probability", "pct chance|probability"),
+    # Stated confidence
+    ("confidence_pct", "confidence pct"),
+    ("pct_confidence", "pct confidence"),
+    ("confident_pct", "confident pct"),
+    # Sizing and risk
+    ("units", "unit"),
+    ("risk_level", "risk level"),
+)
+
+CHIEF_PROBABILITY_RULES = ("away_probability", "probability_away", "pct_probability_away", "pct_chance_or_probability")
+EXPERT_PROBABILITY_RULES = ("away_probability", "probability_away", "estimate_away", "pct_chance_away", "pct_probability")
+CONFIDENCE_RULES = ("confidence_pct", "pct_confidence", "confident_pct")
+
+
+def _compile_rules() -> List[Tuple[str, Tuple[FrozenSet[str], ...], int]]:
+    compiled = []
+    for name, spec in RULES:
+        steps = tuple(frozenset(step.split("|")) for step in spec.split())
+        capture = next(i for i, step in enumerate(steps) if step & VALUE_KINDS)
+        compiled.append((name, steps, capture))
+    return compiled
+
+COMPILED_RULES = _compile_rules()
+
+# kind -> (rule index, step) pairs waiting for it at the start of a line
+INITIAL_EXPECTATIONS: Dict[str, List[Tuple[int, int]]] = {}
+for _index, (_, _steps, _) in enumerate(COMPILED_RULES):
+    for _kind in _steps[0]:
+        INITIAL_EXPECTATIONS.setdefault(_kind, []).append((_index, 0))
+
+# Word -> (kinds, keyword) memo; most analysis words are not keywords and map to None
+MAX_WORD_CACHE = 20000
+_UNSEEN = object()
+_word_cache: Dict[str, Optional[Tuple[Tuple[str, ...], str]]] = {}
+
+
+def _word_kinds(word: str) -> Optional[Tuple[Tuple[str, ...], str]]:
+    try:
+        return _word_cache[word]
+    except KeyError:
+        pass
+    lowered = word.lower()
+    keyword = next((kw for kw in KEYWORDS if lowered.startswith(kw)), None)
+    kinds = None
+    if keyword is not None:
+        kinds = ((keyword, "level") if keyword in LEVELS else (keyword,)), keyword
+    if len(_word_cache) >= MAX_WORD_CACHE:
+        _word_cache.clear()
+    _word_cache[word] = kinds
+    return kinds
+
+
+@dataclass
+class Section:
+    title: str
+    start: int  # offset of the header
+    end: int    # offset of the next header, or len(text)
+
+
+@dataclass
+class Extraction:
+    """Everything pulled out of one analysis text"""
+    captures: Dict[str, str] = field(default_factory=dict)  # rule name -> raw captured text
+    sections: List[Section] = field(default_factory=list)
+
+    def first(self, rules: Iterable[str]) -> Optional[str]:
+        """Raw capture of the first rule (in priority order) that matched"""
+        for rule in rules:
+            if rule in self.captures:
+                return self.captures[rule]
+        return None
+
+    def percent(self, rules: Iterable[str]) -> Optional[float]:
+        """First matching rule's percentage as a fraction"""
+        raw = self.first(rules)
+        return float(raw) / 100.0 if raw is not None else None
+
+    def number(self, rule: str) -> Optional[float]:
+        raw = self.captures.get(rule)
+        return float(raw) if raw is not None else None
+
+    @property
+    def chief_probability(self) -> Optional[float]:
+        return self.percent(CHIEF_PROBABILITY_RULES)
+
+    @property
+    def expert_probability(self) -> Optional[float]:
+        return self.percent(EXPERT_PROBABILITY_RULES)
+
+    @property
+    def confidence(self) -> Optional[float]:
+        return self.percent(CONFIDENCE_RULES)
+
+    @property
+    def unit_size(self) -> Optional[int]:
+        units = self.number("units")
+        return int(units) if units is not None else None
+
+    @property
+    def risk_level(self) -> Optional[str]:
+        level = self.captures.get("risk_level")
+        return level.title() if level is not None else None
+
+    def section(self, title: str, text: str) -> Optional[str]:
+        """Body of the first section with this title (header excluded)"""
+        for section in self.sections:
+            if section.title == title.upper():
+                body = text[section.start:section.end]
+                header = TOKEN_RE.match(body)
+                return body[header.end():].strip() if header else body.strip()
+        return None
+
+
+def extract_analysis(text: str) -> Extraction:
+    """Scan text once and return every rule capture and section boundary"""
+    result = Extraction()
+    captures = result.captures
+    sections = result.sections
+    progress = [0] * len(COMPILED_RULES)
+    pending: List[Optional[str]] = [None] * len(COMPILED_RULES)
+    expecting = {kind: list(waiting) for kind, waiting in INITIAL_EXPECTATIONS.items()}
+    line_dirty = False
+    header_cursor = 0
+    last_number = ""
+
+    def feed(kinds: Tuple[str, ...], raw: str) -> None:
+        advanced = []
+        for kind in kinds:
+            for index, step in expecting.pop(kind, ()):
+                if progress[index] != step:
+                    continue  # already moved on through another kind of the same step
+                name, steps, capture = COMPILED_RULES[index]
+                if step == capture:
+                    pending[index] = raw
+                progress[index] = step + 1
+                if step + 1 == len(steps):
+                    captures.setdefault(name, pending[index])
+                else:
+                    advanced.append((index, step + 1))
+        # Registered after the loop so one token never advances a rule twice
+        for index, step in advanced:
+            for kind in COMPILED_RULES[index][1][step]:
+                expecting.setdefault(kind, []).append((index, step))
+
+    cached_word = _word_cache.get
+    for token in TOKEN_RE.findall(text):
+        # Most tokens are ordinary words already known not to be keywords
+        word = cached_word(token, _UNSEEN)
+        if word is None:
+            continue
+
+        if word is _UNSEEN:
+            first = token[0]
+            if first.isalpha():
+                word = _word_kinds(token)
+                if word is None:
+                    continue
+
+            elif first.isdigit():
+                tail = token[-1]
+                if tail == "%":
+                    kinds = ("num", "pct")
+                elif tail in "tT":
+                    kinds = ("num", "unit")
+                else:
+                    kinds = ("num",)
+                last_number = NUMBER_RE.match(token).group()
+                feed(kinds, last_number)
+                line_dirty = True
+                continue
+
+            elif first.isspace():
+                if token != "\n":
+                    # "3\nunits": the unit belongs to the number that ended the previous line
+                    feed(("unit",), last_number)
+                # Steps must share a line, as with the "." in the regexes this replaces
+                if line_dirty:
+                    progress[:] = [0] * len(COMPILED_RULES)
+                    expecting = {
+                        kind: [(index, step) for index, step in waiting if COMPILED_RULES[index][0] not in captures]
+                        for kind, waiting in INITIAL_EXPECTATIONS.items()
+                    }
+                    line_dirty = False
+                continue
+
+            else:
+                start = text.find(token, header_cursor)
+                header_cursor = start + len(token)
+                title = HEADER_TITLE_RE.search(token).group()
+                if sections:
+                    sections[-1].end = start
+                sections.append(Section(title=title, start=start, end=len(text)))
+                # Header words still count, e.g. **CONFIDENCE LEVEL**: 70%
+                for part in title.split():
+                    word = _word_kinds(part)
+                    if word is not None:
+                        feed(*word)
+                        line_dirty = True
+                continue
+
+        feed(*word)
+        line_dirty = True
+
+    return result
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass analysis extractor against the per-pattern regex
+extraction it replaced, over a corpus of saved analyses.
+
+Usage:
+    python benchmark_extractor.py [glob ...] [--iterations N]
+
+Defaults to blue_jays_marlins_5expert_*.json next to this script. Each saved
+analysis is split into its [PERSONA] segments plus the full text. The
+REGRESSION_CASES (inputs where the two once disagreed) are always checked.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from analysis_extractor import extract_analysis
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blue_jays_marlins_5expert_*.json")
+PERSONA_SPLIT = re.compile(r"(?=\[[A-Z][A-Z ]+\])")
+
+# Differential fuzz finds: a unit on the next line ("3\nunit") must not join the two lines
+REGRESSION_CASES = (
+    "Risk: 3\nunit size is high",
+    "99% 19 \n unit 42 percent risk Away 17 unit probability",
+    "68% 97 high,2 \n unit,low probability,30% ",
+    "24 units \n\n 6% 55\nunit confidence \n 27 risk,\n ",
+    "3% unit 8% 76%\nconfident,40\n\nUnits,61\nunit 2%,chance ",
+    "risk 13\nunit units low,84%,away probability,is 67% ",
+)
+
+
+def legacy_extract(content: str) -> Dict[str, Optional[float]]:
+    """The previous expert-path extraction: one re.search per pattern, compiled on each call"""
+    import re
+
+    probability = None
+    for pattern in [
+        r'away.*?(?:win.*?)?probability.*?(\d+)%',
+        r'probability.*?away.*?(\d+)%',
+        r'estimate.*?(\d+)%.*?away',
+        r'(\d+)%.*?chance.*?away',
+        r'(\d+)%.*?probability'
+    ]:
+        match = re.search(pattern, content, re.IGNORECASE)
+        if match:
+            probability = float(match.group(1)) / 100.0
+            break
+
+    confidence = None
+    for pattern in [r'confidence.*?(\d+)%', r'(\d+)%.*?confidence', r'confident.*?(\d+)%']:
+        match = re.search(pattern, content, re.IGNORECASE)
+        if match:
+            confidence = float(match.group(1)) / 100.0
+            break
+
+    unit_match = re.search(r'(\d+)\s*unit', content, re.IGNORECASE)
+    risk_match = re.search(r'risk.*?(low|medium|high)', content, re.IGNORECASE)
+    return {
+        "probability": probability,
+        "confidence": confidence,
+        "unit_size": int(unit_match.group(1)) if unit_match else None,
+        "risk_level": risk_match.group(1).title() if risk_match else None
+    }
+
+
+def single_pass_extract(content: str) -> Dict[str, Optional[float]]:
+    extraction = extract_analysis(content)
+    return {
+        "probability": extraction.expert_probability,
+        "confidence": extraction.confidence,
+        "unit_size": extraction.unit_size,
+        "risk_level": extraction.risk_level
+    }
+
+
+def load_corpus(patterns: List[str]) -> List[Tuple[str, str]]:
+    """(label, text) for every saved analysis and each of its persona segments"""
+    corpus = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            text = saved.get("analysis", {}).get("expert_analysis", "")
+            if not text:
+                continue
+            name = os.path.basename(path)
+            corpus.append((f"{name} (full)", text))
+            for segment in PERSONA_SPLIT.split(text):
+                if segment.startswith("["):
+                    corpus.append((f"{name} {segment[:segment.index(']') + 1]}", segment))
+    return corpus
+
+
+def check_regressions() -> int:
+    """Print every REGRESSION_CASES value on which the extractors disagree; returns the count"""
+    differences = 0
+    for text in REGRESSION_CASES:
+        old, new = legacy_extract(text), single_pass_extract(text)
+        for key in old:
+            if old[key] != new[key]:
+                differences += 1
+                print(f"  {text!r} {key}: legacy={old[key]} single_pass={new[key]}")
+    return differences
+
+
+def time_per_call(extract, corpus: List[Tuple[str, str]], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for _, text in corpus:
+            extract(text)
+    return (time.perf_counter() - started) / (iterations * len(corpus))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("patterns", nargs="*", default=[DEFAULT_CORPUS], help="Glob(s) of saved analysis JSON files")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print("Regression cases:")
+    if not check_regressions():
+        print(f"  all {len(REGRESSION_CASES)} agree")
+
+    corpus = load_corpus(args.patterns)
+    if not corpus:
+        print("No analyses found")
+        return
+
+    total_chars = sum(len(text) for _, text in corpus)
+    print(f"Corpus: {len(corpus)} texts, {total_chars:,} chars")
+
+    legacy = time_per_call(legacy_extract, corpus, args.iterations)
+    single = time_per_call(single_pass_extract, corpus, args.iterations)
+    print(f"Legacy regex:  {legacy * 1e6:8.1f} us/text")
+    print(f"Single pass:   {single * 1e6:8.1f} us/text  ({legacy / single:.1f}x)")
+
+    # No-match case: one line and no percentages, so every lazy pattern backtracks to the end
+    flattened = [(label, text.replace("\n", " ").replace("%", "")) for label, text in corpus]
+    legacy = time_per_call(legacy_extract, flattened, args.iterations)
+    single = time_per_call(single_pass_extract, flattened, args.iterations)
+    print("\nNo-match texts (single line, no percentages):")
+    print(f"Legacy regex:  {legacy * 1e6:8.1f} us/text")
+    print(f"Single pass:   {single * 1e6:8.1f} us/text  ({legacy / single:.1f}x)")
+
+    print("\nDifferences:")
+    differences = 0
+    for label, text in corpus:
+        old, new = legacy_extract(text), single_pass_extract(text)
+        for key in old:
+            if old[key] != new[key]:
+                differences += 1
+                print(f"  {label} {key}: legacy={old[key]} single_pass={new[key]}")
+    if not differences:
+        print("  none")
+
+    print("\nSections (first text):")
+    label, text = corpus[0]
+    for section in extract_analysis(text).sections:
+        print(f"  {section.title}: {section.start}-{section.end}")
+
+
+if __name__ == "__main__":
+    main()
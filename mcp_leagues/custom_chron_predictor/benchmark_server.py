@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for the Custom Chronulus MCP server.
+
+Drives concurrent getCustomChronulusAnalysis or getCustomChronulusSlateAnalysis
+calls and reports throughput, latency percentiles, errors and the server's LLM
+cache hit rate. Point the server at stub_openrouter.py to run it offline:
+
+    python stub_openrouter.py --port 9090 --latency lognormal:0.8,0.4+tail:0.05,8
+    OPENROUTER_BASE_URL=http://localhost:9090/api/v1 OPENROUTER_API_KEY=stub python custom_chronulus_mcp_server.py
+    python benchmark_server.py --requests 100 --concurrency 10 --unique-games 20 --stub-url http://localhost:9090
+
+Repeated games (--unique-games smaller than the number of games sent) exercise
+the LLM response cache; --unique-games 0 makes every game distinct.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+DEFAULT_MCP_URL = "http://localhost:8080/mcp"
+
+TEAMS = [
+    "Toronto Blue Jays", "Miami Marlins", "New York Yankees", "Boston Red Sox", "Los Angeles Dodgers",
+    "San Diego Padres", "Houston Astros", "Seattle Mariners", "Atlanta Braves", "Philadelphia Phillies",
+    "Chicago Cubs", "Milwaukee Brewers", "Detroit Tigers", "Cleveland Guardians", "Texas Rangers", "Kansas City Royals"
+]
+
+
+def make_game(index: int) -> Dict[str, Any]:
+    """Deterministic game for index, so repeated indexes produce identical prompts"""
+    rng = random.Random(index)
+    away, home = rng.sample(TEAMS, 2)
+    away_line = rng.choice([-160, -138, -120, -105, 110, 125, 145])
+    return {
+        "home_team": home,
+        "away_team": away,
+        "venue": f"{home.split()[-1]} Park",
+        "game_date": f"2025-08-{1 + index % 28:02d}",
+        "home_record": f"{rng.randint(50, 80)}-{rng.randint(50, 80)}",
+        "away_record": f"{rng.randint(50, 80)}-{rng.randint(50, 80)}",
+        "away_moneyline": away_line,
+        "home_moneyline": -away_line + (20 if away_line > 0 else -20),
+        "additional_context": f"Benchmark game {index}"
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def call_tool(client: httpx.AsyncClient, url: str, name: str, arguments: Dict[str, Any], stream: bool) -> Tuple[Dict[str, Any], Optional[float]]:
+    """Run one tools/call; returns (result, seconds to first streamed frame)"""
+    payload = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": name, "arguments": arguments}}
+    if not stream:
+        response = await client.post(url, json=payload)
+        body = response.json()
+        if "error" in body:
+            raise Exception(body["error"].get("message"))
+        return json.loads(body["result"]["content"][0]["text"]), None
+
+    started = time.perf_counter()
+    first_frame = None
+    last_line = ""
+    async with client.stream("POST", url, json=payload, headers={"accept": "application/x-ndjson"}) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.strip():
+                continue
+            if first_frame is None:
+                first_frame = time.perf_counter() - started
+            last_line = line
+    frame = json.loads(last_line)
+    if frame.get("type") != "result" or "error" in frame:
+        raise Exception(f"Stream ended without a result: {last_line[:200]}")
+    return json.loads(frame["result"]["content"][0]["text"]), first_frame
+
+
+async def server_health(client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+    try:
+        health, _ = await call_tool(client, url, "getCustomChronulusHealth", {}, stream=False)
+        return health
+    except Exception as e:
+        print(f"Health call failed: {e}")
+        return {}
+
+
+async def run(args: argparse.Namespace) -> None:
+    tool = "getCustomChronulusSlateAnalysis" if args.tool == "slate" else "getCustomChronulusAnalysis"
+    games_per_call = args.slate_size if args.tool == "slate" else 1
+    next_game = [0]
+
+    def game_index() -> int:
+        next_game[0] += 1
+        return next_game[0] % args.unique_games if args.unique_games else next_game[0]
+
+    def arguments() -> Dict[str, Any]:
+        common = {"expert_count": args.expert_count, "analysis_depth": args.depth}
+        if args.tool == "slate":
+            return {"games": [make_game(game_index()) for _ in range(args.slate_size)], **common}
+        return {"game_data": make_game(game_index()), **common}
+
+    latencies: List[float] = []
+    first_frames: List[float] = []
+    errors: List[str] = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async with httpx.AsyncClient(timeout=args.timeout, limits=httpx.Limits(max_connections=args.concurrency + 2)) as client:
+        before = await server_health(client, args.url)
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    result, first_frame = await call_tool(client, args.url, tool, arguments(), args.stream)
+                    if result.get("status") != "success":
+                        raise Exception(result.get("error", result.get("status")))
+                except Exception as e:
+                    errors.append(str(e) or type(e).__name__)
+                    return
+                latencies.append(time.perf_counter() - started)
+                if first_frame is not None:
+                    first_frames.append(first_frame)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+        after = await server_health(client, args.url)
+        stub_stats = None
+        if args.stub_url:
+            try:
+                stub_stats = (await client.get(f"{args.stub_url.rstrip('/')}/stats")).json()
+            except Exception as e:
+                print(f"Stub stats failed: {e}")
+
+    print(f"\n{tool}: {args.requests} calls, concurrency {args.concurrency}, "
+          f"{args.expert_count} expert(s), {games_per_call} game(s)/call, stream={args.stream}")
+    print(f"Elapsed:     {elapsed:.2f}s")
+    print(f"Throughput:  {len(latencies) / elapsed:.2f} calls/s  ({len(latencies) * games_per_call / elapsed:.2f} games/s)")
+    print(f"Errors:      {len(errors)}")
+    if latencies:
+        print("Latency:     " + "  ".join(
+            f"p{pct}={percentile(latencies, pct):.2f}s" for pct in (50, 90, 95, 99)
+        ) + f"  max={max(latencies):.2f}s")
+    if first_frames:
+        print(f"First frame: p50={percentile(first_frames, 50):.2f}s  p95={percentile(first_frames, 95):.2f}s")
+
+    cache_before, cache_after = before.get("llm_cache", {}), after.get("llm_cache", {})
+    if cache_after:
+        hits = cache_after.get("hits", 0) - cache_before.get("hits", 0)
+        misses = cache_after.get("misses", 0) - cache_before.get("misses", 0)
+        if hits + misses:
+            print(f"LLM cache:   {hits}/{hits + misses} hits ({hits / (hits + misses):.0%})")
+
+    latency = after.get("model_latency", {})
+    if latency:
+        print(f"Hedges:      {latency.get('hedges', 0)} sent, {latency.get('hedge_wins', 0)} won (cumulative)")
+        for model, stats in latency.get("models", {}).items():
+            quantiles = "  ".join(
+                f"{name}={stats[name]:.2f}s" for name in ("p50", "p95", "p99") if stats.get(name) is not None
+            )
+            print(f"  {model}: n={stats['count']} errors={stats['errors']}  {quantiles}")
+    if stub_stats:
+        print(f"Stub:        {stub_stats['requests']} upstream requests, {stub_stats['errors']} injected errors, "
+              f"peak {stub_stats['peak_in_flight']} in flight")
+
+    for message in sorted(set(errors))[:5]:
+        print(f"  error: {message}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=DEFAULT_MCP_URL, help="MCP endpoint of the server under test")
+    parser.add_argument("--tool", choices=["analysis", "slate"], default="analysis")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--expert-count", type=int, default=2)
+    parser.add_argument("--depth", choices=["brief", "standard", "comprehensive"], default="standard")
+    parser.add_argument("--slate-size", type=int, default=6)
+    parser.add_argument("--unique-games", type=int, default=0, help="Size of the game pool (0 = every game distinct)")
+    parser.add_argument("--stream", action="store_true", help="Request NDJSON streaming responses")
+    parser.add_argument("--timeout", type=float, default=180.0)
+    parser.add_argument("--stub-url", default=None, help="stub_openrouter.py base URL, to report upstream stats")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
@@ -6,18 +6,28 @@ Provides institutional-quality sports betting analysis at 90% cost savings.
 """
 
 import asyncio
+import bisect
+import hashlib
 import json
 import os
+import re
 import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 import httpx
 import uvicorn
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 from starlette.routing import Route
 from pydantic import BaseModel, Field
+from analysis_extractor import (
+    EXPERT_PROBABILITY_RULES,
+    extract_analysis
+)
 import statistics
 import random
 
@@ -27,6 +37,46 @@ OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/ap
 OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "google/gemini-2.0-flash-001")
 USER_AGENT = "custom-chronulus-mcp/1.0"
 
+# Expert panel: experts run concurrently (capped per request); an expert that
+# misses its deadline (counted from when it holds LLM budget) is replaced by a
+# market-based fallback opinion
+MAX_CONCURRENT_EXPERTS = int(os.getenv("MAX_CONCURRENT_EXPERTS", "5"))
+EXPERT_DEADLINE_SECONDS = float(os.getenv("EXPERT_DEADLINE_SECONDS", "45"))
+
+# Stream completions and stop reading once the final probability has been written
+OPENROUTER_STREAM = os.getenv("OPENROUTER_STREAM", "true").lower() == "true"
+
+# Hedged requests: a completion still running after the primary model's
+# HEDGE_PERCENTILE latency gets a duplicate sent to the next model in the chain,
+# and the first valid answer wins. A failed attempt moves to the next model at once.
+OPENROUTER_FALLBACK_MODELS = [m.strip() for m in os.getenv("OPENROUTER_FALLBACK_MODELS", "").split(",") if m.strip()]
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "true").lower() == "true"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_DEFAULT_DELAY_SECONDS = float(os.getenv("HEDGE_DEFAULT_DELAY_SECONDS", "8"))
+HEDGE_MIN_DELAY_SECONDS = float(os.getenv("HEDGE_MIN_DELAY_SECONDS", "1"))
+MAX_COMPLETION_ATTEMPTS = int(os.getenv("MAX_COMPLETION_ATTEMPTS", "3"))
+LATENCY_BUCKETS = (0.5, 1, 2, 4, 8, 15, 30, 60)
+LATENCY_WINDOW = 200
+
+# Global LLM budget shared by every request: completions in flight and the
+# max_tokens they may spend together
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("MAX_CONCURRENT_LLM_CALLS", "8"))
+LLM_TOKEN_BUDGET = int(os.getenv("LLM_TOKEN_BUDGET", "6400"))
+
+# Slate analysis: games analysed at once per getCustomChronulusSlateAnalysis call
+SLATE_MAX_CONCURRENT_GAMES = int(os.getenv("SLATE_MAX_CONCURRENT_GAMES", "6"))
+MAX_SLATE_GAMES = 20
+
+# LLM response cache: completions are reused while their prompt inputs are unchanged.
+# Bump PROMPT_TEMPLATE_VERSION whenever a prompt template changes.
+PROMPT_TEMPLATE_VERSION = "1"
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(6 * 3600)))
+LLM_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "llm_cache.json")
+)
+
 # HTTP client
 _http_client: Optional[httpx.AsyncClient] = None
 
@@ -42,6 +92,28 @@ async def get_http_client() -> httpx.AsyncClient:
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+# Early-exit markers for streamed completions
+DIRECTIONAL_PROBABILITY_RE = re.compile(r'directional assessment.*?\d+(?:\.\d+)?\s*%[^.!?\n]*[.!?]', re.IGNORECASE | re.DOTALL)
+WIN_PROBABILITY_RE = re.compile(r'win probability:?\s*\*{0,2}\s*\d+(?:\.\d+)?\s*%', re.IGNORECASE)
+SENTENCE_END_RE = re.compile(r'[.!?](?=\s|$)')
+
+def count_sentences(text: str) -> int:
+    return len(SENTENCE_END_RE.findall(text))
+
+def chief_analysis_complete(min_sentences: int) -> Callable[[str], bool]:
+    """Stop condition: DIRECTIONAL ASSESSMENT probability sentence written and sentence budget met"""
+    return lambda text: count_sentences(text) >= min_sentences and DIRECTIONAL_PROBABILITY_RE.search(text) is not None
+
+def expert_analysis_complete(min_sentences: int) -> Callable[[str], bool]:
+    """Stop condition: closing "win probability: XX%" written and sentence budget met"""
+    return lambda text: count_sentences(text) >= min_sentences and WIN_PROBABILITY_RE.search(text) is not None
+
+def implied_probability(moneyline: int) -> float:
+    """Implied win probability of an American moneyline"""
+    if moneyline < 0:
+        return abs(moneyline) / (abs(moneyline) + 100)
+    return 100 / (moneyline + 100)
+
 # Core Chronulus Models
 class BetaDistributionParams(BaseModel):
     """Beta distribution parameters for consensus"""
@@ -90,6 +162,188 @@ class GameData(BaseModel):
     away_moneyline: int = Field(description="Away team moneyline odds")
     additional_context: str = Field(default="", description="Additional game context")
 
+class LLMBudget:
+    """Caps concurrent completions and the total max_tokens they have reserved"""
+    
+    def __init__(self, max_calls: int = MAX_CONCURRENT_LLM_CALLS, max_tokens: int = LLM_TOKEN_BUDGET):
+        self.max_calls = max_calls
+        self.max_tokens = max_tokens
+        self.calls = 0
+        self.tokens = 0
+        self._condition: Optional[asyncio.Condition] = None
+    
+    def _cond(self) -> asyncio.Condition:
+        # Created lazily so it binds to the server's running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+    
+    async def acquire(self, tokens: int) -> int:
+        """Wait until a call slot and `tokens` of budget are free; returns the tokens reserved"""
+        tokens = min(tokens, self.max_tokens)
+        async with self._cond():
+            await self._cond().wait_for(
+                lambda: self.calls < self.max_calls and self.tokens + tokens <= self.max_tokens
+            )
+            self.calls += 1
+            self.tokens += tokens
+        return tokens
+    
+    async def release(self, tokens: int) -> None:
+        async with self._cond():
+            self.calls -= 1
+            self.tokens -= tokens
+            self._cond().notify_all()
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls_in_flight": self.calls,
+            "tokens_reserved": self.tokens,
+            "max_calls": self.max_calls,
+            "token_budget": self.max_tokens
+        }
+
+llm_budget = LLMBudget()
+
+class LatencyHistogram:
+    """Completion latencies for one model: bucket counts plus a window of recent samples"""
+    
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.recent: Deque[float] = deque(maxlen=window)
+        self.errors = 0
+    
+    def record(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.recent.append(seconds)
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+    
+    def stats(self) -> Dict[str, Any]:
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return {
+            "count": sum(self.buckets),
+            "errors": self.errors,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(labels, self.buckets))
+        }
+
+class ModelLatencyTracker:
+    """Per-model latency histograms and the hedge delay derived from them"""
+    
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.hedges = 0
+        self.hedge_wins = 0
+    
+    def _histogram(self, model: str) -> LatencyHistogram:
+        return self.histograms.setdefault(model, LatencyHistogram())
+    
+    def record(self, model: str, seconds: float) -> None:
+        self._histogram(model).record(seconds)
+    
+    def record_error(self, model: str) -> None:
+        self._histogram(model).errors += 1
+    
+    def hedge_delay(self, model: str) -> float:
+        """Seconds to wait on model before hedging; a fixed default until enough samples exist"""
+        histogram = self.histograms.get(model)
+        if histogram is None or len(histogram.recent) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY_SECONDS
+        return max(HEDGE_MIN_DELAY_SECONDS, histogram.percentile(HEDGE_PERCENTILE))
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "models": {model: histogram.stats() for model, histogram in self.histograms.items()}
+        }
+
+latency_tracker = ModelLatencyTracker()
+
+class LLMResponseCache:
+    """Content-addressed, disk-backed cache of OpenRouter completions"""
+    
+    def __init__(self, path: str = LLM_CACHE_PATH, ttl: float = LLM_CACHE_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._version = 0
+        self._saved_version = 0
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {key: entry for key, entry in entries.items() if now - entry["cached_at"] < self.ttl}
+    
+    def _save(self) -> None:
+        """Blocking; drops expired entries and rewrites the file"""
+        with self._save_lock:
+            with self._lock:
+                if self._saved_version == self._version:
+                    return  # an earlier queued save already wrote these entries
+                now = time.time()
+                self._entries = {k: v for k, v in self._entries.items() if now - v["cached_at"] < self.ttl}
+                snapshot = json.dumps(self._entries)
+                version = self._version
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(snapshot)
+                os.replace(tmp_path, self.path)
+                self._saved_version = version
+            except OSError as e:
+                print(f"LLM cache write failed: {e}")
+    
+    @staticmethod
+    def make_key(model: str, game_data: GameData, persona: str, note_length: Tuple[int, int]) -> str:
+        """Hash of everything that determines the prompt sent to the model"""
+        normalized = {
+            name: " ".join(value.split()) if isinstance(value, str) else value
+            for name, value in sorted(game_data.model_dump().items())
+        }
+        payload = json.dumps(
+            [PROMPT_TEMPLATE_VERSION, model, normalized, persona, list(note_length)],
+            sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.time() - entry["cached_at"] >= self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["content"]
+    
+    async def put(self, key: str, content: str) -> None:
+        with self._lock:
+            self._entries[key] = {"cached_at": time.time(), "content": content}
+            self._version += 1
+        # File I/O off the event loop
+        await asyncio.to_thread(self._save)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "ttl_seconds": self.ttl}
+
+llm_cache = LLMResponseCache()
+
 class CustomChronulusSession:
     """Simulates Chronulus session management"""
     
@@ -112,6 +366,8 @@ class CustomBinaryPredictor:
         self.base_url = OPENROUTER_BASE_URL
         self.api_key = OPENROUTER_API_KEY
         self.model = OPENROUTER_MODEL
+        # Optional async callback(persona, text_delta) receiving streamed completion text
+        self.on_delta: Optional[Callable[[str, str], Awaitable[None]]] = None
         
         self.expert_personas = [
             "STATISTICAL EXPERT",
@@ -156,91 +412,54 @@ class CustomBinaryPredictor:
             return "LEAN AWAY" if probability > 0.52 else "LEAN HOME" if probability < 0.48 else "PASS - No clear edge"
     
     async def _simulate_multi_expert_panel(self, game_data: GameData, num_experts: int, note_length: Tuple[int, int]) -> List[ExpertOpinion]:
-        """Generate analysis from multiple expert perspectives"""
-        expert_analyses = []
+        """Generate analysis from multiple expert perspectives concurrently"""
         
         # Use the first N expert personas based on requested count
         selected_experts = self.expert_personas[:min(num_experts, len(self.expert_personas))]
         
-        for i, expert_type in enumerate(selected_experts):
-            analysis = await self._simulate_expert_with_openrouter(game_data, i+1, expert_type, note_length)
-            expert_analyses.append(analysis)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXPERTS)
+        market_baseline = implied_probability(game_data.away_moneyline)
         
-        return expert_analyses
-    
-
-    
-    def _extract_probability(self, text: str, market_baseline: float) -> float:
-        """Extract probability estimate from expert analysis text"""
-        import re
-        
-        # Look for percentage patterns
-        prob_patterns = [
-            r'(\d+(?:\.\d+)?)%',
-            r'probability.*?(\d+(?:\.\d+)?)',
-            r'chance.*?(\d+(?:\.\d+)?)',
-            r'(\d+(?:\.\d+)?) percent'
-        ]
-        
-        for pattern in prob_patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
+        async def run_expert(expert_id: int, expert_type: str) -> ExpertOpinion:
+            async with semaphore:
+                budget_held = asyncio.Event()
+                task = asyncio.create_task(
+                    self._simulate_expert_with_openrouter(game_data, expert_id, expert_type, note_length, budget_held)
+                )
+                # Time queued for the shared LLM budget doesn't count against the deadline
+                acquired = asyncio.create_task(budget_held.wait())
                 try:
-                    prob = float(matches[0])
-                    if prob > 1:  # Convert percentage to decimal
-                        prob = prob / 100
-                    if 0.1 <= prob <= 0.9:  # Reasonable range
-                        return prob
-                except ValueError:
-                    continue
-        
-        # If no clear probability found, use market baseline with small random variation
-        variation = random.uniform(-0.05, 0.05)
-        return max(0.15, min(0.85, market_baseline + variation))
-    
-    def _extract_confidence(self, text: str) -> float:
-        """Extract confidence level from expert analysis text"""
-        import re
-        
-        # Look for confidence patterns
-        conf_patterns = [
-            r'confidence.*?(\d+(?:\.\d+)?)%?',
-            r'confident.*?(\d+(?:\.\d+)?)%?',
-            r'(\d+(?:\.\d+)?)%?.*confidence'
-        ]
-        
-        for pattern in conf_patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
+                    await asyncio.wait({task, acquired}, return_when=asyncio.FIRST_COMPLETED)
+                except asyncio.CancelledError:
+                    task.cancel()
+                    raise
+                finally:
+                    acquired.cancel()
                 try:
-                    conf = float(matches[0])
-                    if conf > 1:  # Convert percentage to decimal
-                        conf = conf / 100
-                    if 0.3 <= conf <= 1.0:  # Reasonable range
-                        return conf
-                except ValueError:
-                    continue
+                    return await asyncio.wait_for(task, timeout=EXPERT_DEADLINE_SECONDS)
+                except asyncio.TimeoutError:
+                    print(f"Expert {expert_id} ({expert_type}) missed {EXPERT_DEADLINE_SECONDS}s deadline, using fallback")
+                    return self._create_fallback_expert(expert_id, expert_type, market_baseline)
         
-        # Default confidence based on text analysis
-        if any(word in text.lower() for word in ['strong', 'confident', 'clear', 'solid']):
-            return random.uniform(0.75, 0.90)
-        elif any(word in text.lower() for word in ['uncertain', 'unclear', 'difficult', 'close']):
-            return random.uniform(0.50, 0.65)
-        else:
-            return random.uniform(0.65, 0.80)
+        # Wall time is the slowest expert (bounded by the deadline), not the sum
+        return list(await asyncio.gather(*(
+            run_expert(i + 1, expert_type) for i, expert_type in enumerate(selected_experts)
+        )))
+    
+
     
     def _create_fallback_expert(self, expert_id: int, expert_type: str, market_baseline: float) -> ExpertOpinion:
-        """Create fallback expert opinion when API fails"""
+        """Create fallback expert opinion when the expert misses its deadline"""
         variation = random.uniform(-0.08, 0.08)
         probability = max(0.15, min(0.85, market_baseline + variation))
         confidence = random.uniform(0.6, 0.8)
         
         return ExpertOpinion(
             expert_id=expert_id,
-            expert_type=expert_type,
+            expert_type=f"{expert_type} - FALLBACK",
             probability=probability,
             confidence=confidence,
-            reasoning=f"[{expert_type}] Market-based analysis suggests {probability:.1%} away team win probability with {confidence:.0%} confidence.",
+            reasoning=f"Fallback estimate: no analysis within the {EXPERT_DEADLINE_SECONDS:g}s deadline. Market baseline with random variation suggests {probability:.1%} away team win probability.",
             unit_size=2,
             risk_level="Medium"
         )
@@ -285,6 +504,9 @@ class CustomBinaryPredictor:
         combined_text += f"Consensus Win Probability: {weighted_prob:.1%} ({game_data.away_team})\n"
         combined_text += f"Panel Confidence: {avg_confidence:.0%}\n"
         combined_text += f"Expert Count: {len(expert_analyses)}\n"
+        fallbacks = sum(1 for exp in expert_analyses if exp.expert_type.endswith("- FALLBACK"))
+        if fallbacks:
+            combined_text += f"Fallback Experts: {fallbacks} (market-based estimates, not analysis)\n"
         combined_text += f"Recommendation: {self._get_betting_recommendation(weighted_prob, avg_confidence)}"
         
         return PredictionResult(
@@ -331,6 +553,212 @@ class CustomBinaryPredictor:
             beta_params=beta_params
         )
     
+    async def _complete(
+        self,
+        persona: str,
+        game_data: GameData,
+        note_length: Tuple[int, int],
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        stop_when: Optional[Callable[[str], bool]] = None,
+        budget_held: Optional[asyncio.Event] = None
+    ) -> str:
+        """Run one OpenRouter completion, served from the LLM cache when the inputs are unchanged"""
+        cache_key = LLMResponseCache.make_key(self.model, game_data, persona, note_length)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            # Streaming clients still get this expert's text, as a single chunk
+            if self.on_delta:
+                await self.on_delta(persona, cached)
+            return cached
+        
+        payload = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        
+        content, model = await self._hedged_completion(payload, persona, stop_when, budget_held)
+        # The key describes the primary model; a fallback's answer is not cached under it
+        if model == self.model:
+            await llm_cache.put(cache_key, content)
+        return content
+    
+    def _model_chain(self) -> List[str]:
+        return [self.model] + [model for model in OPENROUTER_FALLBACK_MODELS if model != self.model]
+    
+    async def _hedged_completion(
+        self,
+        payload: Dict[str, Any],
+        persona: str,
+        stop_when: Optional[Callable[[str], bool]],
+        budget_held: Optional[asyncio.Event] = None
+    ) -> Tuple[str, str]:
+        """First valid completion across the primary model, hedges and fallbacks, with the model that produced it; losers are cancelled"""
+        chain = self._model_chain()
+        max_attempts = max(1, MAX_COMPLETION_ATTEMPTS)
+        relay: Dict[str, int] = {}
+        pending: Dict[asyncio.Task, int] = {}
+        last_error: Optional[Exception] = None
+        
+        started = 0
+        sent = asyncio.Event()
+        
+        def launch() -> None:
+            nonlocal started, sent
+            model = chain[min(started, len(chain) - 1)]
+            sent = asyncio.Event()
+            task = asyncio.create_task(self._attempt_completion(model, payload, persona, stop_when, relay, started, sent, budget_held))
+            pending[task] = started
+            started += 1
+        
+        launch()
+        try:
+            while pending:
+                can_hedge = HEDGE_ENABLED and started < max_attempts
+                if can_hedge and not sent.is_set():
+                    # The latest attempt is still queued for budget, so nothing has been sent yet:
+                    # start the hedge clock only once it holds its budget (or any attempt finishes)
+                    acquired = asyncio.create_task(sent.wait())
+                    try:
+                        await asyncio.wait({*pending, acquired}, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        acquired.cancel()
+                    done = {task for task in pending if task.done()}
+                    if not done:
+                        continue
+                else:
+                    delay = latency_tracker.hedge_delay(self.model) if can_hedge else None
+                    done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                    if not done:
+                        latency_tracker.hedges += 1
+                        launch()
+                        continue
+                
+                for task in done:
+                    attempt = pending.pop(task)
+                    try:
+                        content = task.result()
+                    except Exception as e:
+                        last_error = e
+                        print(f"Completion attempt {attempt + 1} for {persona} failed: {e}")
+                        continue
+                    if attempt > 0:
+                        latency_tracker.hedge_wins += 1
+                    return content, chain[min(attempt, len(chain) - 1)]
+                
+                # Every running attempt failed: fall over to the next model straight away
+                if not pending and started < max_attempts:
+                    launch()
+            raise last_error or Exception("No completion attempts were made")
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _attempt_completion(
+        self,
+        model: str,
+        payload: Dict[str, Any],
+        persona: str,
+        stop_when: Optional[Callable[[str], bool]],
+        relay: Dict[str, int],
+        attempt: int,
+        sent: asyncio.Event,
+        budget_held: Optional[asyncio.Event] = None
+    ) -> str:
+        """One completion against model, holding its share of the LLM budget; sets sent once the budget is held"""
+        
+        async def relay_delta(delta: str) -> None:
+            # Only the first attempt to produce text is relayed to the client
+            if self.on_delta and relay.setdefault("attempt", attempt) == attempt:
+                await self.on_delta(persona, delta)
+        
+        client = await get_http_client()
+        request = {**payload, "model": model}
+        reserved = await llm_budget.acquire(payload["max_tokens"])
+        sent.set()
+        if budget_held is not None:
+            budget_held.set()
+        started = time.monotonic()
+        try:
+            if OPENROUTER_STREAM:
+                content = await self._stream_completion(client, request, relay_delta, stop_when)
+            else:
+                content = await self._post_completion(client, request)
+            content = content.strip()
+            if not content:
+                raise Exception(f"Empty completion from {model}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            latency_tracker.record_error(model)
+            raise
+        finally:
+            await llm_budget.release(reserved)
+        
+        latency_tracker.record(model, time.monotonic() - started)
+        return content
+    
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    async def _post_completion(self, client: httpx.AsyncClient, payload: Dict[str, Any]) -> str:
+        response = await client.post(f"{self.base_url}/chat/completions", headers=self._headers(), json=payload)
+        response.raise_for_status()
+        result = response.json()
+        return result["choices"][0]["message"]["content"]
+    
+    async def _stream_completion(
+        self,
+        client: httpx.AsyncClient,
+        payload: Dict[str, Any],
+        on_delta: Callable[[str], Awaitable[None]],
+        stop_when: Optional[Callable[[str], bool]]
+    ) -> str:
+        """Read a streamed completion, relaying deltas and stopping early once stop_when(text) holds"""
+        text = ""
+        async with client.stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers=self._headers(),
+            json={**payload, "stream": True}
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank separators
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                
+                chunk = json.loads(data)
+                if "error" in chunk:
+                    raise Exception(chunk["error"].get("message", "OpenRouter stream error"))
+                choices = chunk.get("choices") or []
+                delta = choices[0].get("delta", {}).get("content") if choices else None
+                if not delta:
+                    continue
+                
+                text += delta
+                await on_delta(delta)
+                if stop_when and stop_when(text):
+                    # Leaving the stream closes the connection, which stops generation
+                    break
+        return text
+    
     async def _simulate_chief_analyst_with_openrouter(self, game_data: GameData, note_length: Tuple[int, int]) -> ExpertOpinion:
         """Generate comprehensive chief analyst analysis with Bloomberg-style formatting"""
         
@@ -387,66 +815,27 @@ CRITICAL REQUIREMENTS:
 • Stay within {min_sentences}-{max_sentences} total sentences across all sections"""
 
         try:
-            client = await get_http_client()
-            
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": chief_prompt
-                        }
-                    ],
-                    "max_tokens": 800,  # Increased for comprehensive analysis
-                    "temperature": 0.6  # Slightly lower for more consistent professional tone
-                }
+            # 800 tokens for comprehensive analysis; slightly lower temperature for a consistent professional tone
+            content = await self._complete(
+                "CHIEF ANALYST", game_data, note_length, chief_prompt, max_tokens=800, temperature=0.6,
+                stop_when=chief_analysis_complete(min_sentences)
             )
             
-            response.raise_for_status()
-            result = response.json()
-            
-            content = result["choices"][0]["message"]["content"].strip()
-            
-            # Enhanced probability extraction for chief analyst
-            import re
-            
-            # Look for away team win probability 
-            prob_patterns = [
-                r'away.*?(?:win.*?)?probability.*?(\d+)%',
-                r'probability.*?away.*?(\d+)%', 
-                r'(\d+)%.*?probability.*?away',
-                r'(\d+)%.*?(?:chance|probability)'
-            ]
+            extraction = extract_analysis(content)
             
             # Calculate market baseline for away team
             away_market_prob = abs(game_data.away_moneyline) / (abs(game_data.away_moneyline) + 100) if game_data.away_moneyline < 0 else 100 / (game_data.away_moneyline + 100)
             
             probability = away_market_prob  # Start with market baseline
-            for pattern in prob_patterns:
-                prob_match = re.search(pattern, content, re.IGNORECASE)
-                if prob_match:
-                    extracted_prob = float(prob_match.group(1)) / 100.0
-                    
-                    # Chronulus-style: small adjustments from market baseline (±8% max)
-                    max_adjustment = 0.08
-                    min_prob = max(0.35, away_market_prob - max_adjustment)
-                    max_prob = min(0.65, away_market_prob + max_adjustment)
-                    
-                    probability = max(min_prob, min(max_prob, extracted_prob))
-                    break
+            extracted_prob = extraction.chief_probability
+            if extracted_prob is not None:
+                # Chronulus-style: small adjustments from market baseline (±8% max)
+                max_adjustment = 0.08
+                min_prob = max(0.35, away_market_prob - max_adjustment)
+                max_prob = min(0.65, away_market_prob + max_adjustment)
+                
+                probability = max(min_prob, min(max_prob, extracted_prob))
                 
-            # Look for confidence level
-            conf_patterns = [
-                r'confidence.*?(\d+)%',
-                r'(\d+)%.*?confidence',
-                r'confident.*?(\d+)%'
-            ]
             # Chronulus-style moderate confidence (lower for close games)
             market_edge = abs(probability - away_market_prob)
             if market_edge < 0.03:  # Very close to market
@@ -457,14 +846,11 @@ CRITICAL REQUIREMENTS:
                 confidence = 0.75  # Higher confidence but still moderate
                 
             # Allow confidence extraction but keep it reasonable
-            for pattern in conf_patterns:
-                conf_match = re.search(pattern, content, re.IGNORECASE)
-                if conf_match:
-                    extracted_conf = float(conf_match.group(1)) / 100.0
-                    # Cap confidence based on market edge
-                    max_conf = 0.65 + (market_edge * 2)  # Scale with edge size
-                    confidence = max(0.60, min(max_conf, extracted_conf))
-                    break
+            extracted_conf = extraction.confidence
+            if extracted_conf is not None:
+                # Cap confidence based on market edge
+                max_conf = 0.65 + (market_edge * 2)  # Scale with edge size
+                confidence = max(0.60, min(max_conf, extracted_conf))
             
             return ExpertOpinion(
                 expert_id=1,
@@ -489,8 +875,15 @@ CRITICAL REQUIREMENTS:
                 reasoning=f"[CHIEF ANALYST] **MARKET BASELINE**: The current moneyline implies approximately {away_market_prob:.1%} probability for {game_data.away_team}. **ASSESSMENT**: Due to API limitations, we align with market expectations given the competitive nature of this matchup. The betting lines suggest efficient pricing with no clear technical edge identified. **BASEBALL VARIANCE**: As always in baseball, game-to-game variance remains significant. Professional recommendation: monitor line movement for potential value opportunities."
             )
     
-    async def _simulate_expert_with_openrouter(self, game_data: GameData, expert_id: int, expert_persona: str, note_length: Tuple[int, int]) -> ExpertOpinion:
-        """Simulate expert analysis using OpenRouter"""
+    async def _simulate_expert_with_openrouter(
+        self,
+        game_data: GameData,
+        expert_id: int,
+        expert_persona: str,
+        note_length: Tuple[int, int],
+        budget_held: Optional[asyncio.Event] = None
+    ) -> ExpertOpinion:
+        """Simulate expert analysis using OpenRouter; budget_held is set once a completion holds LLM budget"""
         
         min_sentences, max_sentences = note_length
         
@@ -562,85 +955,24 @@ CRITICAL RULES:
 • Professional tone matching institutional analysis standards"""
 
         try:
-            client = await get_http_client()
-            
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": expert_prompt
-                        }
-                    ],
-                    "max_tokens": 400,  # Reduced for Discord compatibility
-                    "temperature": 0.7
-                }
+            # 400 tokens keeps each expert Discord-sized
+            content = await self._complete(
+                expert_persona, game_data, note_length, expert_prompt, max_tokens=400, temperature=0.7,
+                stop_when=expert_analysis_complete(min_sentences), budget_held=budget_held
             )
             
-            response.raise_for_status()
-            result = response.json()
-            
-            content = result["choices"][0]["message"]["content"].strip()
-            
-            # Extract probability, confidence, units, and risk
-            probability = 0.5  # Default
-            confidence = 0.7   # Default
-            unit_size = 1      # Default
-            risk_level = "Medium"  # Default
-            
-            # Enhanced probability extraction patterns
-            import re
-            
-            # Look for away team win probability (primary target)
-            prob_patterns = [
-                r'away.*?(?:win.*?)?probability.*?(\d+)%',
-                r'probability.*?away.*?(\d+)%', 
-                r'estimate.*?(\d+)%.*?away',
-                r'(\d+)%.*?chance.*?away',
-                r'(\d+)%.*?probability'
-            ]
-            
-            probability = 0.5  # Default
-            prob_match = None  # Initialize to avoid unbound variable
-            for pattern in prob_patterns:
-                prob_match = re.search(pattern, content, re.IGNORECASE)
-                if prob_match:
-                    probability = float(prob_match.group(1)) / 100.0
-                    break
-                
-            # Look for confidence level
-            conf_patterns = [
-                r'confidence.*?(\d+)%',
-                r'(\d+)%.*?confidence',
-                r'confident.*?(\d+)%'
-            ]
-            confidence = 0.7  # Default
-            for pattern in conf_patterns:
-                conf_match = re.search(pattern, content, re.IGNORECASE)
-                if conf_match:
-                    confidence = float(conf_match.group(1)) / 100.0
-                    break
-                
-            # Look for unit size
-            unit_match = re.search(r'(\d+)\s*unit', content, re.IGNORECASE)
-            if unit_match:
-                unit_size = int(unit_match.group(1))
-                
-            # Look for risk level
-            risk_match = re.search(r'risk.*?(low|medium|high)', content, re.IGNORECASE)
-            if risk_match:
-                risk_level = risk_match.group(1).title()
+            # Extract probability, confidence, units, and risk in one pass
+            extraction = extract_analysis(content)
+            probability = extraction.expert_probability or 0.5
+            confidence = extraction.confidence or 0.7
+            unit_size = extraction.unit_size or 1
+            risk_level = extraction.risk_level or "Medium"
             
             # Clean up reasoning
             reasoning = content
-            if 'prob_match' in locals() and prob_match:
-                reasoning = content.replace(f"My probability: {prob_match.group(1)}%", "").strip()
+            stated = extraction.first(EXPERT_PROBABILITY_RULES)
+            if stated is not None:
+                reasoning = content.replace(f"My probability: {stated}%", "").strip()
             
             return ExpertOpinion(
                 expert_id=expert_id,
@@ -705,6 +1037,35 @@ AVAILABLE_TOOLS = [
             "required": ["game_data"]
         }
     },
+    {
+        "name": "getCustomChronulusSlateAnalysis",
+        "description": "Analyze a slate of games in one call. Results stream back per game when the request accepts application/x-ndjson or text/event-stream",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "games": {
+                    "type": "array",
+                    "description": f"Game data objects (same fields as getCustomChronulusAnalysis game_data, max {MAX_SLATE_GAMES})",
+                    "items": {"type": "object"},
+                    "maxItems": MAX_SLATE_GAMES
+                },
+                "expert_count": {
+                    "type": "integer",
+                    "description": "Number of AI experts per game (1-5, default: 1)",
+                    "minimum": 1,
+                    "maximum": 5,
+                    "default": 1
+                },
+                "analysis_depth": {
+                    "type": "string",
+                    "description": "Analysis depth: brief, standard, comprehensive",
+                    "enum": ["brief", "standard", "comprehensive"],
+                    "default": "standard"
+                }
+            },
+            "required": ["games"]
+        }
+    },
     {
         "name": "testCustomChronulus",
         "description": "Test custom implementation with Red Sox @ Yankees sample data",
@@ -731,8 +1092,16 @@ AVAILABLE_TOOLS = [
     }
 ]
 
-async def get_custom_chronulus_analysis(game_data: Dict[str, Any], expert_count: int = 5, analysis_depth: str = "standard") -> Dict[str, Any]:
-    """Generate AI expert panel analysis using custom OpenRouter implementation"""
+async def get_custom_chronulus_analysis(
+    game_data: Dict[str, Any],
+    expert_count: int = 5,
+    analysis_depth: str = "standard",
+    on_delta: Optional[Callable[[str, str], Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """Generate AI expert panel analysis using custom OpenRouter implementation
+    
+    on_delta, if given, receives (persona, text) for each streamed completion chunk.
+    """
     
     if not OPENROUTER_API_KEY:
         return {
@@ -773,6 +1142,7 @@ async def get_custom_chronulus_analysis(game_data: Dict[str, Any], expert_count:
         
         # Create predictor
         predictor = CustomBinaryPredictor(session=session, input_type=GameData)
+        predictor.on_delta = on_delta
         predictor.create()
         
         # Generate prediction with requested number of experts
@@ -819,6 +1189,44 @@ async def get_custom_chronulus_analysis(game_data: Dict[str, Any], expert_count:
             "timestamp": now_iso()
         }
 
+async def stream_slate_analysis(games: List[Dict[str, Any]], expert_count: int = 1, analysis_depth: str = "standard") -> AsyncIterator[Dict[str, Any]]:
+    """Analyze games concurrently, yielding each game's result as soon as it finishes"""
+    semaphore = asyncio.Semaphore(SLATE_MAX_CONCURRENT_GAMES)
+    
+    async def analyze(index: int, game_data: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            result = await get_custom_chronulus_analysis(game_data, expert_count, analysis_depth)
+        return {
+            "index": index,
+            "game": f"{game_data.get('away_team', 'Away Team')} @ {game_data.get('home_team', 'Home Team')}",
+            "result": result
+        }
+    
+    tasks = [asyncio.create_task(analyze(i, game)) for i, game in enumerate(games[:MAX_SLATE_GAMES])]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def summarize_slate(game_results: List[Dict[str, Any]], requested: int, started: float) -> Dict[str, Any]:
+    ordered = sorted(game_results, key=lambda item: item["index"])
+    return {
+        "games": ordered,
+        "games_requested": requested,
+        "games_analyzed": sum(1 for item in ordered if item["result"].get("status") == "success"),
+        "elapsed_seconds": round(time.monotonic() - started, 2),
+        "status": "success",
+        "timestamp": now_iso()
+    }
+
+async def get_custom_chronulus_slate_analysis(games: List[Dict[str, Any]], expert_count: int = 1, analysis_depth: str = "standard") -> Dict[str, Any]:
+    """Analyze a slate of games and return all results (non-streaming form of the slate tool)"""
+    started = time.monotonic()
+    game_results = [item async for item in stream_slate_analysis(games, expert_count, analysis_depth)]
+    return summarize_slate(game_results, len(games), started)
+
 async def test_custom_chronulus(expert_count: int = 2) -> Dict[str, Any]:
     """Test custom implementation with Red Sox @ Yankees data"""
     
@@ -847,6 +1255,10 @@ async def get_custom_chronulus_health() -> Dict[str, Any]:
         "timestamp": now_iso(),
         "openrouter_configured": bool(OPENROUTER_API_KEY),
         "model": OPENROUTER_MODEL,
+        "llm_cache": llm_cache.stats(),
+        "llm_budget": llm_budget.stats(),
+        "fallback_models": OPENROUTER_FALLBACK_MODELS,
+        "model_latency": latency_tracker.stats(),
         "status": "unknown"
     }
     
@@ -873,6 +1285,76 @@ async def get_custom_chronulus_health() -> Dict[str, Any]:
     
     return health_data
 
+def stream_frame(event: str, payload: Dict[str, Any], sse: bool) -> str:
+    """One streamed record as an SSE event or an NDJSON line"""
+    if sse:
+        return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+    return json.dumps({"type": event, **payload}) + "\n"
+
+def jsonrpc_result(request_id: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    }
+
+def wants_stream(request: Request) -> Tuple[bool, bool]:
+    """(stream, sse) from the request's Accept header"""
+    accept = request.headers.get("accept", "")
+    sse = "text/event-stream" in accept
+    return sse or "application/x-ndjson" in accept, sse
+
+def stream_analysis_response(request_id: Any, arguments: Dict[str, Any], sse: bool) -> StreamingResponse:
+    """Relay completion text as it is generated, then the JSON-RPC result"""
+    deltas: asyncio.Queue = asyncio.Queue()
+    
+    async def on_delta(persona: str, text: str) -> None:
+        await deltas.put({"persona": persona, "text": text})
+    
+    async def body() -> AsyncIterator[str]:
+        task = asyncio.create_task(get_custom_chronulus_analysis(
+            game_data=arguments.get("game_data", {}),
+            expert_count=arguments.get("expert_count", 2),
+            analysis_depth=arguments.get("analysis_depth", "standard"),
+            on_delta=on_delta
+        ))
+        try:
+            while not task.done() or not deltas.empty():
+                getter = asyncio.ensure_future(deltas.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield stream_frame("delta", getter.result(), sse)
+                else:
+                    getter.cancel()
+            yield stream_frame("result", jsonrpc_result(request_id, task.result()), sse)
+        finally:
+            task.cancel()
+    
+    return StreamingResponse(body(), media_type="text/event-stream" if sse else "application/x-ndjson")
+
+def stream_slate_response(request_id: Any, arguments: Dict[str, Any], sse: bool) -> StreamingResponse:
+    """Stream slate results: one record per finished game, then the JSON-RPC result"""
+    games = arguments.get("games", [])
+    
+    def frame(event: str, payload: Dict[str, Any]) -> str:
+        return stream_frame(event, payload, sse)
+    
+    async def body() -> AsyncIterator[str]:
+        started = time.monotonic()
+        game_results = []
+        async for item in stream_slate_analysis(
+            games,
+            arguments.get("expert_count", 1),
+            arguments.get("analysis_depth", "standard")
+        ):
+            game_results.append(item)
+            yield frame("game", item)
+        
+        summary = summarize_slate(game_results, len(games), started)
+        yield frame("result", jsonrpc_result(request_id, summary))
+    
+    return StreamingResponse(body(), media_type="text/event-stream" if sse else "application/x-ndjson")
+
 # MCP Route Handlers
 async def handle_mcp_request(request: Request) -> Response:
     body = None  # Initialize to avoid unbound variable
@@ -894,12 +1376,24 @@ async def handle_mcp_request(request: Request) -> Response:
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
             
+            stream, sse = wants_stream(request)
+            
             if tool_name == "getCustomChronulusAnalysis":
+                if stream:
+                    return stream_analysis_response(body.get("id"), arguments, sse)
                 result = await get_custom_chronulus_analysis(
                     game_data=arguments.get("game_data", {}),
                     expert_count=arguments.get("expert_count", 2),
                     analysis_depth=arguments.get("analysis_depth", "standard")
                 )
+            elif tool_name == "getCustomChronulusSlateAnalysis":
+                if stream:
+                    return stream_slate_response(body.get("id"), arguments, sse)
+                result = await get_custom_chronulus_slate_analysis(
+                    games=arguments.get("games", []),
+                    expert_count=arguments.get("expert_count", 1),
+                    analysis_depth=arguments.get("analysis_depth", "standard")
+                )
             elif tool_name == "testCustomChronulus":
                 result = await test_custom_chronulus(
                     expert_count=arguments.get("expert_count", 2)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Offline OpenRouter stand-in for load-testing the Custom Chronulus server.
+
+Serves an OpenAI-compatible /api/v1/chat/completions (plain and streamed)
+and /api/v1/models with configurable latency, streaming speed and error
+rates, answering with canned chief-analyst / expert analyses in the format
+the server's prompts ask for. No credits are spent.
+
+Usage:
+    python stub_openrouter.py --port 9090 --latency lognormal:0.8,0.6 --error-rate 0.02
+    OPENROUTER_BASE_URL=http://localhost:9090/api/v1 OPENROUTER_API_KEY=stub python custom_chronulus_mcp_server.py
+
+Latency specs (seconds to first token):
+    fixed:S | uniform:LO,HI | normal:MEAN,SD | lognormal:MEDIAN,SIGMA
+Append "+tail:P,S" to delay a fraction P of requests by an extra S seconds,
+e.g. "lognormal:0.8,0.4+tail:0.05,10". --model-latency MODEL=SPEC overrides
+the latency for one model (useful for exercising hedging and fallbacks).
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import math
+import os
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+AWAY_TEAM_RE = re.compile(r"Away Team:\s*(.+)")
+AWAY_LINE_RE = re.compile(r"(?:Moneylines|Market Lines):\s*Away\s*([+-]?\d+)")
+PERSONA_RE = re.compile(r"You are a ([A-Z]+) specializing")
+PERSONA_SPLIT = re.compile(r"(?=\[[A-Z][A-Z ]+\])")
+
+CHIEF_TEMPLATE = (
+    "[CHIEF ANALYST]\n"
+    "**MARKET BASELINE**: The current moneyline implies approximately {baseline:.1f}% probability for {away}. "
+    "Pricing looks broadly efficient for a game of this profile.\n"
+    "**ANALYTICAL ASSESSMENT**: The records and run differential suggest slightly {direction} odds than the market. "
+    "The edge is modest and sits within normal pricing noise.\n"
+    "**KEY FACTORS FROM DATA**: Recent form and the pitching matchup drive the small adjustment. "
+    "Neither side shows a decisive statistical advantage.\n"
+    "**BASEBALL VARIANCE ACKNOWLEDGMENT**: Single-game variance in baseball is high, so extreme confidence is not warranted.\n"
+    "**DIRECTIONAL ASSESSMENT**: With moderate confidence I put the away team win probability at {probability:.1f}%. "
+    "This is a small edge relative to the market baseline. "
+    "Line movement before first pitch should be monitored."
+)
+EXPERT_TEMPLATE = (
+    "As the {persona} expert, I see {away} as a {lean} side at these prices. "
+    "The records and run differential support a small adjustment to the market baseline of {baseline:.1f}%. "
+    "My confidence is {confidence}% given normal single-game variance. "
+    "The key risk factor is bullpen volatility, which keeps the risk level medium. "
+    "{away} win probability: {probability:.1f}%."
+)
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """Sampler for a latency spec such as "lognormal:0.8,0.5+tail:0.05,10" """
+    base, _, tail = spec.partition("+tail:")
+    kind, _, args = base.partition(":")
+    values = [float(v) for v in args.split(",")] if args else []
+
+    if kind == "fixed":
+        sample = lambda: values[0]
+    elif kind == "uniform":
+        sample = lambda: random.uniform(values[0], values[1])
+    elif kind == "normal":
+        sample = lambda: max(0.0, random.gauss(values[0], values[1]))
+    elif kind == "lognormal":
+        sample = lambda: random.lognormvariate(math.log(values[0]), values[1])
+    else:
+        raise ValueError(f"Unknown latency distribution: {kind}")
+
+    if not tail:
+        return sample
+    tail_rate, tail_delay = (float(v) for v in tail.split(","))
+    return lambda: sample() + (tail_delay if random.random() < tail_rate else 0.0)
+
+
+def load_canned(pattern: Optional[str]) -> Dict[str, List[str]]:
+    """Persona -> saved analysis texts, from blue_jays_marlins_5expert_*.json style files"""
+    canned: Dict[str, List[str]] = {}
+    if not pattern:
+        return canned
+    for path in glob.glob(pattern):
+        with open(path, "r", encoding="utf-8") as f:
+            text = json.load(f).get("analysis", {}).get("expert_analysis", "")
+        for segment in PERSONA_SPLIT.split(text):
+            if segment.startswith("["):
+                persona = segment[1:segment.index("]")].split()[0]
+                canned.setdefault(persona, []).append(segment[segment.index("]") + 1:].strip())
+    return canned
+
+
+def implied_probability(moneyline: int) -> float:
+    return abs(moneyline) / (abs(moneyline) + 100) if moneyline < 0 else 100 / (moneyline + 100)
+
+
+class StubLLM:
+    """Request handling and counters for the stand-in"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.latency = parse_latency(args.latency)
+        self.model_latency = {
+            model: parse_latency(spec)
+            for model, _, spec in (item.partition("=") for item in args.model_latency)
+        }
+        self.tokens_per_second = args.tokens_per_second
+        self.error_rate = args.error_rate
+        self.error_status = args.error_status
+        self.stream_error_rate = args.stream_error_rate
+        self.canned = load_canned(args.canned)
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def compose(self, prompt: str) -> str:
+        away_match = AWAY_TEAM_RE.search(prompt)
+        line_match = AWAY_LINE_RE.search(prompt)
+        away = away_match.group(1).strip() if away_match else "The away team"
+        baseline = implied_probability(int(line_match.group(1))) * 100 if line_match else 50.0
+        probability = min(65.0, max(35.0, baseline + random.uniform(-5, 5)))
+
+        persona_match = PERSONA_RE.search(prompt)
+        if persona_match is None:
+            return CHIEF_TEMPLATE.format(
+                away=away, baseline=baseline, probability=probability,
+                direction="higher" if probability > baseline else "lower"
+            )
+
+        persona = persona_match.group(1)
+        if self.canned.get(persona):
+            return random.choice(self.canned[persona])
+        return EXPERT_TEMPLATE.format(
+            persona=persona.lower(), away=away, baseline=baseline, probability=probability,
+            lean="value" if probability > baseline else "fairly priced",
+            confidence=random.randint(55, 75)
+        )
+
+    def delay(self, model: str) -> float:
+        return self.model_latency.get(model, self.latency)()
+
+    async def completions(self, request: Request) -> Response:
+        body = await request.json()
+        model = body.get("model", "stub")
+        prompt = " ".join(m.get("content", "") for m in body.get("messages", []))
+        self.requests += 1
+
+        if random.random() < self.error_rate:
+            self.errors += 1
+            await asyncio.sleep(self.delay(model) / 4)
+            return Response(
+                json.dumps({"error": {"code": self.error_status, "message": "Stub upstream error"}}),
+                status_code=self.error_status, media_type="application/json"
+            )
+
+        content = self.compose(prompt)
+        if body.get("stream"):
+            return StreamingResponse(self._stream(model, content), media_type="text/event-stream")
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            words = len(content.split())
+            await asyncio.sleep(self.delay(model) + words / self.tokens_per_second)
+        finally:
+            self.in_flight -= 1
+        return Response(json.dumps(self._completion(model, prompt, content)), media_type="application/json")
+
+    async def _stream(self, model: str, content: str) -> AsyncIterator[str]:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield ": OPENROUTER PROCESSING\n\n"
+            await asyncio.sleep(self.delay(model))
+            fail_at = len(content) // 2 if random.random() < self.stream_error_rate else None
+            sent = 0
+            for word in re.findall(r"\S+\s*", content):
+                if fail_at is not None and sent >= fail_at:
+                    self.errors += 1
+                    yield f"data: {json.dumps({'error': {'code': 502, 'message': 'Stub stream interrupted'}})}\n\n"
+                    return
+                chunk = {"id": "stub", "model": model, "choices": [{"index": 0, "delta": {"content": word}}]}
+                yield f"data: {json.dumps(chunk)}\n\n"
+                sent += len(word)
+                await asyncio.sleep(1 / self.tokens_per_second)
+            yield "data: [DONE]\n\n"
+        finally:
+            self.in_flight -= 1
+
+    @staticmethod
+    def _completion(model: str, prompt: str, content: str) -> Dict[str, Any]:
+        return {
+            "id": f"stub-{time.time_ns()}",
+            "object": "chat.completion",
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(content.split())}
+        }
+
+    async def models(self, request: Request) -> Response:
+        return Response(json.dumps({"data": [{"id": "stub"}]}), media_type="application/json")
+
+    async def stats(self, request: Request) -> Response:
+        return Response(json.dumps({
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight
+        }), media_type="application/json")
+
+
+def build_app(args: argparse.Namespace) -> Starlette:
+    stub = StubLLM(args)
+    return Starlette(routes=[
+        Route("/api/v1/chat/completions", stub.completions, methods=["POST"]),
+        Route("/api/v1/models", stub.models, methods=["GET"]),
+        Route("/stats", stub.stats, methods=["GET"])
+    ])
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=int(os.getenv("STUB_PORT", "9090")))
+    parser.add_argument("--latency", default="lognormal:0.8,0.4", help="Time-to-first-token distribution")
+    parser.add_argument("--model-latency", action="append", default=[], metavar="MODEL=SPEC")
+    parser.add_argument("--tokens-per-second", type=float, default=150.0, help="Streaming speed in words/second")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an HTTP error")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--stream-error-rate", type=float, default=0.0, help="Fraction of streams cut off with an error event")
+    parser.add_argument("--canned", default=None, help="Glob of saved analyses to answer expert prompts from")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    print(f"Stub OpenRouter on http://localhost:{args.port}/api/v1 (latency {args.latency})")
+    uvicorn.run(build_app(args), host="0.0.0.0", port=args.port, log_level="warning")
@@ -19,6 +19,8 @@ class SportConfig:
     category_id: Optional[int] = None
     embed_color: int = 0x00ff00
     date_format: str = "%Y-%m-%d"
+    analysis_workers: int = 4  # Games analysed concurrently while building a slate
+    odds_mcp_url: Optional[str] = None
 
 
 class BotConfig:
@@ -26,7 +28,6 @@ class BotConfig:
     
     def __init__(self):
         self.discord_token = os.getenv("DISCORD_TOKEN", "").strip()
-        self.sports = self._load_sports_config()
         
         # Custom Chronulus MCP URL
         self.custom_chronulus_mcp_url = os.getenv("CUSTOM_CHRONULUS_MCP_URL", "https://customchronpredictormcp-production.up.railway.app/mcp")
@@ -34,6 +35,8 @@ class BotConfig:
         # Odds MCP URL
         self.odds_mcp_url = os.getenv("ODDS_MCP_URL", "https://odds-mcp-v2-production.up.railway.app/mcp")
         
+        self.sports = self._load_sports_config()
+        
         if not self.discord_token:
             raise ValueError("DISCORD_TOKEN environment variable is required")
     
@@ -49,7 +52,8 @@ class BotConfig:
                 category_name=os.getenv("SOCCER_CATEGORY_NAME", "SOCCER GAMES"),
                 category_id=self._parse_int_env("SOCCER_CATEGORY_ID", 1407474278374576178),
                 embed_color=0x00ff00,
-                date_format="%d-%m-%Y"  # Soccer uses DD-MM-YYYY
+                date_format="%d-%m-%Y",  # Soccer uses DD-MM-YYYY
+                analysis_workers=self._parse_int_env("SOCCER_ANALYSIS_WORKERS", 10)
             )
         
         # MLB configuration
@@ -60,7 +64,9 @@ class BotConfig:
                 category_name=os.getenv("MLB_CATEGORY_NAME", "MLB GAMES"),
                 category_id=self._parse_int_env("MLB_CATEGORY_ID"),
                 embed_color=0x0066cc,
-                date_format="%Y-%m-%d"  # MLB uses YYYY-MM-DD
+                date_format="%Y-%m-%d",  # MLB uses YYYY-MM-DD
+                analysis_workers=self._parse_int_env("MLB_ANALYSIS_WORKERS", 4),
+                odds_mcp_url=self.odds_mcp_url
             )
         
         return sports
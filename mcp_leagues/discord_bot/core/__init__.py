@@ -4,6 +4,8 @@ Core components for the Discord Sports Bot
 
 from .base_sport_handler import BaseSportHandler, Match, ChannelCreationResult, ClearResult
 from .mcp_client import MCPClient, MCPResponse
+from .send_queue import DiscordSendQueue, send_queue
+from .analysis_cache import AnalysisCache, analysis_cache
 from .sport_manager import SportManager
 from .sync_manager import SyncManager, SyncResult
 # from .command_router import CommandRouter  # Not implemented in this version
@@ -16,6 +18,10 @@ __all__ = [
     'ClearResult',
     'MCPClient',
     'MCPResponse',
+    'DiscordSendQueue',
+    'send_queue',
+    'AnalysisCache',
+    'analysis_cache',
     'SportManager',
     'SyncManager',
     'SyncResult',
@@ -0,0 +1,183 @@
+"""
+Persistent per-game analysis cache backed by SQLite
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Point ANALYSIS_CACHE_PATH at a mounted volume to keep the cache across redeploys
+ANALYSIS_CACHE_PATH = os.getenv(
+    "ANALYSIS_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "analysis_cache.db")
+)
+
+# Seconds each artifact type stays valid
+ARTIFACT_TTLS: Dict[str, float] = {
+    "odds": 5 * 60,
+    "form": 3 * 3600,
+    "props": 30 * 60,
+    "ai": 12 * 3600,
+}
+DEFAULT_TTL = 30 * 60
+
+
+def fingerprint(*inputs: Any) -> str:
+    """
+    Stable hash of the inputs an artifact was built from
+
+    Args:
+        inputs: JSON-serializable values (dict key order does not matter)
+
+    Returns:
+        Hex digest identifying the inputs
+    """
+    encoded = json.dumps(inputs, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """
+    Artifacts keyed by (game id, artifact type, input fingerprint) with per-artifact TTL.
+
+    A changed fingerprint (e.g. the odds moved) misses and replaces the old entry,
+    so each game keeps at most one row per artifact type.
+    """
+
+    def __init__(self, path: str = ANALYSIS_CACHE_PATH, ttls: Optional[Dict[str, float]] = None):
+        """
+        Initialize analysis cache
+
+        Args:
+            path: SQLite database file
+            ttls: Per-artifact TTL overrides
+        """
+        self.path = path
+        self.ttls = dict(ARTIFACT_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts ("
+                " game_id TEXT NOT NULL,"
+                " artifact TEXT NOT NULL,"
+                " fingerprint TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " PRIMARY KEY (game_id, artifact))"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, game_id: str, artifact: str, key: str) -> Optional[Any]:
+        """
+        Cached artifact value, or None if missing, expired or built from other inputs
+
+        Args:
+            game_id: Game identifier
+            artifact: Artifact type (odds, form, props, ai)
+            key: Input fingerprint
+        """
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT value FROM artifacts WHERE game_id = ? AND artifact = ? AND fingerprint = ? AND expires_at > ?",
+                    (str(game_id), artifact, key, time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Analysis cache read failed: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, game_id: str, artifact: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store an artifact value (must be JSON-serializable)
+
+        Args:
+            game_id: Game identifier
+            artifact: Artifact type (odds, form, props, ai)
+            key: Input fingerprint
+            value: Artifact value
+            ttl: Override for the artifact type's TTL
+        """
+        ttl = ttl if ttl is not None else self.ttls.get(artifact, DEFAULT_TTL)
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO artifacts (game_id, artifact, fingerprint, value, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (str(game_id), artifact, key, json.dumps(value, default=str), time.time() + ttl)
+                )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Analysis cache write failed: {e}")
+
+    async def get_or_compute(
+        self,
+        game_id: str,
+        artifact: str,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        refresh: bool = False
+    ) -> Any:
+        """
+        Return the cached artifact or compute and store it
+
+        Empty results (None, {}, []) are returned but not cached, so failed
+        upstream calls are retried on the next build.
+
+        Args:
+            game_id: Game identifier
+            artifact: Artifact type (odds, form, props, ai)
+            key: Input fingerprint
+            compute: Coroutine function producing the artifact value
+            ttl: Override for the artifact type's TTL
+            refresh: Skip the cached value and recompute (the new value replaces it)
+        """
+        if not refresh:
+            cached = self.get(game_id, artifact, key)
+            if cached is not None:
+                return cached
+
+        value = await compute()
+        if value:
+            self.put(game_id, artifact, key, value, ttl)
+        return value
+
+    def purge_expired(self) -> int:
+        """Delete expired rows, returning how many were removed"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                deleted = conn.execute("DELETE FROM artifacts WHERE expires_at <= ?", (time.time(),)).rowcount
+                conn.commit()
+                return deleted
+        except sqlite3.Error as e:
+            logger.warning(f"Analysis cache purge failed: {e}")
+            return 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": self.path, "hits": self.hits, "misses": self.misses}
+
+
+# Global analysis cache shared by every handler
+analysis_cache = AnalysisCache()
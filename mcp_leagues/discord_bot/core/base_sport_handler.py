@@ -1,13 +1,17 @@
 """
 Base sport handler interface that all sport implementations must follow
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import discord
 
 
+DEFAULT_ANALYSIS_WORKERS = 4
+
+
 @dataclass
 class ChannelCreationResult:
     """Result of channel creation operation"""
@@ -61,6 +65,7 @@ class BaseSportHandler(ABC):
         self.mcp_client = mcp_client
         self.category_name = config.get('category_name', f'{sport_name.upper()} GAMES')
         self.category_id = config.get('category_id')
+        self.analysis_workers = max(1, config.get('analysis_workers') or DEFAULT_ANALYSIS_WORKERS)
         
     @abstractmethod
     async def create_channels(self, interaction: discord.Interaction, date: str) -> ChannelCreationResult:
@@ -90,6 +95,21 @@ class BaseSportHandler(ABC):
         """
         pass
     
+    async def refresh_channels(self, interaction: discord.Interaction, date: str) -> ChannelCreationResult:
+        """
+        Bring the sport's channels up to date without clearing them
+        
+        Sports without an incremental refresh only create missing channels.
+        
+        Args:
+            interaction: Discord interaction object
+            date: Date string in YYYY-MM-DD format
+            
+        Returns:
+            ChannelCreationResult with operation details
+        """
+        return await self.create_channels(interaction, date)
+    
     @abstractmethod
     async def get_matches(self, date: str) -> List[Match]:
         """
@@ -145,6 +165,43 @@ class BaseSportHandler(ABC):
             category = await guild.create_category(self.category_name)
         return category
     
+    async def prepare_slate(
+        self,
+        matches: List[Match],
+        prepare: Callable[[Match], Awaitable[Any]]
+    ) -> AsyncIterator[Tuple[Match, Any]]:
+        """
+        Run prepare() for every match concurrently and yield results in slate order
+        
+        At most analysis_workers preparations run at once. Results are yielded as
+        soon as the next match in order is ready, so the caller can post to Discord
+        while later games are still being analysed.
+        
+        Args:
+            matches: Matches in the order they should be published
+            prepare: Coroutine function building the content for one match
+            
+        Yields:
+            (match, result) tuples; if prepare raised, result is the exception
+        """
+        semaphore = asyncio.Semaphore(self.analysis_workers)
+        
+        async def run(match: Match) -> Any:
+            async with semaphore:
+                return await prepare(match)
+        
+        tasks = [asyncio.create_task(run(match)) for match in matches]
+        try:
+            for match, task in zip(matches, tasks):
+                try:
+                    result = await task
+                except Exception as e:
+                    result = e
+                yield match, result
+        finally:
+            for task in tasks:
+                task.cancel()
+    
     def format_channel_name(self, home_team: str, away_team: str, max_length: int = 20) -> str:
         """
         Create standardized channel name from team names
@@ -0,0 +1,177 @@
+"""
+Outbound Discord write queue shared by all sport handlers
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+import discord
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Discord message limits
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+MAX_RATE_LIMIT_RETRIES = 3
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def guild_bucket(guild: discord.Guild) -> str:
+    """Bucket for guild-scoped routes (channel creation)"""
+    return f"guild:{guild.id}"
+
+
+def channel_bucket(channel: discord.abc.Snowflake) -> str:
+    """Bucket for channel-scoped routes (messages, edits, deletes)"""
+    return f"channel:{channel.id}"
+
+
+def chunk_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """
+    Group embeds into as few messages as Discord allows
+
+    Args:
+        embeds: Embeds in display order
+
+    Returns:
+        Batches of at most 10 embeds and 6000 characters each
+    """
+    batches: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    current_chars = 0
+
+    for embed in embeds:
+        size = len(embed)
+        if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE or current_chars + size > MAX_EMBED_CHARS_PER_MESSAGE):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(embed)
+        current_chars += size
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds to wait if error is a rate limit, otherwise None"""
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    if isinstance(error, discord.HTTPException) and error.status == 429:
+        headers = getattr(error.response, 'headers', {}) or {}
+        try:
+            return float(headers.get('Retry-After', DEFAULT_RETRY_AFTER))
+        except (TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER
+    return None
+
+
+class DiscordSendQueue:
+    """
+    Runs outbound Discord writes in per-bucket order at the API's own pace.
+
+    discord.py already tracks each route's X-RateLimit headers and waits when a
+    bucket is exhausted, so no fixed delays are added here. Operations in the
+    same bucket (one guild's channel creation, one channel's messages) run in
+    submission order; different buckets proceed concurrently. A 429 that still
+    reaches us is retried after its Retry-After.
+    """
+
+    def __init__(self, max_retries: int = MAX_RATE_LIMIT_RETRIES):
+        """
+        Initialize send queue
+
+        Args:
+            max_retries: Retries for an operation that hits a rate limit
+        """
+        self.max_retries = max_retries
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.operations = 0
+        self.rate_limited = 0
+
+    async def submit(self, bucket: str, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run operation once every earlier operation in its bucket has finished
+
+        Args:
+            bucket: Rate-limit bucket key (see guild_bucket / channel_bucket)
+            operation: Zero-argument coroutine function performing the API call
+
+        Returns:
+            Result of the operation
+        """
+        lock = self._locks.setdefault(bucket, asyncio.Lock())
+        async with lock:
+            self.operations += 1
+            for attempt in range(self.max_retries + 1):
+                try:
+                    return await operation()
+                except Exception as e:
+                    retry_after = _retry_after(e)
+                    if retry_after is None or attempt == self.max_retries:
+                        raise
+                    self.rate_limited += 1
+                    logger.warning(f"Discord rate limit on {bucket}, retrying in {retry_after:.2f}s")
+                    await asyncio.sleep(retry_after)
+
+    async def create_text_channel(self, category: discord.CategoryChannel, **kwargs: Any) -> discord.TextChannel:
+        """Create a text channel in category"""
+        return await self.submit(guild_bucket(category.guild), lambda: category.create_text_channel(**kwargs))
+
+    async def delete_channel(self, channel: discord.abc.GuildChannel) -> None:
+        """Delete a channel"""
+        await self.submit(channel_bucket(channel), channel.delete)
+
+    async def delete_channels(self, channels: List[discord.abc.GuildChannel]) -> List[Optional[Exception]]:
+        """
+        Delete channels concurrently (each channel is its own bucket)
+
+        Args:
+            channels: Channels to delete
+
+        Returns:
+            Per-channel exception, or None where the delete succeeded
+        """
+        results = await asyncio.gather(
+            *(self.delete_channel(channel) for channel in channels),
+            return_exceptions=True
+        )
+        return [result if isinstance(result, Exception) else None for result in results]
+
+    async def send(self, channel: discord.abc.Messageable, **kwargs: Any) -> discord.Message:
+        """Send a single message"""
+        return await self.submit(channel_bucket(channel), lambda: channel.send(**kwargs))
+
+    async def send_embeds(self, channel: discord.abc.Messageable, embeds: List[discord.Embed]) -> List[discord.Message]:
+        """
+        Send embeds using as few messages as possible
+
+        Args:
+            channel: Destination channel
+            embeds: Embeds in display order
+
+        Returns:
+            Messages sent, one per batch
+        """
+        messages = []
+        for batch in chunk_embeds(embeds):
+            messages.append(await self.send(channel, embeds=batch))
+        return messages
+
+    async def edit(self, message: discord.Message, **kwargs: Any) -> discord.Message:
+        """Edit a message"""
+        return await self.submit(channel_bucket(message.channel), lambda: message.edit(**kwargs))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'buckets': len(self._locks),
+            'operations': self.operations,
+            'rate_limited': self.rate_limited
+        }
+
+
+# Global send queue shared by every handler
+send_queue = DiscordSendQueue()
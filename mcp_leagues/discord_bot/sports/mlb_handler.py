@@ -4,15 +4,74 @@ MLB-specific handler implementing the BaseSportHandler interface
 import asyncio
 import logging
 import json
+import re
+import time
+import unicodedata
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import discord
 
 from core.base_sport_handler import BaseSportHandler, Match, ChannelCreationResult, ClearResult
+from core.send_queue import send_queue, chunk_embeds, channel_bucket
+from core.analysis_cache import analysis_cache, fingerprint
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ODDS_MCP_URL = "https://odds-mcp-v2-production.up.railway.app/mcp"
+
+# Odds fetched outside a channel build (single-game commands) are reused this long
+SLATE_ODDS_TTL_SECONDS = 300
+
+# Posted message ids are kept long enough to refresh a slate throughout its day
+POSTED_MESSAGES_TTL_SECONDS = 2 * 24 * 3600
+
+
+def normalize_team_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation for team name matching"""
+    text = unicodedata.normalize('NFKD', name or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return ' '.join(re.findall(r'[a-z0-9]+', text))
+
+
+class SlateOdds:
+    """
+    getOdds results for one slate, indexed by normalized (away, home) team pair
+    """
+    
+    def __init__(self, games: List[Dict[str, Any]]):
+        self.fetched_at = time.monotonic()
+        self.games: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for game in games or []:
+            key = (normalize_team_name(game.get("away_team", "")), normalize_team_name(game.get("home_team", "")))
+            self.games.setdefault(key, game)
+    
+    def find(self, away_team: str, home_team: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the odds game for a matchup
+        
+        Args:
+            away_team: Away team name as shown by the MLB MCP
+            home_team: Home team name as shown by the MLB MCP
+            
+        Returns:
+            Raw getOdds game dict or None
+        """
+        away = normalize_team_name(away_team)
+        home = normalize_team_name(home_team)
+        game = self.games.get((away, home))
+        if game is not None:
+            return game
+        
+        # Fall back to containment for short names ("Athletics" vs "Oakland Athletics")
+        for (game_away, game_home), candidate in self.games.items():
+            if (away in game_away or game_away in away) and (home in game_home or game_home in home):
+                return candidate
+        return None
+    
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.fetched_at < SLATE_ODDS_TTL_SECONDS
+
 
 class MLBHandler(BaseSportHandler):
     """
@@ -23,6 +82,9 @@ class MLBHandler(BaseSportHandler):
     def __init__(self, sport_name: str, config: Dict[str, Any], mcp_client):
         """Initialize MLB handler with MLB-specific configuration"""
         super().__init__(sport_name, config, mcp_client)
+        self.odds_mcp_url = config.get('odds_mcp_url') or DEFAULT_ODDS_MCP_URL
+        self._slate_odds: Optional[SlateOdds] = None
+        self._slate_odds_lock = asyncio.Lock()
         
     async def create_channels(self, interaction: discord.Interaction, date: str) -> ChannelCreationResult:
         """
@@ -51,37 +113,28 @@ class MLBHandler(BaseSportHandler):
             # Get or create category
             category = await self.create_category(interaction.guild)
             
-            # Create channels
+            # Fetch the slate's odds once; every game's analysis reads from it
+            await self.get_slate_odds(refresh=True)
+            
+            # Skip games that already have a channel before doing any analysis
+            pending = [
+                match for match in matches
+                if not discord.utils.get(category.channels, name=self.format_channel_name(match.home_team, match.away_team))
+            ]
+            
+            # Analyse games concurrently; channels are posted one at a time in schedule order
             created = 0
             errors = []
             total_matches = len(matches)
             
-            for match in matches:
+            async for match, embeds in self.prepare_slate(pending, self._analyse_with_fresh_lines):
                 try:
-                    # Check if channel already exists
-                    channel_name = self.format_channel_name(match.home_team, match.away_team)
-                    if discord.utils.get(category.channels, name=channel_name):
-                        continue
-                    
-                    # Create channel
-                    channel = await category.create_text_channel(
-                        name=channel_name,
-                        topic=f"{match.away_team} @ {match.home_team} - MLB"
-                    )
-                    
-                    # Create and send comprehensive match analysis
-                    embeds = await self.create_comprehensive_game_analysis(match)
-                    
-                    # Send all embeds
-                    for embed in embeds:
-                        await channel.send(embed=embed)
-                        await asyncio.sleep(0.5)  # Rate limit between embeds
+                    if isinstance(embeds, Exception):
+                        raise embeds
                     
+                    await self._publish_game(category, match, embeds)
                     created += 1
                     
-                    # Rate limiting delay
-                    await asyncio.sleep(self.config.get('channel_creation_delay', 1.0))
-                    
                 except Exception as e:
                     error_msg = f"Failed to create channel for {match.away_team} @ {match.home_team}: {str(e)}"
                     errors.append(error_msg)
@@ -105,6 +158,154 @@ class MLBHandler(BaseSportHandler):
                 message=f"Failed to create MLB channels: {str(e)}"
             )
     
+    async def refresh_channels(self, interaction: discord.Interaction, date: str) -> ChannelCreationResult:
+        """
+        Update existing MLB channels in place instead of clearing and recreating them
+        
+        Only messages whose embeds changed are edited; games without a channel
+        get one. Odds and player props are always refetched so a manual refresh
+        never republishes stale lines; artifacts keyed on those inputs (form, AI)
+        are served from the analysis cache while the lines are unchanged.
+        
+        Args:
+            interaction: Discord interaction object
+            date: Date string in YYYY-MM-DD format
+            
+        Returns:
+            ChannelCreationResult with operation details
+        """
+        try:
+            matches = await self.get_matches(date)
+            
+            if not matches:
+                return ChannelCreationResult(
+                    success=True,
+                    channels_created=0,
+                    total_matches=0,
+                    errors=[],
+                    message=f"No MLB games found for {date}"
+                )
+            
+            category = await self.create_category(interaction.guild)
+            await self.get_slate_odds(refresh=True)
+            
+            created = 0
+            updated = 0
+            errors = []
+            total_matches = len(matches)
+            
+            async for match, embeds in self.prepare_slate(matches, self._analyse_with_fresh_lines):
+                try:
+                    if isinstance(embeds, Exception):
+                        raise embeds
+                    
+                    channel_name = self.format_channel_name(match.home_team, match.away_team)
+                    channel = discord.utils.get(category.channels, name=channel_name)
+                    if channel is None:
+                        await self._publish_game(category, match, embeds)
+                        created += 1
+                    elif await self._refresh_game_messages(channel, embeds):
+                        updated += 1
+                    
+                except Exception as e:
+                    error_msg = f"Failed to refresh channel for {match.away_team} @ {match.home_team}: {str(e)}"
+                    errors.append(error_msg)
+                    logger.error(error_msg)
+            
+            unchanged = total_matches - created - updated - len(errors)
+            return ChannelCreationResult(
+                success=True,
+                channels_created=created,
+                total_matches=total_matches,
+                errors=errors,
+                message=f"Refreshed {total_matches} MLB games: {created} new, {updated} updated, {unchanged} unchanged"
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in MLB channel refresh: {e}")
+            return ChannelCreationResult(
+                success=False,
+                channels_created=0,
+                total_matches=0,
+                errors=[str(e)],
+                message=f"Failed to refresh MLB channels: {str(e)}"
+            )
+    
+    async def _publish_game(self, category: discord.CategoryChannel, match: Match, embeds: List[discord.Embed]) -> discord.TextChannel:
+        """Create a game's channel, post its embeds and remember the message ids"""
+        channel = await send_queue.create_text_channel(
+            category,
+            name=self.format_channel_name(match.home_team, match.away_team),
+            topic=f"{match.away_team} @ {match.home_team} - MLB"
+        )
+        
+        # Send all embeds (batched into as few messages as possible)
+        batches = chunk_embeds(embeds)
+        messages = [await send_queue.send(channel, embeds=batch) for batch in batches]
+        self._record_messages(channel, messages, batches)
+        return channel
+    
+    @staticmethod
+    def _batch_fingerprint(batch: List[discord.Embed]) -> str:
+        """Fingerprint of a message's embeds, ignoring their render timestamps"""
+        return fingerprint([
+            {key: value for key, value in embed.to_dict().items() if key != "timestamp"}
+            for embed in batch
+        ])
+    
+    def _record_messages(self, channel: discord.TextChannel, messages: List[discord.Message], batches: List[List[discord.Embed]]):
+        analysis_cache.put(f"channel:{channel.id}", "messages", "posted", {
+            "message_ids": [message.id for message in messages],
+            "batches": [self._batch_fingerprint(batch) for batch in batches]
+        }, ttl=POSTED_MESSAGES_TTL_SECONDS)
+    
+    async def _refresh_game_messages(self, channel: discord.TextChannel, embeds: List[discord.Embed]) -> bool:
+        """
+        Edit a game channel's messages whose embeds changed
+        
+        Args:
+            channel: Existing game channel
+            embeds: Freshly built embeds for the game
+            
+        Returns:
+            True if anything was edited or reposted
+        """
+        batches = chunk_embeds(embeds)
+        keys = [self._batch_fingerprint(batch) for batch in batches]
+        record = analysis_cache.get(f"channel:{channel.id}", "messages", "posted")
+        
+        if record and len(record["message_ids"]) == len(batches):
+            if record["batches"] == keys:
+                return False
+            try:
+                for message_id, old_key, new_key, batch in zip(record["message_ids"], record["batches"], keys, batches):
+                    if old_key != new_key:
+                        await send_queue.edit(channel.get_partial_message(message_id), embeds=batch)
+                record["batches"] = keys
+                analysis_cache.put(f"channel:{channel.id}", "messages", "posted", record, ttl=POSTED_MESSAGES_TTL_SECONDS)
+                return True
+            except discord.NotFound:
+                logger.info(f"Posted message missing in #{channel.name}, reposting")
+        
+        # Layout changed or messages unknown: replace the bot's messages in the channel
+        await self._delete_own_messages(channel, record)
+        messages = [await send_queue.send(channel, embeds=batch) for batch in batches]
+        self._record_messages(channel, messages, batches)
+        return True
+    
+    async def _delete_own_messages(self, channel: discord.TextChannel, record: Optional[Dict[str, Any]]):
+        if record:
+            message_ids = record["message_ids"]
+        else:
+            me = channel.guild.me
+            message_ids = [message.id async for message in channel.history(limit=50) if message.author.id == me.id]
+        
+        for message_id in message_ids:
+            try:
+                await send_queue.submit(channel_bucket(channel), channel.get_partial_message(message_id).delete)
+            except discord.NotFound:
+                pass
+    
     async def clear_channels(self, interaction: discord.Interaction, category_name: str) -> ClearResult:
         """
         Clear all channels from the MLB category
@@ -145,14 +346,12 @@ class MLBHandler(BaseSportHandler):
             deleted_count = 0
             errors = []
             
-            for channel in channels_to_delete:
-                try:
-                    await channel.delete()
+            results = await send_queue.delete_channels(channels_to_delete)
+            for channel, error in zip(channels_to_delete, results):
+                if error is None:
                     deleted_count += 1
-                    await asyncio.sleep(0.5)  # Rate limiting
-                    
-                except Exception as e:
-                    error_msg = f"Failed to delete {channel.name}: {str(e)}"
+                else:
+                    error_msg = f"Failed to delete {channel.name}: {str(error)}"
                     errors.append(error_msg)
                     logger.error(error_msg)
             
@@ -765,139 +964,173 @@ class MLBHandler(BaseSportHandler):
             logger.debug(f"Error parsing spread: {e}")
             return None
     
-    async def get_betting_odds_for_game(self, match: Match) -> Dict[str, str]:
-        """Get betting odds for a specific game and format them"""
+    async def call_odds_mcp_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Helper method to call Odds MCP tools through the shared MCP client"""
         try:
-            import httpx
+            response = await self.mcp_client.call_mcp(self.odds_mcp_url, tool_name, arguments)
             
-            odds_url = "https://odds-mcp-v2-production.up.railway.app/mcp"
+            if not response.success:
+                logger.error(f"Odds MCP tool {tool_name} error: {response.error}")
+                return None
             
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 1,
-                "params": {
-                    "name": "getOdds",
-                    "arguments": {
-                        "sport": "baseball_mlb",
-                        "markets": "h2h,spreads,totals",
-                        "regions": "us"
-                    }
-                }
+            # Odds MCP returns its payload under result.data
+            if isinstance(response.data.get("data"), dict):
+                return response.data["data"]
+            return await self.mcp_client.parse_mcp_content(response)
+            
+        except Exception as e:
+            logger.error(f"Error calling Odds MCP tool {tool_name}: {e}")
+            return None
+    
+    async def get_slate_odds(self, refresh: bool = False) -> SlateOdds:
+        """
+        Get the current slate's MLB odds, fetching them at most once per build
+        
+        Args:
+            refresh: Force a new getOdds call (used at the start of a channel build)
+            
+        Returns:
+            SlateOdds index (empty if the Odds MCP is unavailable)
+        """
+        requested_at = time.monotonic()
+        async with self._slate_odds_lock:
+            current = self._slate_odds
+            # A concurrent caller may have refreshed while we waited for the lock
+            if current is not None and current.is_fresh() and (not refresh or current.fetched_at >= requested_at):
+                return current
+            
+            odds_args = {
+                "sport": "baseball_mlb",
+                "markets": "h2h,spreads,totals",
+                "regions": "us"
             }
+            # A forced refresh must not be answered from the 5-minute cached odds
+            games = await analysis_cache.get_or_compute(
+                "mlb-slate", "odds", fingerprint(odds_args),
+                lambda: self._fetch_slate_odds_games(odds_args),
+                refresh=refresh
+            )
+            self._slate_odds = SlateOdds(games or [])
+            logger.info(f"Loaded MLB slate odds for {len(self._slate_odds.games)} games")
+            return self._slate_odds
+    
+    async def _fetch_slate_odds_games(self, odds_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        data = await self.call_odds_mcp_tool("getOdds", odds_args)
+        return (data or {}).get("odds") or []
+    
+    async def find_game_odds(self, match: Match) -> Optional[Dict[str, Any]]:
+        """Raw getOdds game for a match from the slate odds"""
+        slate_odds = await self.get_slate_odds()
+        return slate_odds.find(match.away_team, match.home_team)
+    
+    async def get_betting_odds_for_game(self, match: Match) -> Dict[str, str]:
+        """Get betting odds for a specific game and format them"""
+        try:
+            target_game = await self.find_game_odds(match)
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(odds_url, json=payload)
-                response.raise_for_status()
-                result = response.json()
-                
-                if "result" not in result or "data" not in result["result"]:
-                    return {}
-                
-                odds_data = result["result"]["data"]["odds"]
-                if not odds_data:
-                    return {}
-                
-                # Find our specific game by team names
-                target_game = None
-                for game in odds_data:
-                    away_team = game.get("away_team", "").lower()
-                    home_team = game.get("home_team", "").lower()
-                    
-                    # Match team names (handle different name formats)
-                    if (match.away_team.lower() in away_team or away_team in match.away_team.lower()) and \
-                       (match.home_team.lower() in home_team or home_team in match.home_team.lower()):
-                        target_game = game
-                        break
-                
-                if not target_game or "bookmakers" not in target_game or not target_game["bookmakers"]:
-                    return {}
-                
-                # Use first bookmaker
-                bookmaker = target_game["bookmakers"][0]
-                formatted_odds = {}
-                
-                # Process each market
-                for market in bookmaker.get("markets", []):
-                    market_key = market.get("key")
-                    
-                    if market_key == "h2h":
-                        # Moneyline
-                        outcomes = market.get("outcomes", [])
-                        if len(outcomes) >= 2:
-                            home_ml = away_ml = "N/A"
-                            for outcome in outcomes:
-                                name = outcome.get("name", "")
-                                price = outcome.get("price")
-                                if isinstance(price, int):
-                                    price_str = f"{price:+d}" if price < 0 else f"+{price}"
-                                else:
-                                    price_str = str(price)
-                                
-                                if match.home_team.lower() in name.lower():
-                                    home_ml = f"{match.home_team} {price_str}"
-                                elif match.away_team.lower() in name.lower():
-                                    away_ml = f"{match.away_team} {price_str}"
+            if not target_game or "bookmakers" not in target_game or not target_game["bookmakers"]:
+                return {}
+            
+            # Use first bookmaker
+            bookmaker = target_game["bookmakers"][0]
+            formatted_odds = {}
+            
+            # Process each market
+            for market in bookmaker.get("markets", []):
+                market_key = market.get("key")
+                
+                if market_key == "h2h":
+                    # Moneyline
+                    outcomes = market.get("outcomes", [])
+                    if len(outcomes) >= 2:
+                        home_ml = away_ml = "N/A"
+                        for outcome in outcomes:
+                            name = outcome.get("name", "")
+                            price = outcome.get("price")
+                            if isinstance(price, int):
+                                price_str = f"{price:+d}" if price < 0 else f"+{price}"
+                            else:
+                                price_str = str(price)
                             
-                            formatted_odds["moneyline"] = f"{home_ml} | {away_ml}"
-                    
-                    elif market_key == "spreads":
-                        # Spread (Run Line)
-                        outcomes = market.get("outcomes", [])
-                        if len(outcomes) >= 2:
-                            home_spread = away_spread = "N/A"
-                            for outcome in outcomes:
-                                name = outcome.get("name", "")
-                                price = outcome.get("price")
-                                point = outcome.get("point", 0)
-                                
-                                price_str = f"({price:+d})" if isinstance(price, int) else f"({price})"
-                                spread_str = f"{point:+g}"
-                                
-                                if match.home_team.lower() in name.lower():
-                                    home_spread = f"{match.home_team} {spread_str} {price_str}"
-                                elif match.away_team.lower() in name.lower():
-                                    away_spread = f"{match.away_team} {spread_str} {price_str}"
+                            if match.home_team.lower() in name.lower():
+                                home_ml = f"{match.home_team} {price_str}"
+                            elif match.away_team.lower() in name.lower():
+                                away_ml = f"{match.away_team} {price_str}"
+                        
+                        formatted_odds["moneyline"] = f"{home_ml} | {away_ml}"
+                
+                elif market_key == "spreads":
+                    # Spread (Run Line)
+                    outcomes = market.get("outcomes", [])
+                    if len(outcomes) >= 2:
+                        home_spread = away_spread = "N/A"
+                        for outcome in outcomes:
+                            name = outcome.get("name", "")
+                            price = outcome.get("price")
+                            point = outcome.get("point", 0)
                             
-                            formatted_odds["spread"] = f"{home_spread} | {away_spread}"
-                    
-                    elif market_key == "totals":
-                        # Over/Under
-                        outcomes = market.get("outcomes", [])
-                        if len(outcomes) >= 2:
-                            over_odds = under_odds = "N/A"
-                            total_points = outcomes[0].get("point", 0) if outcomes else 0
+                            price_str = f"({price:+d})" if isinstance(price, int) else f"({price})"
+                            spread_str = f"{point:+g}"
                             
-                            for outcome in outcomes:
-                                name = outcome.get("name", "")
-                                price = outcome.get("price")
-                                
-                                price_str = f"({price:+d})" if isinstance(price, int) else f"({price})"
-                                
-                                if name.lower() == "over":
-                                    over_odds = price_str
-                                elif name.lower() == "under":
-                                    under_odds = price_str
+                            if match.home_team.lower() in name.lower():
+                                home_spread = f"{match.home_team} {spread_str} {price_str}"
+                            elif match.away_team.lower() in name.lower():
+                                away_spread = f"{match.away_team} {spread_str} {price_str}"
+                        
+                        formatted_odds["spread"] = f"{home_spread} | {away_spread}"
+                
+                elif market_key == "totals":
+                    # Over/Under
+                    outcomes = market.get("outcomes", [])
+                    if len(outcomes) >= 2:
+                        over_odds = under_odds = "N/A"
+                        total_points = outcomes[0].get("point", 0) if outcomes else 0
+                        
+                        for outcome in outcomes:
+                            name = outcome.get("name", "")
+                            price = outcome.get("price")
                             
-                            formatted_odds["total"] = f"O/U {total_points} {over_odds}/{under_odds}"
-                
-                return formatted_odds
-                
+                            price_str = f"({price:+d})" if isinstance(price, int) else f"({price})"
+                            
+                            if name.lower() == "over":
+                                over_odds = price_str
+                            elif name.lower() == "under":
+                                under_odds = price_str
+                        
+                        formatted_odds["total"] = f"O/U {total_points} {over_odds}/{under_odds}"
+            
+            return formatted_odds
+            
         except Exception as e:
             logger.error(f"Error getting betting odds: {e}")
             return {}
     
-    async def create_comprehensive_game_analysis(self, match: Match) -> List[discord.Embed]:
+    async def _analyse_with_fresh_lines(self, match: Match) -> List[discord.Embed]:
+        """Channel builds and refreshes: rebuild the props embed instead of reusing cached lines"""
+        return await self.create_comprehensive_game_analysis(match, refresh=True)
+    
+    async def create_comprehensive_game_analysis(self, match: Match, refresh: bool = False) -> List[discord.Embed]:
         """
         Create streamlined 3-embed analysis:
         1. Comprehensive main embed (betting, team comparison, scoring trends)
         2. Player props + stats embed (with betting lines and performance data)
         3. AI Expert Analysis embed (Custom Chronulus forecasting)
+        
+        Args:
+            match: Game to analyse
+            refresh: Refetch player props instead of using the cached embed
         """
         embeds = []
+        game_id = self._game_cache_id(match)
+        
+        # Real betting odds (from the slate odds) drive both the main embed and Chronulus
+        betting_odds = await self.get_betting_odds_for_game(match)
         
         # 1. New Structured Format Embed (follows exact specification)
-        structured_embed = await self.format_match_analysis_new(match)
+        structured_embed = await self._cached_embed(
+            game_id, "form", fingerprint(game_id, betting_odds),
+            lambda: self.format_match_analysis_new(match)
+        )
         embeds.append(structured_embed)
         
         # Extract team IDs from match data
@@ -908,7 +1141,11 @@ class MLBHandler(BaseSportHandler):
             logger.info(f"Creating player props analysis for {match.away_team} @ {match.home_team}")
             
             # 2. Player Props Analysis Only (keep the important betting data)
-            player_props_embed = await self.create_player_props_embed(match, home_team_id, away_team_id)
+            player_props_embed = await self._cached_embed(
+                game_id, "props", fingerprint(game_id, home_team_id, away_team_id),
+                lambda: self.create_player_props_embed(match, home_team_id, away_team_id),
+                refresh=refresh
+            )
             if player_props_embed:
                 embeds.append(player_props_embed)
                 logger.info(f"Added player props embed for {match.away_team} @ {match.home_team}")
@@ -926,12 +1163,12 @@ class MLBHandler(BaseSportHandler):
         sys.path.append(os.path.dirname(__file__) + "/..")
         from enhanced_chronulus_integration import EnhancedChronulusIntegration
         
-        # Get real betting odds to pass to Chronulus
-        betting_odds = await self.get_betting_odds_for_game(match)
-        
-        # Enhanced: Comprehensive AI analysis with rich game data
+        # Enhanced: Comprehensive AI analysis with rich game data (reused while the odds are unchanged)
         enhanced_integration = EnhancedChronulusIntegration()
-        chronulus_data = await enhanced_integration.call_comprehensive_chronulus_analysis(match, betting_odds)
+        chronulus_data = await analysis_cache.get_or_compute(
+            game_id, "ai", fingerprint(game_id, match.away_team, match.home_team, betting_odds),
+            lambda: enhanced_integration.call_comprehensive_chronulus_analysis(match, betting_odds)
+        )
         
         if chronulus_data:
             # Use enhanced embed creation
@@ -947,6 +1184,31 @@ class MLBHandler(BaseSportHandler):
         logger.info(f"Generated {len(embeds)} embeds (with {'multi-embed AI analysis' if len(embeds) > 3 else 'no AI analysis'}) for {match.away_team} @ {match.home_team}")
         return embeds
     
+    def _game_cache_id(self, match: Match) -> str:
+        """Analysis cache key for a game (gamePk when available)"""
+        return f"mlb:{match.id}" if match.id else f"mlb:{match.away_team}@{match.home_team}"
+    
+    async def _cached_embed(self, game_id: str, artifact: str, key: str, build, refresh: bool = False) -> Optional[discord.Embed]:
+        """
+        Return an embed from the analysis cache, building and storing it on a miss
+        
+        Args:
+            game_id: Analysis cache game key
+            artifact: Artifact type (form, props)
+            key: Input fingerprint
+            build: Coroutine function creating the embed
+            refresh: Rebuild even if a cached embed exists (the new one replaces it)
+        """
+        if not refresh:
+            cached = analysis_cache.get(game_id, artifact, key)
+            if cached is not None:
+                return discord.Embed.from_dict(cached)
+        
+        embed = await build()
+        if embed:
+            analysis_cache.put(game_id, artifact, key, embed.to_dict())
+        return embed
+    
     async def create_team_form_embed(self, match: Match, home_team_id: int, away_team_id: int) -> Optional[discord.Embed]:
         """Create team form comparison using getMLBTeamForm"""
         try:
@@ -1175,150 +1437,107 @@ class MLBHandler(BaseSportHandler):
     async def create_betting_odds_embed(self, match: Match, home_team_id: int, away_team_id: int) -> Optional[discord.Embed]:
         """Create betting odds analysis using Odds MCP v2"""
         try:
-            # Call odds MCP directly for MLB betting lines
-            import httpx
+            target_game = await self.find_game_odds(match)
             
-            odds_url = "https://odds-mcp-v2-production.up.railway.app/mcp"
+            if not target_game:
+                logger.warning(f"No odds found for {match.away_team} @ {match.home_team}")
+                return None
             
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 1,
-                "params": {
-                    "name": "getOdds",
-                    "arguments": {
-                        "sport": "baseball_mlb",
-                        "markets": "h2h,spreads,totals",
-                        "regions": "us"
-                    }
-                }
-            }
+            logger.debug(f"Found odds for {target_game.get('away_team')} @ {target_game.get('home_team')}")
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(odds_url, json=payload)
-                response.raise_for_status()
-                result = response.json()
-                
-                if "result" not in result or "data" not in result["result"]:
-                    logger.warning(f"No odds data returned for MLB")
-                    return None
-                
-                odds_data = result["result"]["data"]["odds"]
-                if not odds_data:
-                    logger.warning(f"No MLB games found with odds")
-                    return None
-                
-                # Find our specific game by team names
-                target_game = None
-                for game in odds_data:
-                    away_team = game.get("away_team", "")
-                    home_team = game.get("home_team", "")
+            # Create betting odds embed
+            embed = discord.Embed(
+                title=f"💰 Betting Odds: {match.away_team} vs {match.home_team}",
+                color=0x00FF00,  # Green color for money/betting
+                timestamp=datetime.now()
+            )
+            
+            if "bookmakers" not in target_game or not target_game["bookmakers"]:
+                embed.add_field(name="❌ No Odds Available", value="Betting lines not available for this game", inline=False)
+                return embed
+            
+            # Use first bookmaker (usually FanDuel)
+            bookmaker = target_game["bookmakers"][0]
+            bookmaker_name = bookmaker.get("title", "Sportsbook")
+            
+            embed.add_field(
+                name="🏪 Sportsbook",
+                value=bookmaker_name,
+                inline=True
+            )
+            
+            # Process each market
+            for market in bookmaker.get("markets", []):
+                market_key = market.get("key")
+                
+                if market_key == "h2h":
+                    # Moneyline
+                    ml_text = ""
+                    for outcome in market.get("outcomes", []):
+                        name = outcome.get("name")
+                        price = outcome.get("price")
+                        if isinstance(price, int):
+                            ml_text += f"**{name}:** {price:+d}\\n"
+                        else:
+                            ml_text += f"**{name}:** {price}\\n"
                     
-                    # Match team names (handle different name formats)
-                    if (match.away_team in away_team or away_team in match.away_team) and \
-                       (match.home_team in home_team or home_team in match.home_team):
-                        target_game = game
-                        break
-                
-                if not target_game:
-                    logger.warning(f"No odds found for {match.away_team} @ {match.home_team}")
-                    return None
-                
-                logger.debug(f"Found odds for {target_game.get('away_team')} @ {target_game.get('home_team')}")
-                
-                # Create betting odds embed
-                embed = discord.Embed(
-                    title=f"💰 Betting Odds: {match.away_team} vs {match.home_team}",
-                    color=0x00FF00,  # Green color for money/betting
-                    timestamp=datetime.now()
-                )
-                
-                if "bookmakers" not in target_game or not target_game["bookmakers"]:
-                    embed.add_field(name="❌ No Odds Available", value="Betting lines not available for this game", inline=False)
-                    return embed
-                
-                # Use first bookmaker (usually FanDuel)
-                bookmaker = target_game["bookmakers"][0]
-                bookmaker_name = bookmaker.get("title", "Sportsbook")
-                
-                embed.add_field(
-                    name="🏪 Sportsbook",
-                    value=bookmaker_name,
-                    inline=True
-                )
+                    if ml_text:
+                        embed.add_field(
+                            name="💵 Moneyline (ML)",
+                            value=ml_text.strip(),
+                            inline=True
+                        )
                 
-                # Process each market
-                for market in bookmaker.get("markets", []):
-                    market_key = market.get("key")
-                    
-                    if market_key == "h2h":
-                        # Moneyline
-                        ml_text = ""
-                        for outcome in market.get("outcomes", []):
-                            name = outcome.get("name")
-                            price = outcome.get("price")
-                            if isinstance(price, int):
-                                ml_text += f"**{name}:** {price:+d}\\n"
-                            else:
-                                ml_text += f"**{name}:** {price}\\n"
+                elif market_key == "spreads":
+                    # Run Line
+                    spread_text = ""
+                    for outcome in market.get("outcomes", []):
+                        name = outcome.get("name")
+                        price = outcome.get("price")
+                        point = outcome.get("point", 0)
                         
-                        if ml_text:
-                            embed.add_field(
-                                name="💵 Moneyline (ML)",
-                                value=ml_text.strip(),
-                                inline=True
-                            )
+                        if isinstance(price, int):
+                            spread_text += f"**{name} ({point:+g}):** {price:+d}\\n"
+                        else:
+                            spread_text += f"**{name} ({point:+g}):** {price}\\n"
                     
-                    elif market_key == "spreads":
-                        # Run Line
-                        spread_text = ""
-                        for outcome in market.get("outcomes", []):
-                            name = outcome.get("name")
-                            price = outcome.get("price")
-                            point = outcome.get("point", 0)
-                            
-                            if isinstance(price, int):
-                                spread_text += f"**{name} ({point:+g}):** {price:+d}\\n"
-                            else:
-                                spread_text += f"**{name} ({point:+g}):** {price}\\n"
+                    if spread_text:
+                        embed.add_field(
+                            name="📊 Run Line (RL)",
+                            value=spread_text.strip(),
+                            inline=True
+                        )
+                
+                elif market_key == "totals":
+                    # Over/Under
+                    total_text = ""
+                    for outcome in market.get("outcomes", []):
+                        name = outcome.get("name")
+                        price = outcome.get("price")
+                        point = outcome.get("point", 0)
                         
-                        if spread_text:
-                            embed.add_field(
-                                name="📊 Run Line (RL)",
-                                value=spread_text.strip(),
-                                inline=True
-                            )
+                        if isinstance(price, int):
+                            total_text += f"**{name} {point}:** {price:+d}\\n"
+                        else:
+                            total_text += f"**{name} {point}:** {price}\\n"
                     
-                    elif market_key == "totals":
-                        # Over/Under
-                        total_text = ""
-                        for outcome in market.get("outcomes", []):
-                            name = outcome.get("name")
-                            price = outcome.get("price")
-                            point = outcome.get("point", 0)
-                            
-                            if isinstance(price, int):
-                                total_text += f"**{name} {point}:** {price:+d}\\n"
-                            else:
-                                total_text += f"**{name} {point}:** {price}\\n"
-                        
-                        if total_text:
-                            embed.add_field(
-                                name="🎯 Total (O/U)",
-                                value=total_text.strip(),
-                                inline=True
-                            )
-                
-                # Add betting notes
-                embed.add_field(
-                    name="📝 Betting Notes",
-                    value="American odds format (+/-)\nNegative = Favorite, Positive = Underdog\nLines subject to change",
-                    inline=False
-                )
-                
-                embed.set_footer(text=f"Betting Odds • Powered by {bookmaker_name}")
-                return embed
-                
+                    if total_text:
+                        embed.add_field(
+                            name="🎯 Total (O/U)",
+                            value=total_text.strip(),
+                            inline=True
+                        )
+            
+            # Add betting notes
+            embed.add_field(
+                name="📝 Betting Notes",
+                value="American odds format (+/-)\nNegative = Favorite, Positive = Underdog\nLines subject to change",
+                inline=False
+            )
+            
+            embed.set_footer(text=f"Betting Odds • Powered by {bookmaker_name}")
+            return embed
+            
         except Exception as e:
             logger.error(f"Error creating betting odds embed: {e}")
             return None
@@ -1330,174 +1549,140 @@ class MLBHandler(BaseSportHandler):
         for perfect alignment, with de-cluttered lines and contextual headers.
         """
         try:
-            import httpx
+            # Step 1: The odds game id is the event id for this specific game
+            target_event = await self.find_game_odds(match)
+            
+            if not target_event: return None
+            event_id = target_event["id"]
+            
+            # Step 2: Get player props data
+            target_markets = ["batter_hits", "batter_home_runs", "pitcher_strikeouts"]
+            player_props_data = {}
+            for market in target_markets:
+                props_data = await self.call_odds_mcp_tool("getEventOdds", {"sport": "baseball_mlb", "event_id": event_id, "markets": market})
+                if props_data and "event" in props_data:
+                    event_data = props_data["event"]
+                    if "bookmakers" in event_data and event_data["bookmakers"]:
+                        bookmaker = event_data["bookmakers"][0]
+                        for market_data in bookmaker.get("markets", []):
+                            if market_data.get("key") == market:
+                                player_props_data[market] = market_data["outcomes"]
+                                break
             
-            odds_url = "https://odds-mcp-v2-production.up.railway.app/mcp"
+            all_player_names = {outcome.get("description", "") for market_data in player_props_data.values() for outcome in market_data if outcome.get("name") == "Over" and outcome.get("description")}
+            player_stats = await self.get_player_stats_by_names(list(all_player_names), home_team_id, away_team_id)
             
-            # Step 1: Get event ID for this specific game
-            events_payload = {
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 1,
-                "params": {
-                    "name": "getEvents",
-                    "arguments": {"sport": "baseball_mlb"}
-                }
-            }
+            embed = discord.Embed(
+                title=f"Player Props + Stats • {match.away_team} @ {match.home_team}",
+                description="Live betting markets with recent player performance.",
+                color=0x1E88E5,
+                timestamp=datetime.now()
+            )
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                events_response = await client.post(odds_url, json=events_payload)
-                events_response.raise_for_status()
-                events_result = events_response.json()
-                
-                if "result" not in events_result or "data" not in events_result["result"]:
-                    return None
+            # Field Group 1: Player Hits (3 inline columns)
+            if "batter_hits" in player_props_data:
+                names, odds, stats_list = [], [], []
+                processed_players = set()
                 
-                events = events_result["result"]["data"]["events"]
-                
-                target_event = None
-                for event in events:
-                    home_team = event.get("home_team", "").lower()
-                    away_team = event.get("away_team", "").lower()
-                    if (match.home_team.lower() in home_team or home_team in match.home_team.lower()) and \
-                       (match.away_team.lower() in away_team or away_team in match.away_team.lower()):
-                        target_event = event
-                        break
-                
-                if not target_event: return None
-                event_id = target_event["id"]
-                
-                # Step 2: Get player props data
-                target_markets = ["batter_hits", "batter_home_runs", "pitcher_strikeouts"]
-                player_props_data = {}
-                for market in target_markets:
-                    props_payload = { "jsonrpc": "2.0", "method": "tools/call", "id": 1, "params": { "name": "getEventOdds", "arguments": { "sport": "baseball_mlb", "event_id": event_id, "markets": market } } }
-                    props_response = await client.post(odds_url, json=props_payload)
-                    props_response.raise_for_status()
-                    props_result = props_response.json()
-                    if "result" in props_result and "data" in props_result["result"]:
-                        event_data = props_result["result"]["data"]["event"]
-                        if "bookmakers" in event_data and event_data["bookmakers"]:
-                            bookmaker = event_data["bookmakers"][0]
-                            for market_data in bookmaker.get("markets", []):
-                                if market_data.get("key") == market:
-                                    player_props_data[market] = market_data["outcomes"]
-                                    break
-                
-                all_player_names = {outcome.get("description", "") for market_data in player_props_data.values() for outcome in market_data if outcome.get("name") == "Over" and outcome.get("description")}
-                player_stats = await self.get_player_stats_by_names(list(all_player_names), home_team_id, away_team_id)
-                
-                embed = discord.Embed(
-                    title=f"Player Props + Stats • {match.away_team} @ {match.home_team}",
-                    description="Live betting markets with recent player performance.",
-                    color=0x1E88E5,
-                    timestamp=datetime.now()
-                )
-                
-                # Field Group 1: Player Hits (3 inline columns)
-                if "batter_hits" in player_props_data:
-                    names, odds, stats_list = [], [], []
-                    processed_players = set()
-                    
-                    for outcome in player_props_data["batter_hits"]:
-                        if outcome.get("name") == "Over" and outcome.get("point", 0) == 0.5:
-                            player_name = outcome.get("description", "")
-                            if player_name and player_name not in processed_players:
-                                processed_players.add(player_name)
-                                price = outcome.get("price")
-                                odds_str = f"{price:+d}" if isinstance(price, int) else str(price)
-
-                                avg_hits, streak_info, emoji = 0.0, "--", ""
-                                if player_name in player_stats:
-                                    p_stats = player_stats[player_name]
-                                    avg_hits = p_stats.get("avg_hits", 0.0)
-                                    hit_streak = p_stats.get("hit_streak", 0)
-                                    if avg_hits >= 1.5: emoji = "🔥"
-                                    elif avg_hits >= 1.2: emoji = "⚡"
-                                    streak_info = f"{hit_streak}G" if hit_streak > 0 else "--"
-                                
-                                names.append(f"**{player_name}**{emoji}")
-                                odds.append(f"`{odds_str}`")
-                                
-                                # SUGGESTION 1: Conditional stats string
-                                stat_str = f"`{avg_hits:.1f}` H/G"
-                                if streak_info != "--":
-                                    stat_str += f" | `{streak_info}`"
-                                stats_list.append(stat_str)
-                                
-                                if len(processed_players) >= 10: break
-                    
-                    if names:
-                        embed.add_field(name="🏃 Player Hits (O/U 0.5)", value="\n".join(names), inline=True)
-                        embed.add_field(name="Odds", value="\n".join(odds), inline=True)
-                        embed.add_field(name="Stats", value="\n".join(stats_list), inline=True)
+                for outcome in player_props_data["batter_hits"]:
+                    if outcome.get("name") == "Over" and outcome.get("point", 0) == 0.5:
+                        player_name = outcome.get("description", "")
+                        if player_name and player_name not in processed_players:
+                            processed_players.add(player_name)
+                            price = outcome.get("price")
+                            odds_str = f"{price:+d}" if isinstance(price, int) else str(price)
 
-                # Field Group 2 & 3 Combined: Home Runs and Pitcher Strikeouts (2 inline columns)
-                hr_and_k_names = []
-                hr_and_k_stats = []
+                            avg_hits, streak_info, emoji = 0.0, "--", ""
+                            if player_name in player_stats:
+                                p_stats = player_stats[player_name]
+                                avg_hits = p_stats.get("avg_hits", 0.0)
+                                hit_streak = p_stats.get("hit_streak", 0)
+                                if avg_hits >= 1.5: emoji = "🔥"
+                                elif avg_hits >= 1.2: emoji = "⚡"
+                                streak_info = f"{hit_streak}G" if hit_streak > 0 else "--"
+                            
+                            names.append(f"**{player_name}**{emoji}")
+                            odds.append(f"`{odds_str}`")
+                            
+                            # SUGGESTION 1: Conditional stats string
+                            stat_str = f"`{avg_hits:.1f}` H/G"
+                            if streak_info != "--":
+                                stat_str += f" | `{streak_info}`"
+                            stats_list.append(stat_str)
+                            
+                            if len(processed_players) >= 10: break
                 
-                if "batter_home_runs" in player_props_data:
-                    hr_and_k_names.append("**__Home Runs (O/U 0.5)__**")
-                    processed_players = set()
-                    
-                    for outcome in player_props_data["batter_home_runs"]:
-                        if outcome.get("name") == "Over" and outcome.get("point", 0) == 0.5:
-                            player_name = outcome.get("description", "")
-                            if player_name and player_name not in processed_players:
-                                processed_players.add(player_name)
-                                price = outcome.get("price")
-                                odds_str = f"{price:+d}" if isinstance(price, int) else str(price)
+                if names:
+                    embed.add_field(name="🏃 Player Hits (O/U 0.5)", value="\n".join(names), inline=True)
+                    embed.add_field(name="Odds", value="\n".join(odds), inline=True)
+                    embed.add_field(name="Stats", value="\n".join(stats_list), inline=True)
 
-                                recent_hrs, emoji = 0, ""
-                                if player_name in player_stats:
-                                    recent_hrs = player_stats[player_name].get("recent_hrs", 0)
-                                    if recent_hrs >= 2: emoji = "🔥"
-                                
-                                hr_and_k_names.append(f"**{player_name}**{emoji}")
-                                hr_and_k_stats.append(f"`{odds_str}` | L5: `{recent_hrs} HR`")
+            # Field Group 2 & 3 Combined: Home Runs and Pitcher Strikeouts (2 inline columns)
+            hr_and_k_names = []
+            hr_and_k_stats = []
+            
+            if "batter_home_runs" in player_props_data:
+                hr_and_k_names.append("**__Home Runs (O/U 0.5)__**")
+                processed_players = set()
+                
+                for outcome in player_props_data["batter_home_runs"]:
+                    if outcome.get("name") == "Over" and outcome.get("point", 0) == 0.5:
+                        player_name = outcome.get("description", "")
+                        if player_name and player_name not in processed_players:
+                            processed_players.add(player_name)
+                            price = outcome.get("price")
+                            odds_str = f"{price:+d}" if isinstance(price, int) else str(price)
 
-                                if len(processed_players) >= 10: break
-                
-                if "pitcher_strikeouts" in player_props_data:
-                    if hr_and_k_names:
-                        hr_and_k_names.append("\u200B")
-                        hr_and_k_stats.insert(0, "**__Odds / L5 Stats__**") # Add header for HR stats
-                        hr_and_k_stats.append("\u200B")
+                            recent_hrs, emoji = 0, ""
+                            if player_name in player_stats:
+                                recent_hrs = player_stats[player_name].get("recent_hrs", 0)
+                                if recent_hrs >= 2: emoji = "🔥"
+                            
+                            hr_and_k_names.append(f"**{player_name}**{emoji}")
+                            hr_and_k_stats.append(f"`{odds_str}` | L5: `{recent_hrs} HR`")
 
-                    hr_and_k_names.append("**__Pitcher Strikeouts__**")
-                    hr_and_k_stats.append("**__Line / Odds__**")
-                    processed_players = set()
-                    
-                    for outcome in player_props_data["pitcher_strikeouts"]:
-                        if outcome.get("name") == "Over":
-                            player_name = outcome.get("description", "")
-                            if player_name and player_name not in processed_players:
-                                processed_players.add(player_name)
-                                point = outcome.get("point", 0)
-                                price = outcome.get("price")
-                                odds_str = f"{price:+d}" if isinstance(price, int) else str(price)
-                                
-                                hr_and_k_names.append(f"**{player_name}**")
-                                hr_and_k_stats.append(f"`O{point:.1f} {odds_str}`")
-                                
-                                if len(processed_players) >= 6: break
-                
+                            if len(processed_players) >= 10: break
+            
+            if "pitcher_strikeouts" in player_props_data:
                 if hr_and_k_names:
-                    # SUGGESTION 2: More contextual headers
-                    embed.add_field(name="⚾ Home Runs / 🔥 Pitchers", value="\n".join(hr_and_k_names), inline=True)
-                    embed.add_field(name="Odds / Stats", value="\n".join(hr_and_k_stats), inline=True)
+                    hr_and_k_names.append("\u200B")
+                    hr_and_k_stats.insert(0, "**__Odds / L5 Stats__**") # Add header for HR stats
+                    hr_and_k_stats.append("\u200B")
 
-                # Final Info Field
-                # REQUEST 1: Removed "Betting" line
-                info_text = "• **Stats:** H/G = Hits per game, L5 = Last 5 games\n"
-                info_text += "• Lines subject to change"
-                embed.add_field(name="ℹ️ Player Props + Stats Info", value=info_text, inline=False)
-                
-                # REQUEST 2: Updated footer text
-                embed.set_footer(text="Foster's Sports Bot • Player Props")
-                
-                return embed
-                
+                hr_and_k_names.append("**__Pitcher Strikeouts__**")
+                hr_and_k_stats.append("**__Line / Odds__**")
+                processed_players = set()
+                
+                for outcome in player_props_data["pitcher_strikeouts"]:
+                    if outcome.get("name") == "Over":
+                        player_name = outcome.get("description", "")
+                        if player_name and player_name not in processed_players:
+                            processed_players.add(player_name)
+                            point = outcome.get("point", 0)
+                            price = outcome.get("price")
+                            odds_str = f"{price:+d}" if isinstance(price, int) else str(price)
+                            
+                            hr_and_k_names.append(f"**{player_name}**")
+                            hr_and_k_stats.append(f"`O{point:.1f} {odds_str}`")
+                            
+                            if len(processed_players) >= 6: break
+            
+            if hr_and_k_names:
+                # SUGGESTION 2: More contextual headers
+                embed.add_field(name="⚾ Home Runs / 🔥 Pitchers", value="\n".join(hr_and_k_names), inline=True)
+                embed.add_field(name="Odds / Stats", value="\n".join(hr_and_k_stats), inline=True)
+
+            # Final Info Field
+            # REQUEST 1: Removed "Betting" line
+            info_text = "• **Stats:** H/G = Hits per game, L5 = Last 5 games\n"
+            info_text += "• Lines subject to change"
+            embed.add_field(name="ℹ️ Player Props + Stats Info", value=info_text, inline=False)
+            
+            # REQUEST 2: Updated footer text
+            embed.set_footer(text="Foster's Sports Bot • Player Props")
+            
+            return embed
+            
         except Exception as e:
             logger.error(f"Error creating player props embed: {e}")
             return None
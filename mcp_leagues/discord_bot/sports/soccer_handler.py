@@ -9,11 +9,15 @@ from typing import List, Dict, Any, Optional
 import discord
 
 from core.base_sport_handler import BaseSportHandler, Match, ChannelCreationResult, ClearResult
+from core.send_queue import send_queue
 # Removed formatter import - all formatting back in this file
 
 
 logger = logging.getLogger(__name__)
 
+# Per-call limit for each analysis tool; a slow call drops its section instead of the whole embed
+ANALYSIS_CALL_TIMEOUT = 45.0
+
 
 class SoccerHandler(BaseSportHandler):
     """
@@ -25,6 +29,7 @@ class SoccerHandler(BaseSportHandler):
         """Initialize soccer handler with soccer-specific configuration"""
         super().__init__(sport_name, config, mcp_client)
         self.default_league_id = config.get('default_league_id', 297)  # La Liga default
+        self.analysis_call_timeout = config.get('analysis_call_timeout', ANALYSIS_CALL_TIMEOUT)
 # Removed formatter - all methods back in this class
         
     async def create_channels(self, interaction: discord.Interaction, date: str) -> ChannelCreationResult:
@@ -59,31 +64,28 @@ class SoccerHandler(BaseSportHandler):
             errors = []
             total_matches = len(matches)
             
-            for match in matches:
+            # Skip matches that already have a channel before doing any analysis
+            pending = [
+                match for match in matches
+                if not discord.utils.get(category.channels, name=self.format_channel_name(match.home_team, match.away_team))
+            ]
+            
+            # Analyse matches concurrently; channels are posted one at a time in fixture order
+            async for match, embed in self.prepare_slate(pending, self._build_match_embed):
                 try:
-                    # Check if channel already exists
-                    channel_name = self.format_channel_name(match.home_team, match.away_team)
-                    if discord.utils.get(category.channels, name=channel_name):
-                        continue
+                    if isinstance(embed, Exception):
+                        raise embed
                     
                     # Create channel
-                    channel = await category.create_text_channel(
-                        name=channel_name,
+                    channel = await send_queue.create_text_channel(
+                        category,
+                        name=self.format_channel_name(match.home_team, match.away_team),
                         topic=f"{match.away_team} vs {match.home_team} - {match.league}"
                     )
                     
-                    # Create and send initial embed
-                    initial_embed = self._create_loading_embed(match)
-                    message = await channel.send(embed=initial_embed)
-                    
-                    # Get comprehensive analysis and update embed
-                    await self._update_channel_with_analysis(message, match)
-                    
+                    await send_queue.send(channel, embed=embed)
                     created += 1
                     
-                    # Rate limiting delay
-                    await asyncio.sleep(self.config.get('channel_creation_delay', 1.0))
-                    
                 except Exception as e:
                     error_msg = f"Failed to create channel for {match.away_team} vs {match.home_team}: {str(e)}"
                     errors.append(error_msg)
@@ -147,14 +149,12 @@ class SoccerHandler(BaseSportHandler):
             deleted_count = 0
             errors = []
             
-            for channel in channels_to_delete:
-                try:
-                    await channel.delete()
+            results = await send_queue.delete_channels(channels_to_delete)
+            for channel, error in zip(channels_to_delete, results):
+                if error is None:
                     deleted_count += 1
-                    await asyncio.sleep(0.5)  # Rate limiting
-                    
-                except Exception as e:
-                    error_msg = f"Failed to delete {channel.name}: {str(e)}"
+                else:
+                    error_msg = f"Failed to delete {channel.name}: {str(error)}"
                     errors.append(error_msg)
                     logger.error(error_msg)
             
@@ -279,32 +279,15 @@ class SoccerHandler(BaseSportHandler):
     
     # All formatting methods are included in this class for simplicity
     
-    def _create_loading_embed(self, match: Match) -> discord.Embed:
-        """Create initial loading embed for a match"""
-        embed = discord.Embed(
-            title=f"⚽ {match.away_team} vs {match.home_team}",
-            description=f"**{match.league}**\n🔄 Loading comprehensive analysis...",
-            color=self.config.get('embed_color', 0x00ff00),
-            timestamp=datetime.now()
-        )
-        
-        match_time = match.additional_data.get('time', 'TBD')
-        embed.add_field(name="⏰ Time", value=match_time, inline=True)
-        embed.set_footer(text="Soccer Analysis")
-        
-        return embed
-    
-    async def _update_channel_with_analysis(self, message: discord.Message, match: Match):
-        """Update channel message with comprehensive analysis"""
+    async def _build_match_embed(self, match: Match) -> discord.Embed:
+        """Build the comprehensive analysis embed for a match (sections that fail are left out)"""
         try:
             home_id = match.additional_data.get('home_id')
             away_id = match.additional_data.get('away_id')
             
             if not home_id or not away_id:
-                # Update with basic info only
-                embed = await self.format_match_analysis(match)
-                await message.edit(embed=embed)
-                return
+                # Basic info only
+                return await self.format_match_analysis(match)
             
             # Get comprehensive analysis with match date
             match_date = match.additional_data.get('date', datetime.now().strftime("%d-%m-%Y"))
@@ -319,79 +302,84 @@ class SoccerHandler(BaseSportHandler):
                 match, h2h_data, home_form_data, away_form_data, match_analysis_data
             )
             
-            # Update the message
-            await message.edit(embed=embed)
+            # Sections whose call failed, timed out or returned an error are left out of the embed
+            missing = [
+                name for name, data in (
+                    ("H2H", h2h_data), ("Home form", home_form_data), ("Away form", away_form_data),
+                    ("Match betting", match_analysis_data)
+                )
+                if data is None or "error" in data
+            ]
+            if missing:
+                embed.add_field(name="⏳ Partial Analysis", value=f"Unavailable: {', '.join(missing)}", inline=False)
+            return embed
             
         except Exception as e:
-            logger.error(f"Error updating channel with analysis: {e}")
+            logger.error(f"Error building match analysis: {e}")
             # Fallback to basic embed
-            try:
-                embed = await self.format_match_analysis(match)
-                embed.add_field(name="📊 Analysis", value="Analysis failed to load", inline=False)
-                await message.edit(embed=embed)
-            except Exception as fallback_error:
-                logger.error(f"Fallback embed update failed: {fallback_error}")
+            embed = await self.format_match_analysis(match)
+            embed.add_field(name="📊 Analysis", value="Analysis failed to load", inline=False)
+            return embed
+    
+    async def _call_analysis_tool(self, tool: str, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Call one soccer MCP analysis tool, returning None on error or timeout"""
+        try:
+            response = await asyncio.wait_for(
+                self.mcp_client.call_mcp(self.config['mcp_url'], tool, args),
+                timeout=self.analysis_call_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Soccer MCP {tool} timed out after {self.analysis_call_timeout}s")
+            return None
+        
+        if not response.success:
+            return None
+        return await self.mcp_client.parse_mcp_content(response)
     
     async def _get_comprehensive_analysis(self, home_id: str, away_id: str, home_team: str, away_team: str, league_id: int, match_date: str = None):
         """Get H2H, form analysis, and comprehensive match betting analysis for both teams"""
         try:
-            # Get H2H analysis
-            h2h_response = await self.mcp_client.call_mcp(
-                self.config['mcp_url'],
-                "get_h2h_betting_analysis",
-                {
+            calls = [
+                # H2H analysis
+                self._call_analysis_tool("get_h2h_betting_analysis", {
                     "team_1_id": home_id,
                     "team_2_id": away_id,
                     "team_1_name": home_team,
-                    "team_2_name": away_team
-                }
-            )
-            
-            # Get home team form
-            home_form_response = await self.mcp_client.call_mcp(
-                self.config['mcp_url'],
-                "get_team_form_analysis",
-                {
+                    "team_2_name": away_team,
+                    "league_id": league_id
+                }),
+                # Home team form
+                self._call_analysis_tool("get_team_form_analysis", {
                     "team_id": home_id,
                     "team_name": home_team,
                     "league_id": league_id
-                }
-            )
-            
-            # Get away team form
-            away_form_response = await self.mcp_client.call_mcp(
-                self.config['mcp_url'],
-                "get_team_form_analysis",
-                {
+                }),
+                # Away team form
+                self._call_analysis_tool("get_team_form_analysis", {
                     "team_id": away_id,
                     "team_name": away_team,
                     "league_id": league_id
-                }
-            )
+                })
+            ]
             
-            # Get comprehensive match betting analysis
-            match_analysis_response = None
+            # Comprehensive match betting analysis
             if match_date:
                 # Map league_id to league code for the MCP call
                 league_map = {228: "EPL", 297: "La Liga", 168: "MLS"}
                 league_code = league_map.get(league_id, "EPL")
                 
-                match_analysis_response = await self.mcp_client.call_mcp(
-                    self.config['mcp_url'],
-                    "analyze_match_betting",
-                    {
-                        "home_team": home_team,
-                        "away_team": away_team,
-                        "league": league_code,
-                        "match_date": match_date
-                    }
-                )
-            
-            # Parse responses
-            h2h_data = await self.mcp_client.parse_mcp_content(h2h_response) if h2h_response.success else None
-            home_form_data = await self.mcp_client.parse_mcp_content(home_form_response) if home_form_response.success else None
-            away_form_data = await self.mcp_client.parse_mcp_content(away_form_response) if away_form_response.success else None
-            match_analysis_data = await self.mcp_client.parse_mcp_content(match_analysis_response) if match_analysis_response and match_analysis_response.success else None
+                calls.append(self._call_analysis_tool("analyze_match_betting", {
+                    "home_team": home_team,
+                    "away_team": away_team,
+                    "league": league_code,
+                    "match_date": match_date
+                }))
+            
+            # Run all calls at once; each one that fails or times out comes back as None
+            results = await asyncio.gather(*calls, return_exceptions=True)
+            results = [None if isinstance(result, Exception) else result for result in results]
+            h2h_data, home_form_data, away_form_data = results[:3]
+            match_analysis_data = results[3] if len(results) > 3 else None
             
             return h2h_data, home_form_data, away_form_data, match_analysis_data
             
@@ -217,6 +217,67 @@ async def create_channels(interaction: discord.Interaction, sport: app_commands.
         await interaction.followup.send(embed=embed)
 
 
+@bot.tree.command(name="refresh-channels", description="Update existing game channels in place for selected sport")
+@app_commands.describe(sport="Choose a sport")
+@app_commands.choices(sport=[
+    app_commands.Choice(name="Soccer", value="soccer"),
+    app_commands.Choice(name="MLB", value="mlb"),
+])
+async def refresh_channels(interaction: discord.Interaction, sport: app_commands.Choice[str]):
+    """Refresh today's channels, editing only messages whose analysis changed"""
+    await interaction.response.defer()
+    
+    try:
+        # Get sport handler
+        handler = bot.sport_manager.get_sport_handler(sport.value)
+        if not handler:
+            embed = discord.Embed(
+                title="❌ Sport Not Available",
+                description=f"Sport `{sport.value}` is not available or not configured.",
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
+        
+        # Validate permissions
+        if not handler.validate_permissions(interaction):
+            embed = discord.Embed(
+                title="❌ Insufficient Permissions",
+                description="You need `Manage Channels` permission to use this command.",
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
+        
+        today = datetime.now().strftime("%Y-%m-%d")
+        logger.info(f"Refreshing {sport.value} channels for {today} - requested by {interaction.user.name}")
+        
+        result = await handler.refresh_channels(interaction, today)
+        
+        embed = discord.Embed(
+            title="✅ Channels Refreshed" if result.success else "❌ Channel Refresh Failed",
+            description=result.message,
+            color=discord.Color.green() if result.success else discord.Color.red()
+        )
+        
+        if result.errors:
+            error_text = "\n".join([f"• {error}" for error in result.errors[:3]])
+            if len(result.errors) > 3:
+                error_text += f"\n... and {len(result.errors) - 3} more errors"
+            embed.add_field(name="⚠️ Errors", value=error_text, inline=False)
+        
+        await interaction.followup.send(embed=embed)
+        
+    except Exception as e:
+        logger.error(f"Error in refresh-channels command: {e}")
+        embed = discord.Embed(
+            title="❌ Command Error",
+            description=f"An unexpected error occurred: {str(e)}",
+            color=discord.Color.red()
+        )
+        await interaction.followup.send(embed=embed)
+
+
 @bot.tree.command(name="clear-channels", description="Clear all channels from selected sport category")
 @app_commands.describe(sport="Choose a sport category to clear")
 @app_commands.choices(sport=[
@@ -385,6 +446,7 @@ async def help_command(interaction: discord.Interaction):
         name="📝 Commands",
         value=(
             "`/create-channels <sport>` - Create channels for today's games\n"
+            "`/refresh-channels <sport>` - Update today's channels in place\n"
             "`/clear-channels <sport>` - Clear all channels for a sport\n"
             "`/status` - Show bot status and health\n"
             "`/sync` - Sync bot commands (Admin only)\n"
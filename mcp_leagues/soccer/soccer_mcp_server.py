@@ -10,6 +10,8 @@ import asyncio
 import json
 import os
 import sys
+import time
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -17,9 +19,13 @@ import httpx
 import uvicorn
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 from starlette.routing import Route
 
+# Shared helpers live with the production betting tools
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools", "production"))
+from h2h_cache import h2h_cache
+
 # Configuration
 SOCCER_API_BASE = "https://api.soccerdataapi.com"
 USER_AGENT = "sports-ai-soccer-mcp/1.0"
@@ -137,6 +143,16 @@ async def get_league_standings(league_id: int, season: Optional[str] = None):
     response.raise_for_status()
     return response.json()
 
+async def fetch_live_scores():
+    """Fetch the current livescores payload from SoccerDataAPI"""
+    client = await get_http_client()
+    response = await client.get(
+        f"{SOCCER_API_BASE}/livescores/",
+        params={"auth_token": AUTH_KEY}
+    )
+    response.raise_for_status()
+    return response.json()
+
 async def get_live_scores():
     """Get live scores for current day (UTC) with comprehensive match data
     
@@ -147,14 +163,20 @@ async def get_live_scores():
     - Betting odds (match winner, over/under, handicap)
     - Weather conditions
     - Injury reports
+    
+    Served from the shared live-score poller, so concurrent clients cost
+    one upstream request per poll interval.
     """
-    client = await get_http_client()
-    response = await client.get(
-        f"{SOCCER_API_BASE}/livescores/",
-        params={"auth_token": AUTH_KEY}
-    )
-    response.raise_for_status()
-    return response.json()
+    return await live_score_poller.latest_payload()
+
+async def get_live_score_changes(since: Optional[int] = None, wait_seconds: float = 0):
+    """Get only the live matches and events that changed since a cursor
+    
+    Args:
+        since: Cursor returned by a previous call (omit for a full snapshot)
+        wait_seconds: Optionally wait up to this long (max 25s) for a change
+    """
+    return await live_score_poller.changes(since, wait_seconds)
 
 async def get_matches(league_id: Optional[int] = None, date: Optional[str] = None, season: Optional[str] = None):
     """Get matches with comprehensive event data
@@ -307,7 +329,13 @@ async def get_head_to_head(team_1_id: int, team_2_id: int):
     - Overall record (wins, draws, losses)
     - Goals scored/conceded
     - Home/away performance splits
+    
+    Served from the shared pair cache (tools/production/h2h_cache.py) when fresh.
     """
+    cached = h2h_cache.get(team_1_id, team_2_id)
+    if cached is not None:
+        return cached
+    
     client = await get_http_client()
     response = await client.get(
         f"{SOCCER_API_BASE}/head-to-head/",
@@ -318,110 +346,360 @@ async def get_head_to_head(team_1_id: int, team_2_id: int):
         }
     )
     response.raise_for_status()
-    return response.json()
+    h2h_data = response.json()
+    if h2h_data:
+        await h2h_cache.put(team_1_id, team_2_id, h2h_data)
+    return h2h_data
 
 # Enhanced player extraction from match events
-async def extract_league_players(league_id: int):
+
+LEAGUE_PLAYERS_CACHE_TTL = 30 * 60  # seconds
+
+# (league_id, season) -> (built_at, result)
+_league_players_cache: Dict[tuple, tuple] = {}
+
+GOAL_EVENTS = frozenset(("goal", "penalty_goal"))
+
+class PlayerRecord:
+    """Compact per-player counters used while building a league player database"""
+    __slots__ = ("id", "name", "position", "teams", "goals", "assists",
+                 "yellow_cards", "red_cards", "substitutions_in", "substitutions_out")
+
+    def __init__(self, player_id: int, name: str, position: Optional[str] = None):
+        self.id = player_id
+        self.name = name
+        self.position = position
+        self.teams = set()
+        self.goals = 0
+        self.assists = 0
+        self.yellow_cards = 0
+        self.red_cards = 0
+        self.substitutions_in = 0
+        self.substitutions_out = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "teams": list(self.teams),
+            "position": self.position,
+            "stats": {
+                "goals": self.goals, "assists": self.assists, "yellow_cards": self.yellow_cards,
+                "red_cards": self.red_cards, "substitutions_in": self.substitutions_in,
+                "substitutions_out": self.substitutions_out
+            }
+        }
+
+def iter_league_matches(matches_data):
+    """Yield match dicts from a matches/ response (flat or stage-grouped)"""
+    if not isinstance(matches_data, list):
+        return
+    for league_entry in matches_data:
+        if not isinstance(league_entry, dict):
+            continue
+        yield from league_entry.get("matches") or ()
+        for stage in league_entry.get("stage") or ():
+            yield from stage.get("matches") or ()
+
+def build_players_db(matches_data) -> Dict[int, PlayerRecord]:
+    """Single pass over every match, lineup and event, keyed by player id"""
+    players: Dict[int, PlayerRecord] = {}
+
+    def record_for(player, team_name, position=None) -> Optional[PlayerRecord]:
+        if not player:
+            return None
+        player_id = player.get("id")
+        if not player_id:
+            return None
+        record = players.get(player_id)
+        if record is None:
+            player_name = player.get("name")
+            if not player_name:
+                return None
+            record = players[player_id] = PlayerRecord(player_id, player_name, position)
+        if team_name:
+            record.teams.add(team_name)
+        return record
+
+    for match in iter_league_matches(matches_data):
+        teams = match.get("teams") or {}
+        # Side is known up front, so each player is tagged as it is visited
+        side_names = {
+            "home": (teams.get("home") or {}).get("name"),
+            "away": (teams.get("away") or {}).get("name")
+        }
+
+        lineups = (match.get("lineups") or {}).get("lineups") or {}
+        for side, team_name in side_names.items():
+            for player_data in lineups.get(side) or ():
+                record_for(player_data.get("player"), team_name, player_data.get("position"))
+
+        for event in match.get("events") or ():
+            event_type = event.get("event_type")
+            team_name = side_names.get(event.get("team"))
+
+            if event_type == "substitution":
+                record = record_for(event.get("player_in"), team_name)
+                if record:
+                    record.substitutions_in += 1
+                record = record_for(event.get("player_out"), team_name)
+                if record:
+                    record.substitutions_out += 1
+                continue
+
+            record = record_for(event.get("player"), team_name)
+            if record:
+                if event_type in GOAL_EVENTS:
+                    record.goals += 1
+                elif event_type == "yellow_card":
+                    record.yellow_cards += 1
+                elif event_type == "red_card":
+                    record.red_cards += 1
+
+            assist = record_for(event.get("assist_player"), team_name)
+            if assist:
+                assist.assists += 1
+
+    return players
+
+async def extract_league_players(league_id: int, season: Optional[str] = None):
     """Extract all players from a league with comprehensive statistics
     
     Args:
         league_id: League ID (e.g., 228 for Premier League)
+        season: Optional season filter (e.g., "2025-2026")
         
     Returns:
     - Player database with stats from match events
     - Goals, assists, cards, substitutions
     - Team associations
     """
+    cache_key = (league_id, season)
+    cached = _league_players_cache.get(cache_key)
+    now = time.monotonic()
+    if cached and now - cached[0] < LEAGUE_PLAYERS_CACHE_TTL:
+        return cached[1]
+
     try:
-        matches_data = await get_matches(league_id=league_id)
-        players_db = {}
-        
-        if isinstance(matches_data, list):
-            for league_entry in matches_data:
-                if isinstance(league_entry, dict):
-                    matches = league_entry.get("matches", [])
-                    
-                    for match in matches:
-                        if isinstance(match, dict):
-                            events = match.get("events", [])
-                            teams = match.get("teams", {})
-                            home_team = teams.get("home", {})
-                            away_team = teams.get("away", {})
-                            
-                            # Process lineups for team associations
-                            lineups = match.get("lineups", {})
-                            if lineups:
-                                home_lineup = lineups.get("lineups", {}).get("home", [])
-                                away_lineup = lineups.get("lineups", {}).get("away", [])
-                                
-                                for player_data in home_lineup + away_lineup:
-                                    if isinstance(player_data, dict):
-                                        player = player_data.get("player", {})
-                                        if player:
-                                            player_id = player.get("id")
-                                            player_name = player.get("name")
-                                            if player_id and player_name:
-                                                if player_id not in players_db:
-                                                    players_db[player_id] = {
-                                                        "id": player_id,
-                                                        "name": player_name,
-                                                        "teams": set(),
-                                                        "position": player_data.get("position"),
-                                                        "stats": {
-                                                            "goals": 0, "assists": 0, "yellow_cards": 0,
-                                                            "red_cards": 0, "substitutions_in": 0, "substitutions_out": 0
-                                                        }
-                                                    }
-                                                # Add team association
-                                                team_name = home_team.get("name") if player_data in home_lineup else away_team.get("name")
-                                                if team_name:
-                                                    players_db[player_id]["teams"].add(team_name)
-                            
-                            # Process match events for statistics
-                            for event in events:
-                                if isinstance(event, dict):
-                                    event_type = event.get("event_type")
-                                    
-                                    # Handle goals
-                                    if event_type == "goal" and "player" in event:
-                                        player = event["player"]
-                                        if isinstance(player, dict):
-                                            player_id = player.get("id")
-                                            if player_id and player_id in players_db:
-                                                players_db[player_id]["stats"]["goals"] += 1
-                                    
-                                    # Handle cards
-                                    elif event_type in ["yellow_card", "red_card"] and "player" in event:
-                                        player = event["player"]
-                                        if isinstance(player, dict):
-                                            player_id = player.get("id")
-                                            if player_id and player_id in players_db:
-                                                if event_type == "yellow_card":
-                                                    players_db[player_id]["stats"]["yellow_cards"] += 1
-                                                else:
-                                                    players_db[player_id]["stats"]["red_cards"] += 1
-                                    
-                                    # Handle assists
-                                    if "assist_player" in event and event["assist_player"]:
-                                        assist_player = event["assist_player"]
-                                        if isinstance(assist_player, dict):
-                                            player_id = assist_player.get("id")
-                                            if player_id and player_id in players_db:
-                                                players_db[player_id]["stats"]["assists"] += 1
-        
-        # Convert sets to lists for JSON serialization
-        for player_id, player_data in players_db.items():
-            player_data["teams"] = list(player_data["teams"])
-        
-        return {
+        matches_data = await get_matches(league_id=league_id, season=season)
+        players_db = build_players_db(matches_data)
+
+        result = {
             "total_players_found": len(players_db),
             "league_id": league_id,
-            "players": players_db
+            "season": season,
+            "players": {player_id: record.to_dict() for player_id, record in players_db.items()}
         }
+        _league_players_cache[cache_key] = (now, result)
+        return result
         
     except Exception as e:
         return {"error": str(e), "league_id": league_id}
 
+# Live score delta poller
+
+LIVE_POLL_INTERVAL = float(os.environ.get("LIVE_POLL_INTERVAL", "30"))  # seconds between upstream polls
+LIVE_POLL_IDLE_TIMEOUT = 10 * 60  # stop polling after this long without a client
+LIVE_CHANGELOG_VERSIONS = 200     # versions kept for cursor catch-up
+LIVE_MAX_WAIT_SECONDS = 25
+
+def event_key(event: Dict) -> str:
+    return json.dumps(event, sort_keys=True)
+
+class LiveScorePoller:
+    """Polls livescores on a fixed cadence and keeps a versioned changelog
+
+    Each poll that changes anything bumps `version`. Clients pass the last
+    version they saw as a cursor and receive only the matches and events
+    that changed since then. Polling starts on first demand and stops once
+    no client has asked for LIVE_POLL_IDLE_TIMEOUT seconds.
+    """
+
+    def __init__(self, interval: float = LIVE_POLL_INTERVAL, idle_timeout: float = LIVE_POLL_IDLE_TIMEOUT):
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.version = 0
+        self.payload = None
+        self.matches: Dict[Any, Dict] = {}
+        self.changelog: deque = deque(maxlen=LIVE_CHANGELOG_VERSIONS)  # (version, [changes])
+        self.polls = 0
+        self.last_poll = 0.0  # monotonic time of the last completed poll
+        self._fingerprints: Dict[Any, str] = {}
+        self._event_keys: Dict[Any, set] = {}
+        self._last_demand = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._poll_lock = asyncio.Lock()
+        self._changed = asyncio.Event()
+
+    def _touch(self):
+        self._last_demand = time.monotonic()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while time.monotonic() - self._last_demand < self.idle_timeout:
+            # Timed from the last poll, which a request may have made in between
+            await asyncio.sleep(max(0.0, self.last_poll + self.interval - time.monotonic()))
+            try:
+                await self.poll_once(max_age=self.interval)
+            except Exception as e:
+                print(f"Live score poll failed: {e}")
+                # last_poll only moves on success, so wait out an interval before retrying
+                await asyncio.sleep(self.interval)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _is_stale(self, max_age: float) -> bool:
+        return self.payload is None or time.monotonic() - self.last_poll >= max_age
+
+    async def poll_once(self, max_age: Optional[float] = None):
+        """Poll upstream; with max_age, skip if a poll that recent already happened"""
+        async with self._poll_lock:
+            # Re-checked under the lock so concurrent callers share one poll
+            if max_age is not None and not self._is_stale(max_age):
+                return
+            payload = await fetch_live_scores()
+            self.polls += 1
+            self.payload = payload
+            self.last_poll = time.monotonic()
+            changes = self._diff(payload)
+            if changes:
+                self.version += 1
+                self.changelog.append((self.version, changes))
+                # Wake waiting clients, then re-arm for the next change
+                self._changed.set()
+                self._changed = asyncio.Event()
+
+    def _diff(self, payload) -> List[Dict]:
+        changes = []
+        seen = set()
+
+        for match in iter_league_matches(payload):
+            match_id = match.get("id")
+            if match_id is None:
+                continue
+            seen.add(match_id)
+
+            fingerprint = json.dumps(match, sort_keys=True)
+            if self._fingerprints.get(match_id) == fingerprint:
+                continue
+
+            previous_keys = self._event_keys.get(match_id, set())
+            events = match.get("events") or []
+            current_keys = {event_key(event) for event in events}
+            new_events = [event for event in events if event_key(event) not in previous_keys]
+
+            changes.append({
+                "type": "match_updated" if match_id in self.matches else "match_added",
+                "match_id": match_id,
+                "match": match,
+                "new_events": new_events
+            })
+            self.matches[match_id] = match
+            self._fingerprints[match_id] = fingerprint
+            self._event_keys[match_id] = current_keys
+
+        for match_id in [match_id for match_id in self.matches if match_id not in seen]:
+            changes.append({"type": "match_removed", "match_id": match_id})
+            del self.matches[match_id]
+            self._fingerprints.pop(match_id, None)
+            self._event_keys.pop(match_id, None)
+
+        return changes
+
+    async def ensure_started(self):
+        self._touch()
+        # After an idle shutdown the payload is as old as the idle period; never serve it as live
+        if self._is_stale(self.interval):
+            await self.poll_once(max_age=self.interval)
+
+    async def latest_payload(self):
+        await self.ensure_started()
+        return self.payload
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "cursor": self.version,
+            "reset": True,
+            "matches": list(self.matches.values())
+        }
+
+    def changes_since(self, since: Optional[int]) -> Dict[str, Any]:
+        """Changes after cursor `since`, or a full snapshot if it can't be served"""
+        oldest = self.changelog[0][0] if self.changelog else self.version + 1
+        if since is None or since > self.version or since < oldest - 1:
+            return self.snapshot()
+
+        changed: Dict[Any, Dict] = {}
+        removed = set()
+        new_events = []
+        for version, changes in self.changelog:
+            if version <= since:
+                continue
+            for change in changes:
+                match_id = change["match_id"]
+                if change["type"] == "match_removed":
+                    changed.pop(match_id, None)
+                    removed.add(match_id)
+                    continue
+                removed.discard(match_id)
+                changed[match_id] = change["match"]
+                new_events.extend({"match_id": match_id, "event": event} for event in change["new_events"])
+
+        return {
+            "cursor": self.version,
+            "reset": False,
+            "changed_matches": list(changed.values()),
+            "removed_match_ids": sorted(removed),
+            "new_events": new_events
+        }
+
+    async def wait_for_change(self, since: int, timeout: float) -> None:
+        if self.version > since:
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def changes(self, since: Optional[int] = None, wait_seconds: float = 0) -> Dict[str, Any]:
+        await self.ensure_started()
+        if since is not None and wait_seconds:
+            await self.wait_for_change(since, min(float(wait_seconds), LIVE_MAX_WAIT_SECONDS))
+        return self.changes_since(since)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cursor": self.version,
+            "live_matches": len(self.matches),
+            "polls": self.polls,
+            "polling": self._task is not None and not self._task.done()
+        }
+
+live_score_poller = LiveScorePoller()
+
+async def live_score_stream(request: Request) -> StreamingResponse:
+    """Server-sent events stream of live score changes (GET /live/stream?since=N)"""
+    since_param = request.query_params.get("since")
+    cursor = int(since_param) if since_param and since_param.isdigit() else None
+
+    async def events():
+        nonlocal cursor
+        while True:
+            await live_score_poller.ensure_started()  # Keeps the poller alive while streaming
+            update = live_score_poller.changes_since(cursor)
+            if cursor is None or update["cursor"] != cursor:
+                cursor = update["cursor"]
+                yield f"id: {cursor}\ndata: {json.dumps(update)}\n\n"
+            await live_score_poller.wait_for_change(cursor, LIVE_MAX_WAIT_SECONDS)
+            if live_score_poller.version == cursor:
+                yield ": keepalive\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 # MCP Server Implementation
 
 async def handle_request(request: Request) -> Response:
@@ -513,6 +791,18 @@ async def handle_request(request: Request) -> Response:
                         "required": []
                     }
                 },
+                {
+                    "name": "get_live_score_changes",
+                    "description": "Get only live matches and events that changed since a cursor (omit 'since' for a full snapshot)",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "since": {"type": "integer", "description": "Cursor from a previous call"},
+                            "wait_seconds": {"type": "number", "description": "Optionally wait up to this many seconds (max 25) for a change"}
+                        },
+                        "required": []
+                    }
+                },
                 {
                     "name": "get_matches",
                     "description": "Get matches with comprehensive event data",
@@ -620,7 +910,8 @@ async def handle_request(request: Request) -> Response:
                     "inputSchema": {
                         "type": "object",
                         "properties": {
-                            "league_id": {"type": "integer", "description": "League ID (e.g., 228 for Premier League)"}
+                            "league_id": {"type": "integer", "description": "League ID (e.g., 228 for Premier League)"},
+                            "season": {"type": "string", "description": "Optional season filter (e.g., '2025-2026')"}
                         },
                         "required": ["league_id"]
                     }
@@ -651,6 +942,8 @@ async def handle_request(request: Request) -> Response:
                 result = await get_league_standings(arguments["league_id"], arguments.get("season"))
             elif tool_name == "get_live_scores":
                 result = await get_live_scores()
+            elif tool_name == "get_live_score_changes":
+                result = await get_live_score_changes(arguments.get("since"), arguments.get("wait_seconds", 0))
             elif tool_name == "get_matches":
                 result = await get_matches(arguments.get("league_id"), arguments.get("date"), arguments.get("season"))
             elif tool_name == "get_match_details":
@@ -670,7 +963,7 @@ async def handle_request(request: Request) -> Response:
             elif tool_name == "get_head_to_head":
                 result = await get_head_to_head(arguments["team_1_id"], arguments["team_2_id"])
             elif tool_name == "extract_league_players":
-                result = await extract_league_players(arguments["league_id"])
+                result = await extract_league_players(arguments["league_id"], arguments.get("season"))
             else:
                 return Response(
                     json.dumps({"error": f"Unknown tool: {tool_name}"}),
@@ -700,7 +993,7 @@ async def handle_request(request: Request) -> Response:
 async def health_check(request: Request) -> Response:
     """Health check endpoint for Railway"""
     return Response(
-        json.dumps({"status": "healthy", "service": "soccer-mcp"}),
+        json.dumps({"status": "healthy", "service": "soccer-mcp", "live_poller": live_score_poller.stats(), "h2h_cache": h2h_cache.stats()}),
         headers={"Content-Type": "application/json"}
     )
 
@@ -709,17 +1002,19 @@ app = Starlette(
     routes=[
         Route("/", health_check, methods=["GET"]),
         Route("/mcp", handle_request, methods=["POST"]),
+        Route("/live/stream", live_score_stream, methods=["GET"]),
     ]
 )
 
 @app.on_event("startup")
 async def startup():
     print(f"Soccer MCP Server starting up...")
-    print(f"Available tools: 17 comprehensive soccer tools")
+    print(f"Available tools: 18 comprehensive soccer tools")
     print(f"API Base: {SOCCER_API_BASE}")
 
 @app.on_event("shutdown")
 async def shutdown():
+    await live_score_poller.stop()
     await close_http_client()
     print("Soccer MCP Server shutting down...")
 
@@ -12,9 +12,21 @@ Complete integration of:
 import requests
 import json
 import os
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Shared SoccerDataAPI rate limiter lives with the production tools
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'production'))
+from soccer_rate_limiter import (
+    MAX_RATE_LIMIT_RETRIES,
+    endpoint_weight,
+    retry_after_seconds,
+    soccer_api_limiter,
+)
+
+DISCOVERY_WORKERS = 8
 
 class UnifiedH2HIntelligence:
     def __init__(self, auth_token: str):
@@ -39,36 +51,48 @@ class UnifiedH2HIntelligence:
         print(f"🔍 SMART MATCH DISCOVERY - Next {days_ahead} days")
         print("=" * 60)
         
-        upcoming_matches = {}
         target_date = datetime.now() + timedelta(days=1)  # Start from tomorrow
-        
-        for i in range(days_ahead):
-            search_date = target_date + timedelta(days=i)
-            date_str = search_date.strftime("%d-%m-%Y")
-            
-            print(f"📅 Searching {date_str}...")
-            day_matches = []
-            
-            # Search all major leagues for this date
-            for league_code, league_info in self.leagues.items():
-                matches_data = self.api_call('matches/', {
-                    'league_id': league_info['id'],
-                    'date': date_str
-                })
-                
-                if matches_data:
-                    matches = self.extract_matches_from_response(matches_data)
-                    for match in matches:
-                        match['league_code'] = league_code
-                        match['league_info'] = league_info
-                        match['search_date'] = date_str
-                        day_matches.append(match)
-            
+        search_dates = [(target_date + timedelta(days=i)).strftime("%d-%m-%Y") for i in range(days_ahead)]
+        queries = [
+            (date_str, league_code, league_info)
+            for date_str in search_dates
+            for league_code, league_info in self.leagues.items()
+        ]
+        print(f"📅 Searching {len(search_dates)} days x {len(self.leagues)} leagues ({len(queries)} queries)...")
+        
+        def query(date_str: str, league_code: str, league_info: Dict) -> Tuple[str, str, Dict, List[Dict]]:
+            matches_data = self.api_call('matches/', {
+                'league_id': league_info['id'],
+                'date': date_str
+            })
+            return date_str, league_code, league_info, self.extract_matches_from_response(matches_data)
+        
+        # Queries run concurrently; the shared rate limiter keeps them under the API limit
+        found_by_date: Dict[str, List[Dict]] = {}
+        seen = set()
+        with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as pool:
+            futures = [pool.submit(query, *q) for q in queries]
+            for future in as_completed(futures):
+                date_str, league_code, league_info, matches = future.result()
+                for match in matches:
+                    match_key = match.get('id') or json.dumps(match.get('teams', {}), sort_keys=True) + date_str
+                    if match_key in seen:
+                        continue
+                    seen.add(match_key)
+                    match['league_code'] = league_code
+                    match['league_info'] = league_info
+                    match['search_date'] = date_str
+                    found_by_date.setdefault(date_str, []).append(match)
+        
+        # Keep the date order of the original day-by-day search
+        upcoming_matches = {}
+        for date_str in search_dates:
+            day_matches = found_by_date.get(date_str, [])
             if day_matches:
                 upcoming_matches[date_str] = day_matches
-                print(f"  ✅ Found {len(day_matches)} matches")
+                print(f"  ✅ {date_str}: Found {len(day_matches)} matches")
             else:
-                print(f"  📭 No matches found")
+                print(f"  📭 {date_str}: No matches found")
         
         total_found = sum(len(matches) for matches in upcoming_matches.values())
         print(f"\n🎯 DISCOVERY COMPLETE: {total_found} upcoming matches found")
@@ -583,11 +607,17 @@ class UnifiedH2HIntelligence:
         params['auth_token'] = self.auth_token
         url = f"{self.base_url}/{endpoint}"
         
+        weight = endpoint_weight(endpoint, params)
+        
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            time.sleep(0.3)  # Rate limiting
-            return response.json()
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                soccer_api_limiter.acquire_sync(weight)
+                response = requests.get(url, headers=self.headers, params=params, timeout=30)
+                if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                    soccer_api_limiter.penalize(retry_after_seconds(response.headers, attempt))
+                    continue
+                response.raise_for_status()
+                return response.json()
         except:
             return None
     
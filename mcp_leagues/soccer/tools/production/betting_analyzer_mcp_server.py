@@ -15,7 +15,7 @@ import json
 import os
 import sys
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 import uvicorn
@@ -24,6 +24,15 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 from starlette.routing import Route
 
+from soccer_rate_limiter import (
+    MAX_RATE_LIMIT_RETRIES,
+    endpoint_weight,
+    retry_after_seconds,
+    soccer_api_limiter,
+)
+from h2h_cache import h2h_cache
+from soccer_reference_index import TeamRef, load_reference_index
+
 # Configuration
 SOCCER_API_BASE = "https://api.soccerdataapi.com"
 USER_AGENT = "enhanced-betting-analyzer-mcp/1.0"
@@ -42,6 +51,9 @@ TARGET_LEAGUES = {
     'UEFA': {'id': 310, 'name': 'UEFA Champions League', 'country': 'Europe'}
 }
 
+# Team/league name index, loaded once at startup from reference_data/
+reference_index = load_reference_index()
+
 # HTTP client
 _http_client: Optional[httpx.AsyncClient] = None
 
@@ -140,18 +152,187 @@ async def api_call(endpoint: str, params: Dict, silent: bool = False) -> Optiona
     """Make API call with error handling and rate limiting"""
     params['auth_token'] = AUTH_TOKEN
     url = f"{SOCCER_API_BASE}/{endpoint}"
+    weight = endpoint_weight(endpoint, params)
     
     try:
         client = await get_http_client()
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        await asyncio.sleep(0.1)  # Rate limiting
-        return response.json()
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await soccer_api_limiter.acquire(weight)
+            response = await client.get(url, params=params)
+            if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                # Back off every caller sharing the limiter, then retry
+                soccer_api_limiter.penalize(retry_after_seconds(response.headers, attempt))
+                continue
+            response.raise_for_status()
+            return response.json()
     except Exception as e:
         if not silent:
             print(f"API Error: {e}")
         return None
 
+# Season Match Store
+
+CURRENT_SEASON = "2025-2026"
+SEASON_STORE_REFRESH_SECONDS = 15 * 60  # How long a loaded season is trusted before refreshing
+SEASON_STORE_MAX_INCREMENTAL_DAYS = 7   # Beyond this gap a full season reload is cheaper
+
+def parse_match_date(match_date: str) -> datetime:
+    """Parse a SoccerDataAPI match date (DD/MM/YYYY), falling back to now"""
+    try:
+        return datetime.strptime(match_date, "%d/%m/%Y")
+    except ValueError:
+        return datetime.now()
+
+def match_store_key(match: Dict) -> Any:
+    """Stable key for a match so repeated downloads upsert instead of duplicate"""
+    match_id = match.get('id')
+    if match_id is not None:
+        return match_id
+    teams = match.get('teams', {})
+    return (match.get('date'), teams.get('home', {}).get('id'), teams.get('away', {}).get('id'))
+
+class SeasonMatchStore:
+    """Finished matches for one (league, season), indexed by team id
+
+    The full season is downloaded once. After SEASON_STORE_REFRESH_SECONDS the
+    store refreshes incrementally by fetching only the dates since the last
+    refresh and upserting them by match id.
+    """
+
+    def __init__(self, league_id: int, season: str):
+        self.league_id = league_id
+        self.season = season
+        self.matches: Dict[Any, Dict] = {}
+        self.team_index: Dict[int, List[Dict]] = {}
+        self.loaded_at: Optional[float] = None
+        self.synced_through: Optional[datetime] = None
+        self.full_loads = 0
+        self.incremental_refreshes = 0
+        self._lock = asyncio.Lock()
+
+    async def ensure_fresh(self) -> None:
+        """Load the season on first use and refresh it once it goes stale"""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self.loaded_at is None:
+                await self._full_load()
+            elif now - self.loaded_at >= SEASON_STORE_REFRESH_SECONDS:
+                days_behind = (datetime.now() - self.synced_through).days
+                if days_behind > SEASON_STORE_MAX_INCREMENTAL_DAYS:
+                    await self._full_load()
+                else:
+                    await self._incremental_refresh(days_behind)
+
+    async def _full_load(self) -> None:
+        season_matches = await api_call('matches/', {
+            'league_id': self.league_id,
+            'season': self.season
+        }, silent=True)
+
+        if not season_matches:
+            return  # Leave unloaded so the next caller retries
+
+        self.matches = {}
+        self._merge(extract_matches_from_response(season_matches))
+        self._mark_synced()
+        self.full_loads += 1
+
+    async def _incremental_refresh(self, days_behind: int) -> None:
+        # Re-fetch the last synced day too, since its matches may have finished since
+        start = self.synced_through - timedelta(days=1)
+        fetched_any = False
+
+        for offset in range(days_behind + 2):
+            day = start + timedelta(days=offset)
+            day_matches = await api_call('matches/', {
+                'league_id': self.league_id,
+                'date': day.strftime("%d-%m-%Y")
+            }, silent=True)
+
+            if day_matches:
+                self._merge(extract_matches_from_response(day_matches))
+                fetched_any = True
+
+        if fetched_any:
+            self._mark_synced()
+            self.incremental_refreshes += 1
+
+    def _merge(self, matches: List[Dict]) -> None:
+        for match in matches:
+            self.matches[match_store_key(match)] = match
+        self._rebuild_index()
+
+    def _mark_synced(self) -> None:
+        self.loaded_at = asyncio.get_running_loop().time()
+        self.synced_through = datetime.now()
+
+    def _rebuild_index(self) -> None:
+        team_index: Dict[int, List[Dict]] = {}
+
+        for match in self.matches.values():
+            if match.get('status') != 'finished':
+                continue
+            match_date = match.get('date', '')
+            if not match_date:
+                continue
+
+            teams = match.get('teams', {})
+            home_id = teams.get('home', {}).get('id')
+            away_id = teams.get('away', {}).get('id')
+            parsed_date = parse_match_date(match_date)
+
+            for team_id, is_home in ((home_id, True), (away_id, False)):
+                if team_id is None:
+                    continue
+                team_index.setdefault(team_id, []).append({
+                    'match': match,
+                    'date': match_date,
+                    'parsed_date': parsed_date,
+                    'is_home': is_home
+                })
+
+        # Most recent first, so form lookups are a slice
+        for entries in team_index.values():
+            entries.sort(key=lambda x: x['parsed_date'], reverse=True)
+
+        self.team_index = team_index
+
+    def recent_matches(self, team_id: int, limit: int = 10) -> List[Dict]:
+        """Most recent finished matches for a team (most recent first)"""
+        return self.team_index.get(team_id, [])[:limit]
+
+    def latest_meeting(self, team_1_id: int, team_2_id: int) -> Optional[str]:
+        """Key of the most recent finished match between two teams this season"""
+        for entry in self.team_index.get(team_1_id, []):
+            teams = entry['match'].get('teams', {})
+            opponent_key = 'away' if entry['is_home'] else 'home'
+            if teams.get(opponent_key, {}).get('id') == team_2_id:
+                return str(match_store_key(entry['match']))
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'league_id': self.league_id,
+            'season': self.season,
+            'matches': len(self.matches),
+            'teams': len(self.team_index),
+            'full_loads': self.full_loads,
+            'incremental_refreshes': self.incremental_refreshes,
+            'synced_through': self.synced_through.isoformat() if self.synced_through else None
+        }
+
+_season_stores: Dict[Tuple[int, str], SeasonMatchStore] = {}
+
+async def get_season_store(league_id: int, season: str = CURRENT_SEASON) -> SeasonMatchStore:
+    """Get the shared, fresh match store for a league season"""
+    key = (league_id, season)
+    store = _season_stores.get(key)
+    if store is None:
+        store = SeasonMatchStore(league_id, season)
+        _season_stores[key] = store
+    await store.ensure_fresh()
+    return store
+
 # MCP Tool Implementations
 
 async def get_betting_matches(date: str, league_filter: Optional[str] = None) -> Dict[str, Any]:
@@ -194,6 +375,7 @@ async def get_betting_matches(date: str, league_filter: Optional[str] = None) ->
             for match in matches:
                 match['league_code'] = league_code
                 match['league_info'] = league_info
+            reference_index.add_match_teams(matches, league_info['id'])
             
             all_matches[league_code] = matches
         else:
@@ -262,24 +444,28 @@ async def analyze_match_betting(home_team: str, away_team: str, league: str, mat
             "supported_leagues": list(TARGET_LEAGUES.keys())
         }
     
-    # Get matches for the date to find the specific match
-    matches_result = await get_betting_matches(match_date, league)
+    league_id = TARGET_LEAGUES[league]['id']
+    
+    # Resolve team ids from the reference index; when both are known the
+    # season store can warm up while the day's fixtures load
+    home_ref = reference_index.resolve_team(home_team, league_id)
+    away_ref = reference_index.resolve_team(away_team, league_id)
+    if home_ref and away_ref:
+        matches_result, _ = await asyncio.gather(
+            get_betting_matches(match_date, league),
+            get_season_store(league_id)
+        )
+    else:
+        matches_result = await get_betting_matches(match_date, league)
     
     if "error" in matches_result:
         return matches_result
     
     # Find the specific match
-    target_match = None
-    for matches in matches_result["matches_by_league"].values():
-        for match in matches:
-            teams = match.get('teams', {})
-            home_name = teams.get('home', {}).get('name', '')
-            away_name = teams.get('away', {}).get('name', '')
-            
-            if (home_team.lower() in home_name.lower() and 
-                away_team.lower() in away_name.lower()):
-                target_match = match
-                break
+    target_match = find_target_match(
+        [match for matches in matches_result["matches_by_league"].values() for match in matches],
+        home_team, away_team, home_ref, away_ref
+    )
     
     if not target_match:
         return {
@@ -291,6 +477,39 @@ async def analyze_match_betting(home_team: str, away_team: str, league: str, mat
             ]
         }
     
+    return await analyze_found_match(target_match, league, match_date, home_team, away_team)
+
+def find_target_match(matches: List[Dict], home_team: str, away_team: str,
+                      home_ref: Optional[TeamRef] = None, away_ref: Optional[TeamRef] = None) -> Optional[Dict]:
+    """Find a fixture by resolved team ids, falling back to name substrings"""
+    if home_ref and away_ref:
+        for match in matches:
+            teams = match.get('teams', {})
+            if (teams.get('home', {}).get('id') == home_ref.team_id and
+                teams.get('away', {}).get('id') == away_ref.team_id):
+                return match
+    
+    for match in matches:
+        teams = match.get('teams', {})
+        home_name = teams.get('home', {}).get('name', '')
+        away_name = teams.get('away', {}).get('name', '')
+        
+        if (home_team.lower() in home_name.lower() and 
+            away_team.lower() in away_name.lower()):
+            return match
+    return None
+
+async def analyze_found_match(target_match: Dict, league: str, match_date: str,
+                              home_team: str = '', away_team: str = '') -> Dict[str, Any]:
+    """Run form, H2H and prediction analysis for an already-located match
+    
+    Args:
+        target_match: Match dict from get_betting_matches
+        league: League code (must be in TARGET_LEAGUES)
+        match_date: Match date in DD-MM-YYYY format
+        home_team: Fallback home team name
+        away_team: Fallback away team name
+    """
     # Extract team IDs
     teams = target_match.get('teams', {})
     home_team_id = teams.get('home', {}).get('id')
@@ -303,12 +522,12 @@ async def analyze_match_betting(home_team: str, away_team: str, league: str, mat
     
     league_id = TARGET_LEAGUES[league]['id']
     
-    # Get team analyses
-    home_analysis = await get_team_form_analysis(home_team_id, home_team_name, league_id)
-    away_analysis = await get_team_form_analysis(away_team_id, away_team_name, league_id)
-    
-    # Get H2H analysis
-    h2h_analysis = await get_h2h_betting_analysis(home_team_id, away_team_id, home_team_name, away_team_name)
+    # Team form and H2H are independent, so run them together
+    home_analysis, away_analysis, h2h_analysis = await asyncio.gather(
+        get_team_form_analysis(home_team_id, home_team_name, league_id),
+        get_team_form_analysis(away_team_id, away_team_name, league_id),
+        get_h2h_betting_analysis(home_team_id, away_team_id, home_team_name, away_team_name, league_id)
+    )
     
     # Generate predictions
     predictions = generate_betting_predictions(home_analysis, away_analysis, {
@@ -345,44 +564,10 @@ async def get_team_form_analysis(team_id: int, team_name: str, league_id: int) -
         team_name: Team name
         league_id: League ID
     """
-    # Get recent matches using season-based search
-    current_season = "2025-2026"  # Updated for current season
-    season_matches = await api_call('matches/', {
-        'league_id': league_id,
-        'season': current_season
-    }, silent=True)
-    
-    team_matches = []
-    
-    if season_matches:
-        matches = extract_matches_from_response(season_matches)
-        
-        for match in matches:
-            if (team_played_in_match(team_id, match) and 
-                match.get('status') == 'finished'):
-                
-                match_date = match.get('date', '')
-                if match_date:
-                    try:
-                        parsed_date = datetime.strptime(match_date, "%d/%m/%Y")
-                        team_matches.append({
-                            'match': match,
-                            'date': match_date,
-                            'parsed_date': parsed_date,
-                            'is_home': is_team_home(team_id, match)
-                        })
-                    except ValueError:
-                        team_matches.append({
-                            'match': match,
-                            'date': match_date,
-                            'parsed_date': datetime.now(),
-                            'is_home': is_team_home(team_id, match)
-                        })
-    
-    # Sort by date (most recent first) and limit to 10
-    team_matches.sort(key=lambda x: x['parsed_date'], reverse=True)
-    team_matches = team_matches[:10]
-    
+    # Recent matches come from the shared season store (one season download per league)
+    store = await get_season_store(league_id)
+    team_matches = store.recent_matches(team_id, limit=10)
+
     return analyze_team_form_advanced(team_matches, team_name)
 
 def analyze_team_form_advanced(team_matches: List[Dict], team_name: str) -> Dict:
@@ -495,7 +680,27 @@ def analyze_betting_trends(recent_scores: List[Tuple], form_chars: List[str]) ->
         'clean_sheet_percentage': (clean_sheets / total_matches * 100) if total_matches > 0 else 0
     }
 
-async def get_h2h_betting_analysis(team_1_id: int, team_2_id: int, team_1_name: str, team_2_name: str) -> Dict[str, Any]:
+async def fetch_head_to_head(team_1_id: int, team_2_id: int, league_id: Optional[int] = None) -> Optional[Dict]:
+    """Raw head-to-head/ data, served from the pair cache unless the teams have met since"""
+    latest_meeting = None
+    if league_id:
+        store = await get_season_store(league_id)
+        latest_meeting = store.latest_meeting(team_1_id, team_2_id)
+    
+    cached = h2h_cache.get(team_1_id, team_2_id, latest_meeting)
+    if cached is not None:
+        return cached
+    
+    h2h_data = await api_call('head-to-head/', {
+        'team_1_id': team_1_id,
+        'team_2_id': team_2_id
+    })
+    if h2h_data:
+        await h2h_cache.put(team_1_id, team_2_id, h2h_data, latest_meeting)
+    return h2h_data
+
+async def get_h2h_betting_analysis(team_1_id: int, team_2_id: int, team_1_name: str, team_2_name: str,
+                                   league_id: Optional[int] = None) -> Dict[str, Any]:
     """Get historical head-to-head analysis with betting insights
     
     Args:
@@ -503,11 +708,9 @@ async def get_h2h_betting_analysis(team_1_id: int, team_2_id: int, team_1_name:
         team_2_id: Second team ID
         team_1_name: First team name
         team_2_name: Second team name
+        league_id: Optional league ID; lets a new meeting this season invalidate the cached H2H
     """
-    h2h_data = await api_call('head-to-head/', {
-        'team_1_id': team_1_id,
-        'team_2_id': team_2_id
-    })
+    h2h_data = await fetch_head_to_head(team_1_id, team_2_id, league_id)
     
     if not h2h_data:
         return {
@@ -768,6 +971,71 @@ def is_team_home(team_id: int, match: Dict) -> bool:
     home_id = teams.get('home', {}).get('id')
     return team_id == home_id
 
+MAX_CONCURRENT_MATCH_ANALYSES = 8  # League scans fan out at most this many match analyses
+
+_match_analysis_semaphore = asyncio.Semaphore(MAX_CONCURRENT_MATCH_ANALYSES)
+
+def build_value_bet(match: Dict, analysis: Dict, league: str, date: str, min_confidence: float) -> Optional[Dict]:
+    """Turn a match analysis into a value bet entry if it clears the confidence bar"""
+    if "error" in analysis:
+        return None
+    
+    predictions = analysis.get('predictions', {})
+    match_winner = predictions.get('match_winner', {})
+    goals = predictions.get('goals', {})
+    
+    confidence = match_winner.get('confidence_percentage', 0)
+    if confidence < min_confidence:
+        return None
+    
+    teams = match.get('teams', {})
+    home_name = teams.get('home', {}).get('name', '')
+    away_name = teams.get('away', {}).get('name', '')
+    
+    return {
+        "match": f"{home_name} vs {away_name}",
+        "league": league,
+        "date": date,
+        "recommended_bet": match_winner.get('prediction', 'N/A'),
+        "confidence": f"{confidence:.1f}%",
+        "confidence_level": match_winner.get('confidence', 'Medium'),
+        "goals_prediction": goals.get('prediction', 'N/A'),
+        "expected_goals": goals.get('expected_goals', 0),
+        "key_insights": predictions.get('key_insights', []),
+        "odds": match.get('odds', {}),
+        "home_form": analysis['team_analysis']['home']['form_rating'],
+        "away_form": analysis['team_analysis']['away']['form_rating']
+    }
+
+async def stream_league_value_bets(league_matches: List[Dict], league: str, date: str,
+                                   min_confidence: float) -> AsyncIterator[Tuple[int, Dict]]:
+    """Analyze matches concurrently and yield (match_index, value_bet) as each finishes
+    
+    Args:
+        league_matches: Matches already fetched for the league and date
+        league: League code (must be in TARGET_LEAGUES)
+        date: Match date in DD-MM-YYYY format
+        min_confidence: Minimum confidence percentage for a value bet
+    """
+    async def analyze(index: int, match: Dict) -> Tuple[int, Optional[Dict]]:
+        try:
+            async with _match_analysis_semaphore:
+                analysis = await analyze_found_match(match, league, date)
+            return index, build_value_bet(match, analysis, league, date, min_confidence)
+        except Exception:
+            return index, None  # Skip matches that can't be analyzed
+    
+    tasks = [asyncio.ensure_future(analyze(index, match)) for index, match in enumerate(league_matches)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, value_bet = await next_done
+            if value_bet:
+                yield index, value_bet
+    finally:
+        # A consumer that stops early should not leave analyses running
+        for task in tasks:
+            task.cancel()
+
 async def get_league_value_bets(league: str, date: str, min_confidence: float = 60.0) -> Dict[str, Any]:
     """Find potential value bets across all matches in a league
     
@@ -776,56 +1044,25 @@ async def get_league_value_bets(league: str, date: str, min_confidence: float =
         date: Match date in DD-MM-YYYY format
         min_confidence: Minimum confidence percentage for recommendations (default 60.0)
     """
-    # Get all matches for the league and date
+    # Get all matches for the league and date once; every analysis reuses them
     matches_result = await get_betting_matches(date, league)
     
     if "error" in matches_result:
         return matches_result
     
-    value_bets = []
-    league_matches = matches_result["matches_by_league"].get(league.upper(), [])
+    league = league.upper()
+    league_matches = matches_result["matches_by_league"].get(league, [])
     
-    for match in league_matches:
-        teams = match.get('teams', {})
-        home_name = teams.get('home', {}).get('name', '')
-        away_name = teams.get('away', {}).get('name', '')
-        
-        if not home_name or not away_name:
-            continue
-        
-        try:
-            # Analyze the match
-            analysis = await analyze_match_betting(home_name, away_name, league, date)
-            
-            if "error" not in analysis:
-                predictions = analysis.get('predictions', {})
-                match_winner = predictions.get('match_winner', {})
-                goals = predictions.get('goals', {})
-                
-                confidence = match_winner.get('confidence_percentage', 0)
-                
-                if confidence >= min_confidence:
-                    value_bet = {
-                        "match": f"{home_name} vs {away_name}",
-                        "league": league.upper(),
-                        "date": date,
-                        "recommended_bet": match_winner.get('prediction', 'N/A'),
-                        "confidence": f"{confidence:.1f}%",
-                        "confidence_level": match_winner.get('confidence', 'Medium'),
-                        "goals_prediction": goals.get('prediction', 'N/A'),
-                        "expected_goals": goals.get('expected_goals', 0),
-                        "key_insights": predictions.get('key_insights', []),
-                        "odds": match.get('odds', {}),
-                        "home_form": analysis['team_analysis']['home']['form_rating'],
-                        "away_form": analysis['team_analysis']['away']['form_rating']
-                    }
-                    value_bets.append(value_bet)
-        
-        except Exception as e:
-            continue  # Skip matches that can't be analyzed
+    found = []
+    async for index, value_bet in stream_league_value_bets(league_matches, league, date, min_confidence):
+        found.append((index, value_bet))
+    
+    # Report in fixture order regardless of completion order
+    found.sort(key=lambda item: item[0])
+    value_bets = [value_bet for _, value_bet in found]
     
     return {
-        "league": league.upper(),
+        "league": league,
         "date": date,
         "min_confidence_threshold": min_confidence,
         "total_matches_analyzed": len(league_matches),
@@ -838,6 +1075,88 @@ async def get_league_value_bets(league: str, date: str, min_confidence: float =
         }
     }
 
+MAX_DISCOVERY_DAYS = 14
+
+async def discover_fixtures(dates: List[str], leagues: Dict[str, Dict]) -> AsyncIterator[Dict]:
+    """Query every date x league concurrently and yield unique matches as responses arrive
+    
+    Args:
+        dates: Dates in DD-MM-YYYY format
+        leagues: Subset of TARGET_LEAGUES to search
+    """
+    async def query(date_str: str, league_code: str, league_info: Dict) -> Tuple[str, str, Dict, List[Dict]]:
+        matches_data = await api_call('matches/', {
+            'league_id': league_info['id'],
+            'date': date_str
+        }, silent=True)
+        return date_str, league_code, league_info, extract_matches_from_response(matches_data)
+    
+    # All queries go out at once; the shared rate limiter paces them
+    tasks = [
+        asyncio.ensure_future(query(date_str, league_code, league_info))
+        for date_str in dates
+        for league_code, league_info in leagues.items()
+    ]
+    seen = set()
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            date_str, league_code, league_info, matches = await next_done
+            reference_index.add_match_teams(matches, league_info['id'])
+            for match in matches:
+                key = match_store_key(match)
+                if key in seen:
+                    continue
+                seen.add(key)
+                match['league_code'] = league_code
+                match['league_info'] = league_info
+                match['search_date'] = date_str
+                yield match
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def find_upcoming_fixtures(days_ahead: int = 7, leagues: Optional[List[str]] = None,
+                                 include_today: bool = False) -> Dict[str, Any]:
+    """Find upcoming fixtures across several days and leagues
+    
+    Args:
+        days_ahead: Number of days to search (default 7, max 14)
+        leagues: Optional list of league codes (default: all target leagues)
+        include_today: Start from today instead of tomorrow
+    """
+    days_ahead = max(1, min(int(days_ahead), MAX_DISCOVERY_DAYS))
+    
+    if leagues:
+        requested = [league.upper() for league in leagues]
+        unknown = [league for league in requested if league not in TARGET_LEAGUES]
+        if unknown:
+            return {
+                "error": f"Unknown league(s): {', '.join(unknown)}",
+                "supported_leagues": list(TARGET_LEAGUES.keys())
+            }
+        leagues_to_search = {league: TARGET_LEAGUES[league] for league in requested}
+    else:
+        leagues_to_search = TARGET_LEAGUES
+    
+    start = datetime.now() + timedelta(days=0 if include_today else 1)
+    dates = [(start + timedelta(days=offset)).strftime("%d-%m-%Y") for offset in range(days_ahead)]
+    
+    fixtures_by_date: Dict[str, List[Dict]] = {date_str: [] for date_str in dates}
+    async for match in discover_fixtures(dates, leagues_to_search):
+        fixtures_by_date[match['search_date']].append(match)
+    
+    # Completion order is arbitrary; report each day by league then kickoff
+    for matches in fixtures_by_date.values():
+        matches.sort(key=lambda m: (m['league_code'], m.get('time', '')))
+    
+    return {
+        "dates_searched": dates,
+        "leagues_searched": list(leagues_to_search.keys()),
+        "queries": len(dates) * len(leagues_to_search),
+        "total_fixtures": sum(len(matches) for matches in fixtures_by_date.values()),
+        "fixtures_by_date": {date_str: matches for date_str, matches in fixtures_by_date.items() if matches}
+    }
+
 # MCP Server Implementation
 
 MCP_TOOLS = [
@@ -930,6 +1249,10 @@ MCP_TOOLS = [
                 "team_2_name": {
                     "type": "string",
                     "description": "Second team name"
+                },
+                "league_id": {
+                    "type": "integer",
+                    "description": "Optional league ID; a new meeting this season refreshes the cached H2H"
                 }
             },
             "required": ["team_1_id", "team_2_id", "team_1_name", "team_2_name"]
@@ -960,6 +1283,33 @@ MCP_TOOLS = [
             },
             "required": ["league", "date"]
         }
+    },
+    {
+        "name": "find_upcoming_fixtures",
+        "description": "Find upcoming fixtures across multiple days and leagues (all date x league queries run concurrently).",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "days_ahead": {
+                    "type": "integer",
+                    "description": "Number of days to search (default 7, max 14)",
+                    "minimum": 1,
+                    "maximum": 14,
+                    "default": 7
+                },
+                "leagues": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional league codes to search (default: all supported leagues)"
+                },
+                "include_today": {
+                    "type": "boolean",
+                    "description": "Start from today instead of tomorrow (default false)",
+                    "default": False
+                }
+            },
+            "required": []
+        }
     }
 ]
 
@@ -997,6 +1347,8 @@ async def handle_mcp_request(request: Request) -> Response:
                 result = await get_h2h_betting_analysis(**arguments)
             elif tool_name == "get_league_value_bets":
                 result = await get_league_value_bets(**arguments)
+            elif tool_name == "find_upcoming_fixtures":
+                result = await find_upcoming_fixtures(**arguments)
             else:
                 return JSONResponse({
                     "jsonrpc": "2.0",
@@ -1046,7 +1398,10 @@ async def health_check(request: Request) -> Response:
         "status": "healthy",
         "server": "enhanced-soccer-betting-analyzer-mcp",
         "version": "1.0.0",
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "season_stores": [store.stats() for store in _season_stores.values()],
+        "rate_limiter": soccer_api_limiter.stats(),
+        "h2h_cache": h2h_cache.stats()
     })
 
 # Starlette application
@@ -1062,6 +1417,7 @@ async def startup():
     print("Enhanced Soccer Betting Analyzer MCP Server starting up...")
     print(f"AUTH_TOKEN configured: {'Yes' if AUTH_TOKEN else 'No'}")
     print(f"Target leagues: {list(TARGET_LEAGUES.keys())}")
+    print(f"Reference index: {reference_index.stats()}")
 
 @app.on_event("shutdown") 
 async def shutdown():
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Head-to-Head Result Cache
+
+Persistent cache for SoccerDataAPI head-to-head/ responses, shared by the
+soccer MCP server and the betting analyzer.
+
+Historical H2H between two clubs only changes when they meet again, so
+entries are keyed by the unordered team pair and kept for a long TTL.
+Callers that know the pair's most recent finished meeting (the betting
+analyzer's season store) pass it as `latest_meeting`; an entry cached
+before that meeting is treated as stale and refetched.
+
+Responses are stored in the orientation they were fetched and flipped
+(team1 <-> team2) on read when the caller asks in the other order.
+
+Both servers write the same file: each save takes an exclusive lock on a
+sidecar .lock file, merges in entries other processes wrote since (newest
+cached_at wins) and replaces the file atomically.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: merging still applies, without the cross-process lock
+    fcntl = None
+
+H2H_CACHE_PATH = os.environ.get(
+    "H2H_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'h2h_cache.json')
+)
+H2H_CACHE_TTL_SECONDS = float(os.environ.get("H2H_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+
+def pair_key(team_a: int, team_b: int) -> str:
+    """Order-independent key for a team pair"""
+    low, high = sorted((int(team_a), int(team_b)))
+    return f"{low}-{high}"
+
+
+def _swap_team_label(text: str) -> str:
+    return text.replace('team1', '\0').replace('team2', 'team1').replace('\0', 'team2')
+
+
+def flip_h2h(data: Any) -> Any:
+    """Swap every team1/team2 key so the response reads from the other side"""
+    if isinstance(data, dict):
+        return {_swap_team_label(key): flip_h2h(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [flip_h2h(item) for item in data]
+    return data
+
+
+def h2h_first_team_id(data: Dict) -> Optional[int]:
+    return (data.get('team1') or {}).get('id')
+
+
+class H2HCache:
+    """Pair-keyed, disk-backed H2H cache"""
+
+    def __init__(self, path: str = H2H_CACHE_PATH, ttl: float = H2H_CACHE_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _merge(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Adopt entries that are newer than ours (caller holds self._lock)"""
+        for key, entry in entries.items():
+            mine = self._entries.get(key)
+            if mine is None or entry.get('cached_at', 0) > mine.get('cached_at', 0):
+                self._entries[key] = entry
+
+    def _save(self) -> None:
+        """Blocking; merges with the file on disk so other processes' entries survive"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(f"{self.path}.lock", 'a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)  # released when the file closes
+                on_disk = self._load()
+                with self._lock:
+                    self._merge(on_disk)
+                    snapshot = json.dumps(self._entries)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(snapshot)
+                os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"H2H cache write failed: {e}")
+
+    def get(self, team_1_id: int, team_2_id: int, latest_meeting: Any = None) -> Optional[Dict]:
+        """Cached H2H oriented with team_1_id as team1, or None if missing/stale"""
+        with self._lock:
+            entry = self._entries.get(pair_key(team_1_id, team_2_id))
+            fresh = (
+                entry is not None and
+                time.time() - entry['cached_at'] < self.ttl and
+                (latest_meeting is None or entry.get('latest_meeting') == latest_meeting)
+            )
+            if not fresh:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        data = entry['data']
+        if h2h_first_team_id(data) not in (None, team_1_id):
+            data = flip_h2h(data)
+        return data
+
+    async def put(self, team_1_id: int, team_2_id: int, data: Dict, latest_meeting: Any = None) -> None:
+        with self._lock:
+            self._entries[pair_key(team_1_id, team_2_id)] = {
+                'cached_at': time.time(),
+                'latest_meeting': latest_meeting,
+                'data': data
+            }
+        # File I/O off the event loop
+        await asyncio.to_thread(self._save)
+
+    def stats(self) -> Dict[str, Any]:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+h2h_cache = H2HCache()
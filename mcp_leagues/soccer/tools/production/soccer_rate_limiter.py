@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+SoccerDataAPI Rate Limiter
+
+Shared token-bucket limiter for every SoccerDataAPI caller. Tokens refill at
+SOCCER_API_RATE_PER_SECOND up to SOCCER_API_BURST, so short bursts go out
+immediately while sustained traffic is capped at the provider's rate.
+
+Works from both async code (betting analyzer MCP server) and blocking
+scripts (unified_h2h_intelligence.py). A 429 response drains the bucket for
+the Retry-After period so every concurrent caller backs off together.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Mapping
+
+# SoccerDataAPI limits depend on the plan, so both knobs are configurable
+SOCCER_API_RATE_PER_SECOND = float(os.environ.get("SOCCER_API_RATE_PER_SECOND", "3"))
+SOCCER_API_BURST = float(os.environ.get("SOCCER_API_BURST", "6"))
+
+MAX_RATE_LIMIT_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 1.0
+
+# Relative cost of each endpoint in tokens (anything unlisted costs 1)
+ENDPOINT_WEIGHTS: Dict[str, float] = {
+    'matches/': 1,
+    'head-to-head/': 1,
+    'livescores/': 1,
+    'league/': 1,
+    'standing/': 1,
+}
+
+# Full-season downloads are the heaviest responses the API serves
+SEASON_DOWNLOAD_WEIGHT = 3
+
+
+class TokenBucketLimiter:
+    """Reservation-based token bucket
+
+    Each acquire takes its tokens immediately (the balance may go negative)
+    and sleeps until the balance it borrowed against has refilled. Callers are
+    therefore served in arrival order without polling.
+    """
+
+    def __init__(self, rate_per_second: float, burst: float):
+        self.rate = rate_per_second
+        self.capacity = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, weight: float = 1) -> float:
+        """Take weight tokens and return how long the caller must wait"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= weight
+            self.requests += 1
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self, weight: float = 1) -> None:
+        wait = self.reserve(weight)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, weight: float = 1) -> None:
+        wait = self.reserve(weight)
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """Block new requests for at least `seconds` after a 429"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+            self.throttled += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'rate_per_second': self.rate,
+                'burst': self.capacity,
+                'available_tokens': round(self._tokens, 2),
+                'requests': self.requests,
+                'throttled': self.throttled
+            }
+
+
+def endpoint_weight(endpoint: str, params: Mapping) -> float:
+    """Token cost of a request"""
+    if endpoint == 'matches/' and 'season' in params and 'date' not in params:
+        return SEASON_DOWNLOAD_WEIGHT
+    return ENDPOINT_WEIGHTS.get(endpoint, 1)
+
+
+def retry_after_seconds(headers: Mapping, attempt: int) -> float:
+    """Backoff for a 429: honour Retry-After, else exponential from DEFAULT_BACKOFF_SECONDS"""
+    retry_after = headers.get('Retry-After') or headers.get('retry-after')
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+    return DEFAULT_BACKOFF_SECONDS * (2 ** attempt)
+
+
+# Shared instance: all SoccerDataAPI calls in a process draw from one bucket
+soccer_api_limiter = TokenBucketLimiter(SOCCER_API_RATE_PER_SECOND, SOCCER_API_BURST)
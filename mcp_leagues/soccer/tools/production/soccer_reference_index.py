@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Soccer Reference Data Index
+
+In-memory lookup of team and league ids built from the collected reference
+data (reference_data/latest_reference_data.json and latest_key_ids.json).
+
+Names are normalized (case, accents, punctuation, club suffixes like "FC")
+and indexed three ways:
+- exact normalized name / alias -> O(1) dict lookup
+- trigram postings -> partial names resolve by scanning only candidate teams
+- league-scoped, so "Real" in La Liga does not match a Bundesliga club
+
+Teams seen at runtime (e.g. in matches/ responses) can be added with
+add_team(), so leagues missing from the reference files fill in as they are used.
+"""
+
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+REFERENCE_DATA_DIR = os.environ.get(
+    "SOCCER_REFERENCE_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'reference_data')
+)
+
+# Tokens that carry no identity ("AFC Bournemouth" == "Bournemouth")
+FILLER_TOKENS = frozenset(('fc', 'afc', 'cf', 'sc', 'ac', 'cd', 'ssc', 'club', 'de', 'the'))
+
+# Common short names that share no substring with the API's team name
+TEAM_ALIASES = {
+    'man city': 'manchester city',
+    'man utd': 'manchester united',
+    'man united': 'manchester united',
+    'spurs': 'tottenham hotspur',
+    'wolves': 'wolverhampton wanderers',
+    'brighton': 'brighton hove albion',
+    'forest': 'nottingham forest',
+    'paris saint germain': 'psg',
+    'paris sg': 'psg',
+    'inter': 'inter milan',
+    'internazionale': 'inter milan',
+    'bayern': 'bayern munich',
+    'bayern munchen': 'bayern munich',
+    'dortmund': 'borussia dortmund',
+    'bvb': 'borussia dortmund',
+    'gladbach': 'borussia mgladbach',
+    'leverkusen': 'bayer leverkusen',
+    'barca': 'barcelona',
+    'atletico': 'atletico madrid',
+    'athletic club': 'athletic bilbao',
+}
+
+MIN_TRIGRAM_SCORE = 0.5
+
+
+class TeamRef(NamedTuple):
+    team_id: int
+    name: str
+    league_id: Optional[int]
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation, drop filler tokens"""
+    text = unicodedata.normalize('NFKD', name or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = text.replace("'", '')
+    tokens = re.findall(r'[a-z0-9]+', text)
+    kept = [token for token in tokens if token not in FILLER_TOKENS]
+    return ' '.join(kept or tokens)
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ReferenceIndex:
+    """Name -> id index for soccer teams and leagues"""
+
+    def __init__(self):
+        self.teams: Dict[int, TeamRef] = {}
+        self.leagues: Dict[str, int] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._names: Dict[int, Set[str]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+
+    # Building
+
+    def add_league(self, name: str, league_id: int) -> None:
+        self.leagues[normalize_name(name)] = league_id
+
+    def add_team(self, team_id: Optional[int], name: str, league_id: Optional[int] = None) -> None:
+        """Register a team (idempotent; later calls can fill in a missing league)"""
+        if not team_id or not name:
+            return
+        existing = self.teams.get(team_id)
+        if existing and (existing.league_id or not league_id):
+            return
+        self.teams[team_id] = TeamRef(team_id, name, league_id)
+
+        key = normalize_name(name)
+        if team_id not in self._by_name.setdefault(key, []):
+            self._by_name[key].append(team_id)
+        self._names.setdefault(team_id, set()).add(key)
+        for gram in trigrams(key):
+            self._postings.setdefault(gram, set()).add(team_id)
+
+    def add_match_teams(self, matches: Iterable[Dict], league_id: Optional[int] = None) -> None:
+        """Learn team ids from matches/ results"""
+        for match in matches:
+            teams = match.get('teams', {})
+            for side in ('home', 'away'):
+                team = teams.get(side, {})
+                self.add_team(team.get('id'), team.get('name', ''), league_id)
+
+    # Lookup
+
+    def resolve_league(self, name: str) -> Optional[int]:
+        return self.leagues.get(normalize_name(name))
+
+    def resolve_team(self, name: str, league_id: Optional[int] = None) -> Optional[TeamRef]:
+        """Resolve a (possibly partial or aliased) team name to a TeamRef"""
+        key = normalize_name(name)
+        if not key:
+            return None
+        key = TEAM_ALIASES.get(key, key)
+
+        exact = self._filter_league(self._by_name.get(key, []), league_id)
+        if exact:
+            return self.teams[exact[0]]
+
+        return self._resolve_partial(key, league_id)
+
+    def _filter_league(self, team_ids: Iterable[int], league_id: Optional[int]) -> List[int]:
+        if league_id is None:
+            return list(team_ids)
+        return [team_id for team_id in team_ids if self.teams[team_id].league_id in (league_id, None)]
+
+    def _resolve_partial(self, key: str, league_id: Optional[int]) -> Optional[TeamRef]:
+        query_grams = trigrams(key)
+        overlap: Dict[int, int] = {}
+        for gram in query_grams:
+            for team_id in self._postings.get(gram, ()):
+                overlap[team_id] = overlap.get(team_id, 0) + 1
+
+        best_id = None
+        best_score = 0.0
+        for team_id in self._filter_league(overlap, league_id):
+            for team_key in self._names[team_id]:
+                if key in team_key:
+                    # Substring hits win; shorter names are the tighter match
+                    score = 1.0 + len(key) / len(team_key)
+                else:
+                    score = overlap[team_id] / len(query_grams | trigrams(team_key))
+                if score > best_score:
+                    best_id, best_score = team_id, score
+
+        if best_id is None or best_score < MIN_TRIGRAM_SCORE:
+            return None
+        return self.teams[best_id]
+
+    def stats(self) -> Dict[str, int]:
+        return {'teams': len(self.teams), 'leagues': len(self.leagues)}
+
+
+def load_reference_index(data_dir: str = REFERENCE_DATA_DIR) -> ReferenceIndex:
+    """Build the index from the reference data files (missing files are skipped)"""
+    index = ReferenceIndex()
+
+    key_ids_path = os.path.join(data_dir, 'latest_key_ids.json')
+    if os.path.exists(key_ids_path):
+        with open(key_ids_path, 'r', encoding='utf-8') as f:
+            key_ids = json.load(f)
+        for league_name, league_id in key_ids.get('leagues', {}).items():
+            index.add_league(league_name, league_id)
+        for league in key_ids.get('teams', {}).values():
+            for team_id, team_name in league.get('teams', []):
+                index.add_team(team_id, team_name, league.get('league_id'))
+
+    reference_path = os.path.join(data_dir, 'latest_reference_data.json')
+    if os.path.exists(reference_path):
+        with open(reference_path, 'r', encoding='utf-8') as f:
+            reference = json.load(f)
+        for league in reference.get('all_leagues', {}).get('data', []):
+            index.add_league(league.get('name', ''), league.get('id'))
+        for league in reference.get('major_leagues_with_teams', {}).values():
+            league_id = league.get('league_info', {}).get('league_id')
+            for team in league.get('teams', []):
+                index.add_team(team.get('team_id'), team.get('team_name', ''), league_id)
+
+    return index
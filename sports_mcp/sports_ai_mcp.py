@@ -2,6 +2,8 @@ import asyncio
 import json
 import os
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple, List
 
@@ -24,6 +26,20 @@ ODDS_API_BASE_URL = "https://api.the-odds-api.com/v4"
 
 ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
 
+# ESPN response cache TTLs (seconds) by route; final game summaries never expire
+ESPN_TEAMS_TTL = float(os.getenv("ESPN_TEAMS_TTL", "86400"))
+ESPN_ROSTER_TTL = float(os.getenv("ESPN_ROSTER_TTL", "21600"))
+ESPN_SCOREBOARD_TTL = float(os.getenv("ESPN_SCOREBOARD_TTL", "60"))
+ESPN_SCOREBOARD_LIVE_TTL = float(os.getenv("ESPN_SCOREBOARD_LIVE_TTL", "5"))
+ESPN_SUMMARY_TTL = float(os.getenv("ESPN_SUMMARY_TTL", "60"))
+ESPN_SUMMARY_LIVE_TTL = float(os.getenv("ESPN_SUMMARY_LIVE_TTL", "10"))
+ESPN_CACHE_MAX_ENTRIES = int(os.getenv("ESPN_CACHE_MAX_ENTRIES", "2000"))
+
+# probeAllLeagues: leagues probed at once, per-league time limit, result cache TTL
+PROBE_CONCURRENCY = int(os.getenv("PROBE_CONCURRENCY", "4"))
+PROBE_TIMEOUT_SECONDS = float(os.getenv("PROBE_TIMEOUT_SECONDS", "10"))
+PROBE_CACHE_TTL = float(os.getenv("PROBE_CACHE_TTL", "60"))
+
 # Supported leagues (expand as needed)
 ALLOWED_ROUTES: Dict[Tuple[str, str], Dict[str, str]] = {
     ("baseball", "mlb"): {
@@ -114,7 +130,58 @@ def resolve_route(sport: str, league: str, endpoint: str) -> str:
     except KeyError:
         raise ValueError(f"Unsupported route: {sport}/{league}/{endpoint}")
 
-async def espn_get(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+# =========================== ESPN cache ===========================
+# key -> (expires_at, response); least recently used entries are evicted first
+_espn_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+# key -> in-flight fetch shared by concurrent callers (single-flight)
+_espn_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+def espn_cache_key(path: str, params: Optional[Dict[str, Any]]) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    return f"{path}?{query}"
+
+def espn_game_state(data: Dict[str, Any]) -> Optional[str]:
+    competitions = (data.get("header") or {}).get("competitions") or data.get("competitions") or []
+    game = competitions[0] if competitions else {}
+    return (game.get("status") or {}).get("type", {}).get("state")
+
+def espn_cache_ttl(path: str, data: Dict[str, Any]) -> float:
+    """Seconds a successful response for path stays valid (inf = forever)"""
+    if path.endswith("/roster"):
+        return ESPN_ROSTER_TTL
+    if path.endswith("/teams"):
+        return ESPN_TEAMS_TTL
+    if path.endswith("/summary"):
+        state = espn_game_state(data)
+        if state == "post":
+            return float("inf")
+        return ESPN_SUMMARY_LIVE_TTL if state == "in" else ESPN_SUMMARY_TTL
+    if path.endswith("/scoreboard"):
+        states = [
+            ((ev.get("competitions") or [{}])[0].get("status") or {}).get("type", {}).get("state")
+            for ev in data.get("events") or []
+        ]
+        return ESPN_SCOREBOARD_LIVE_TTL if "in" in states else ESPN_SCOREBOARD_TTL
+    return ESPN_SCOREBOARD_LIVE_TTL
+
+def espn_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    entry = _espn_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, resp = entry
+    if time.monotonic() >= expires_at:
+        del _espn_cache[key]
+        return None
+    _espn_cache.move_to_end(key)
+    return resp
+
+def espn_cache_put(key: str, resp: Dict[str, Any], ttl: float) -> None:
+    _espn_cache[key] = (time.monotonic() + ttl, resp)
+    _espn_cache.move_to_end(key)
+    while len(_espn_cache) > ESPN_CACHE_MAX_ENTRIES:
+        _espn_cache.popitem(last=False)
+
+async def espn_fetch(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     url = f"{ESPN_BASE_URL}{path}"
     client = await get_http_client()
     try:
@@ -132,6 +199,27 @@ async def espn_get(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[s
     except httpx.RequestError as e:
         return {"ok": False, "error_type": "request_error", "source": "ESPN", "url": url, "message": str(e)}
 
+async def espn_get(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Cached ESPN GET; concurrent requests for the same path/params share one fetch. Errors are not cached."""
+    key = espn_cache_key(path, params)
+    cached = espn_cache_get(key)
+    if cached is not None:
+        return cached
+
+    future = _espn_inflight.get(key)
+    if future is None:
+        async def fetch_and_store() -> Dict[str, Any]:
+            resp = await espn_fetch(path, params)
+            if resp.get("ok"):
+                espn_cache_put(key, resp, espn_cache_ttl(path, resp["data"]))
+            return resp
+
+        future = asyncio.ensure_future(fetch_and_store())
+        _espn_inflight[key] = future
+        future.add_done_callback(lambda _: _espn_inflight.pop(key, None))
+    # Shielded so one caller being cancelled does not cancel the fetch for the others
+    return await asyncio.shield(future)
+
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -179,7 +267,7 @@ def summarize_events(scoreboard: Dict[str, Any]) -> Dict[str, Any]:
     return {"events": out, "newest_event_time": newest}
 
 def extract_summary_core(summary_json: Dict[str, Any]) -> Dict[str, Any]:
-    competitions = summary_json.get("competitions") or []
+    competitions = (summary_json.get("header") or {}).get("competitions") or summary_json.get("competitions") or []
     game = competitions[0] if competitions else {}
     status = (game.get("status") or {}).get("type", {}).get("state")
     boxscore = summary_json.get("boxscore")
@@ -201,6 +289,139 @@ def extract_summary_core(summary_json: Dict[str, Any]) -> Dict[str, Any]:
         "boxscore": boxscore,
     }
 
+# =========================== Payload pruning ===========================
+# Base relevance of each section kind before matching against the question
+SECTION_WEIGHTS = {"team_stats": 3.0, "leaders": 2.0, "players": 1.0}
+QUESTION_MATCH_WEIGHT = 2.0
+WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "did", "do", "does", "for", "from", "game", "had", "has", "have", "how",
+    "in", "is", "it", "many", "much", "of", "on", "or", "the", "their", "to", "was", "were", "what",
+    "which", "who", "with",
+})
+
+def compact_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+def json_size(value: Any) -> int:
+    return len(compact_json(value).encode("utf-8"))
+
+def compact_team_stats(boxscore: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Team abbrev -> {stat label: display value}; grouped stats (e.g. baseball) become "group.label" """
+    out: Dict[str, Dict[str, Any]] = {}
+    for t in boxscore.get("teams") or []:
+        team = t.get("team") or {}
+        stats: Dict[str, Any] = {}
+        for s in t.get("statistics") or []:
+            if "stats" in s:
+                for sub in s.get("stats") or []:
+                    label = sub.get("abbreviation") or sub.get("label") or sub.get("name")
+                    if label and sub.get("displayValue") is not None:
+                        stats[f"{s.get('name')}.{label}"] = sub["displayValue"]
+            else:
+                label = s.get("label") or s.get("name")
+                if label and s.get("displayValue") is not None:
+                    stats[label] = s["displayValue"]
+        if stats:
+            out[team.get("abbreviation") or team.get("displayName") or str(len(out))] = stats
+    return out
+
+def compact_player_tables(boxscore: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """"TEAM group" -> {"columns": [...], "rows": [[player, *stats]], "totals": [...]}"""
+    tables: Dict[str, Dict[str, Any]] = {}
+    for t in boxscore.get("players") or []:
+        team = (t.get("team") or {}).get("abbreviation") or ""
+        for group in t.get("statistics") or []:
+            rows = [
+                [(a.get("athlete") or {}).get("displayName"), *a["stats"]]
+                for a in group.get("athletes") or [] if a.get("stats")
+            ]
+            if not rows:
+                continue
+            table: Dict[str, Any] = {"columns": ["player", *(group.get("labels") or group.get("keys") or [])], "rows": rows}
+            if group.get("totals"):
+                table["totals"] = group["totals"]
+            name = group.get("name") or group.get("type") or "players"
+            tables[f"{team} {name}".strip()] = table
+    return tables
+
+def compact_leaders(leaders: Any) -> Dict[str, Any]:
+    rows = []
+    for t in leaders or []:
+        team = (t.get("team") or {}).get("abbreviation")
+        for category in t.get("leaders") or []:
+            for leader in category.get("leaders") or []:
+                rows.append([
+                    team,
+                    category.get("displayName") or category.get("name"),
+                    (leader.get("athlete") or {}).get("displayName"),
+                    leader.get("displayValue"),
+                ])
+    return {"columns": ["team", "category", "player", "value"], "rows": rows} if rows else {}
+
+def question_terms(question: str) -> set:
+    return {w for w in WORD_RE.findall(question.lower()) if w not in STOPWORDS}
+
+def fit_rows(table: Dict[str, Any], budget: int) -> Optional[Dict[str, Any]]:
+    """Leading rows of table that fit in budget bytes (starters come first in ESPN order), or None"""
+    trimmed = dict(table, rows=[], rows_omitted=len(table["rows"]))
+    size = json_size(trimmed)
+    for row in table["rows"]:
+        row_size = json_size(row) + 1
+        if size + row_size > budget:
+            break
+        trimmed["rows"].append(row)
+        trimmed["rows_omitted"] -= 1
+        size += row_size
+    return trimmed if trimmed["rows"] else None
+
+def prune_summary_for_question(summary: Dict[str, Any], question: str, budget: int = MAX_INPUT_BYTES) -> Dict[str, Any]:
+    """
+    Compact the summary and keep the sections most relevant to question within budget bytes.
+
+    The boxscore becomes per-team stat maps and per-group player tables, leaders a single
+    table. Sections are ranked by kind plus overlap with the question's words and added
+    until the budget is spent; tables that do not fit whole keep their leading rows.
+    Skipped sections are listed under "omitted_sections" so the model can say they are
+    unavailable. The result serializes to valid JSON, unlike a byte cut.
+    """
+    boxscore = summary.get("boxscore") or {}
+    candidates: List[Tuple[str, str, Any]] = [("team_stats", "team_stats", compact_team_stats(boxscore))]
+    candidates.append(("leaders", "leaders", compact_leaders(summary.get("leaders"))))
+    candidates.extend(("players", name, table) for name, table in compact_player_tables(boxscore).items())
+
+    terms = question_terms(question)
+    ranked = []
+    for order, (kind, name, value) in enumerate(candidates):
+        if not value:
+            continue
+        words = set(WORD_RE.findall(f"{name} {compact_json(value)}".lower()))
+        score = SECTION_WEIGHTS[kind] + QUESTION_MATCH_WEIGHT * len(terms & words)
+        ranked.append((-score, order, name, value))
+    ranked.sort(key=lambda r: (r[0], r[1]))
+
+    pruned: Dict[str, Any] = {
+        "status": summary.get("status"),
+        "teams": [{k: v for k, v in t.items() if v is not None} for t in summary.get("teams_meta") or []],
+        "sections": {},
+        "omitted_sections": [],
+    }
+    # {"summary": ...} wrapper added by analyze_game_strict, plus room for the omitted names
+    remaining = budget - json_size({"summary": pruned}) - sum(len(r[2]) + 3 for r in ranked)
+    for _, _, name, value in ranked:
+        size = json_size(value) + len(name) + 4
+        if size <= remaining:
+            pruned["sections"][name] = value
+            remaining -= size
+            continue
+        trimmed = fit_rows(value, remaining - len(name) - 4) if "rows" in value else None
+        if trimmed is not None:
+            pruned["sections"][name] = trimmed
+            remaining -= json_size(trimmed) + len(name) + 4
+        else:
+            pruned["omitted_sections"].append(name)
+    return pruned
+
 # =========================== OpenRouter ===========================
 def truncate_utf8(s: str, limit: int = MAX_INPUT_BYTES) -> str:
     b = s.encode("utf-8")
@@ -223,7 +444,7 @@ async def ask_openrouter(payload: Dict[str, Any], prompt: str) -> Tuple[bool, st
                 "Only summarize numeric/text fields present in the provided JSON. "
                 "If a stat is missing, say 'unavailable'. Never infer or fabricate."
             )},
-            {"role": "user", "content": truncate_utf8(json.dumps(payload, ensure_ascii=False))},
+            {"role": "user", "content": truncate_utf8(compact_json(payload))},
             {"role": "user", "content": prompt},
         ],
         "max_tokens": MAX_OUTPUT_TOKENS,
@@ -441,27 +662,119 @@ async def probe_league_support(sport: str, league: str, date: Optional[str] = No
         return ok_envelope(md, {"capability": capability, "summary_error": gs}, {"league": league, "sport": sport})
     capability["summary"] = True
 
-    box = ((gs.get("data") or {}).get("summary") or {}).get("boxscore") or {}
-    has_players = False
-    if isinstance(box.get("players"), list) and box["players"]:
-        has_players = True
-    if isinstance(box.get("teams"), list) and box["teams"]:
-        for t in box["teams"]:
-            if t.get("statistics") or t.get("players"):
-                has_players = True
-                break
+    has_players = has_player_stats(gs)
     capability["game_player_stats"] = has_players
 
     md = f"## Probe {sport}/{league} {date}\n\nScoreboard ✅  Summary {'✅' if capability['summary'] else '❌'}  PlayerStats {'✅' if has_players else '❌'}"
     return ok_envelope(md, {"capability": capability}, {"league": league, "sport": sport, "event_id": event_id})
 
+def has_player_stats(game_summary: Dict[str, Any]) -> bool:
+    box = ((game_summary.get("data") or {}).get("summary") or {}).get("boxscore") or {}
+    if isinstance(box.get("players"), list) and box["players"]:
+        return True
+    if isinstance(box.get("teams"), list):
+        return any(t.get("statistics") or t.get("players") for t in box["teams"])
+    return False
+
+# date -> (expires_at, coverage rows)
+_probe_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+async def probe_route(sport: str, league: str, date: str) -> Dict[str, Any]:
+    """Coverage row for one league: scoreboard events, team count, summary availability, data age"""
+    row: Dict[str, Any] = {
+        "sport": sport,
+        "league": league,
+        "scoreboard": False,
+        "events": 0,
+        "teams": None,
+        "summary": None,
+        "game_player_stats": None,
+        "checked_event_id": None,
+        "newest_event_time": None,
+        "data_age_seconds": None,
+        "error": None,
+    }
+    sb, teams = await asyncio.gather(
+        get_scoreboard(sport=sport, league=league, dates=date),
+        get_teams(sport=sport, league=league),
+    )
+    if teams.get("ok"):
+        row["teams"] = len(teams["data"]["teams"])
+    if not sb.get("ok"):
+        row["error"] = sb.get("message") or sb.get("error_type") or "scoreboard failed"
+        return row
+
+    scoreboard = sb["data"].get("scoreboard") or {}
+    events = scoreboard.get("events") or []
+    row.update({
+        "scoreboard": True,
+        "events": len(events),
+        "newest_event_time": scoreboard.get("newest_event_time"),
+        "data_age_seconds": compute_data_age_seconds(scoreboard.get("newest_event_time")),
+    })
+    if not events:
+        return row
+
+    event_id = events[0].get("event_id")
+    row["checked_event_id"] = event_id
+    gs = await get_game_summary(sport=sport, league=league, event_id=event_id)
+    row["summary"] = bool(gs.get("ok"))
+    row["game_player_stats"] = has_player_stats(gs) if gs.get("ok") else False
+    return row
+
+async def probe_route_bounded(semaphore: asyncio.Semaphore, sport: str, league: str, date: str) -> Dict[str, Any]:
+    async with semaphore:
+        started = time.monotonic()
+        try:
+            row = await asyncio.wait_for(probe_route(sport, league, date), timeout=PROBE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            row = {"sport": sport, "league": league, "scoreboard": False, "error": f"timed out after {PROBE_TIMEOUT_SECONDS:g}s"}
+        except Exception as e:
+            row = {"sport": sport, "league": league, "scoreboard": False, "error": str(e)}
+        row["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+        return row
+
+@server.tool(name="probeAllLeagues", description="Probe every supported league concurrently for a date and return a coverage matrix. Params: date(YYYYMMDD)?, refresh?")
+async def probe_all_leagues(date: Optional[str] = None, refresh: bool = False) -> Dict[str, Any]:
+    date = date or datetime.utcnow().strftime("%Y%m%d")
+    if not re.fullmatch(r"\d{8}", date):
+        return err("date must be YYYYMMDD", error_type="validation_error")
+
+    cached = _probe_cache.get(date)
+    if cached is not None and not refresh and time.monotonic() < cached[0]:
+        rows, from_cache = cached[1], True
+    else:
+        semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+        rows = list(await asyncio.gather(*(
+            probe_route_bounded(semaphore, sport, league, date) for sport, league in ALLOWED_ROUTES
+        )))
+        _probe_cache[date] = (time.monotonic() + PROBE_CACHE_TTL, rows)
+        from_cache = False
+
+    def mark(value: Any) -> str:
+        return "—" if value is None else ("✅" if value else "❌")
+
+    lines = [
+        f"## League Coverage {date}",
+        "",
+        "| League | Scoreboard | Events | Teams | Summary | PlayerStats | Data age (s) |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for row in rows:
+        lines.append(
+            f"| {row['sport']}/{row['league']} | {mark(row.get('scoreboard'))} | {row.get('events', 0)} | "
+            f"{row.get('teams') if row.get('teams') is not None else '—'} | {mark(row.get('summary'))} | "
+            f"{mark(row.get('game_player_stats'))} | {row.get('data_age_seconds') if row.get('data_age_seconds') is not None else '—'} |"
+        )
+    return ok_envelope("\n".join(lines), {"coverage": rows}, {"date": date, "cached": from_cache})
+
 # -------- Strict analysis (no inference) --------
 @server.tool(name="analyzeGameStrict", description="Summarize a game using only fetched stats. Params: sport, league, event_id, question")
 async def analyze_game_strict(sport: str, league: str, event_id: str, question: str) -> Dict[str, Any]:
     gs = await get_game_summary(sport=sport, league=league, event_id=event_id)
     if not gs.get("ok"):
         return gs
-    payload = {"summary": gs["data"]["summary"]}
+    payload = {"summary": prune_summary_for_question(gs["data"]["summary"], question)}
     ok, content = await ask_openrouter(payload, f"Answer strictly from the JSON. Question: {question}")
     md = content if ok else f"OpenRouter error: {content}"
     return ok_envelope(md, payload, {"league": league, "sport": sport, "event_id": event_id})